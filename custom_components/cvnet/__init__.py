@@ -4,11 +4,13 @@ from __future__ import annotations
 import logging
 from typing import Optional
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.const import CONF_USERNAME, CONF_PASSWORD
+from homeassistant.core import Event, HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.const import CONF_USERNAME, CONF_PASSWORD, EVENT_HOMEASSISTANT_CLOSE
 from homeassistant.components.persistent_notification import async_create as pn_async_create
 
-from .const import DOMAIN
+from .const import DOMAIN, CAR_SEARCH_MAX_RESULTS
+from .core.car_search import DIRECTIONS, normalize_time
 from .core.coordinator import CvnetCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -21,10 +23,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coord = CvnetCoordinator(hass, entry)
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coord
 
-    try:
-        await coord.async_config_entry_first_refresh()
-    except Exception as e:
-        _LOGGER.debug("cvnet: first refresh failed (non-fatal): %s", e)
+    # The hub logs in first; the device and telemeter sources reuse its session
+    for source in coord.sources:
+        try:
+            await source.async_config_entry_first_refresh()
+        except Exception as e:
+            _LOGGER.debug("cvnet: first refresh of %s failed (non-fatal): %s", source.name, e)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -32,6 +36,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry.add_update_listener(_async_update_options)
     )
 
+    # The client owns its connection pool and entries are not unloaded at
+    # shutdown, so close it explicitly to avoid unclosed session warnings
+    async def _async_close_client(event: Event) -> None:
+        await coord.client.async_close()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_client)
+    )
+
     await _async_setup_services(hass)
 
     return True
@@ -42,7 +55,8 @@ async def _async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None
     coord: CvnetCoordinator = hass.data[DOMAIN].get(entry.entry_id)
     if coord:
         coord.apply_options(dict(entry.options))
-        await coord.async_request_refresh()
+        await coord.image_store.async_prune()
+        await coord.async_request_refresh_all()
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -80,7 +94,7 @@ async def _async_setup_services(hass: HomeAssistant) -> None:
         if not coord:
             return
         _LOGGER.info("Forcing CVNET data refresh")
-        await coord.async_request_refresh()
+        await coord.async_request_refresh_all()
 
     async def clear_session(call: ServiceCall):
         coord = _resolve_coordinator(hass, call)
@@ -88,7 +102,7 @@ async def _async_setup_services(hass: HomeAssistant) -> None:
             return
         _LOGGER.info("Clearing CVNET session")
         coord.client.invalidate_session()
-        await coord.async_request_refresh()
+        await coord.async_request_refresh_all()
 
     async def session_info(call: ServiceCall):
         coord = _resolve_coordinator(hass, call)
@@ -103,6 +117,29 @@ async def _async_setup_services(hass: HomeAssistant) -> None:
             notification_id="cvnet_session_info",
         )
 
+    async def search_car_entries(call: ServiceCall) -> ServiceResponse:
+        coord = _resolve_coordinator(hass, call)
+        if not coord:
+            raise HomeAssistantError("CVNET coordinator not found")
+        direction = call.data.get("direction") or None
+        if direction is not None and direction not in DIRECTIONS:
+            raise HomeAssistantError(f"Unknown direction {direction!r}; use one of {', '.join(DIRECTIONS)}")
+        try:
+            limit = max(1, min(int(call.data.get("limit", 20)), CAR_SEARCH_MAX_RESULTS))
+        except (TypeError, ValueError) as err:
+            raise HomeAssistantError(f"Invalid limit: {err}") from err
+        return await coord.car_search.async_search(
+            plate=call.data.get("plate") or None,
+            exact=call.data.get("match") == "exact",
+            direction=direction,
+            start=normalize_time(call.data.get("start")),
+            end=normalize_time(call.data.get("end"), end=True),
+            limit=limit,
+        )
+
     hass.services.async_register(DOMAIN, "force_refresh", force_refresh)
     hass.services.async_register(DOMAIN, "clear_session", clear_session)
     hass.services.async_register(DOMAIN, "session_info", session_info)
+    hass.services.async_register(
+        DOMAIN, "search_car_entries", search_car_entries, supports_response=SupportsResponse.ONLY
+    )
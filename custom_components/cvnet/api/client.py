@@ -1,19 +1,22 @@
 from __future__ import annotations
-import json
-import base64
+import binascii
 import logging
 import asyncio
 import time
-from typing import Any, Dict, Optional
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import aiohttp
 from aiohttp import ClientError, ServerDisconnectedError, WSMsgType
 import secrets
 import random
+import statistics
 
 from ..const import (
     BASE,
     DEFAULT_TIMEOUT_S,
     IMAGE_TIMEOUT_S,
+    IMAGE_CACHE_MAX_BYTES,
+    IMAGE_MAX_BYTES,
     DEFAULT_WS_BASE,
     VISITOR_LIST_PATH,
     VISITOR_CONTENT_PATH,
@@ -23,11 +26,14 @@ from ..const import (
     TELEMETERING_LIST_PATH,
     TELEMETERING_REFERER,
     SESSION_TIMEOUT_HOURS,
+    STATUS_BUDGET_S,
     ajax_headers,
     common_headers,
     ws_headers,
     UA,
 )
+from . import codec
+from .cache import ByteLRUCache
 
 DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT_S)
 IMAGE_TIMEOUT = aiohttp.ClientTimeout(total=IMAGE_TIMEOUT_S)
@@ -37,9 +43,116 @@ WS_BACKOFF_BASE = 1.0       # seconds
 WS_BACKOFF_MAX = 30.0       # seconds cap
 WS_BACKOFF_FACTOR = 2.0     # exponential factor
 WS_MAX_RETRIES = 4          # retry attempts for publish/status_snapshot
+WS_STATUS_TIMEOUT = 12.0    # seconds to wait for a status reply on one attempt
+WS_ACK_TIMEOUT = 1.0        # seconds to wait for a frame after a publish
+WS_STALE_AFTER = 60.0       # seconds without any frame (SockJS sends "h" every 25s) before the socket counts as dead
+
+PRIME_TTL = 600.0           # seconds a primed page stays valid within one login session
+READ_CHUNK_SIZE = 64 * 1024  # bytes per read of a size-limited response body
+LATENCY_SAMPLES = 50        # recent command latencies kept per delivery path
+COMMAND_COALESCE_WINDOW = 0.3  # seconds queued commands wait for newer ones before sending
+
+# Session keep-alive
+KEEPALIVE_MARGIN = 0.8          # refresh once this fraction of the session lifetime has passed
+KEEPALIVE_RETRY = 60.0          # seconds before retrying a failed keep-alive login
+MIN_SESSION_LIFETIME = 300.0    # seconds; shorter observed lifetimes are treated as noise
+SESSION_LIFETIME_FLOOR = 1200.0  # seconds; the estimate never drops below this
+SESSION_LIFETIME_SAMPLES = 5    # observed lifetimes kept to estimate the server's limit
+SESSION_LIFETIME_SAMPLE_TTL = 6 * 3600.0  # seconds a sample counts; keep-alive hides newer 401s
+
+# Dedicated connection pool for the CVNET host (HTTPS on 443, WebSocket on 9099)
+POOL_LIMIT_PER_HOST = 4         # concurrent connections per host:port
+POOL_KEEPALIVE = 75.0           # seconds an idle connection is kept; outlives a refresh interval
+DNS_CACHE_TTL = 3600            # seconds a resolved address is reused
 
 _LOGGER = logging.getLogger(__name__)
 
+def _snippet(raw: bytes, limit: int = 160) -> str:
+    return bytes(raw[:limit]).decode("utf-8", "replace")
+
+
+def _skip_ws(raw: bytes, pos: int) -> int:
+    while pos < len(raw) and raw[pos] in b" \t\r\n":
+        pos += 1
+    return pos
+
+
+def _image_b64_view(raw: bytes) -> Optional[memoryview]:
+    """Locate the base64 payload of ``"image"`` in a raw JSON body without parsing it.
+
+    Returns a view over ``raw`` with any ``data:...;base64,`` prefix removed, or
+    None if there is no image. Strings with JSON escapes fall back to the full parser.
+    Raises ValueError on malformed JSON.
+    """
+    n = len(raw)
+    key = raw.find(b'"image"')
+    while key >= 0:
+        pos = _skip_ws(raw, key + len(b'"image"'))
+        if pos < n and raw[pos] == 0x3A:  # ':' - this occurrence is the key
+            break
+        key = raw.find(b'"image"', key + 1)
+    if key < 0:
+        return None
+    pos = _skip_ws(raw, pos + 1)
+    if pos >= n or raw[pos] != 0x22:  # not a string value
+        return None
+    start = pos + 1
+    end = raw.find(b'"', start)
+    if end < 0:
+        raise ValueError("unterminated image string")
+    if raw.find(b"\\", start, end) >= 0:
+        data = codec.loads(raw)
+        value = data.get("image") if isinstance(data, dict) else None
+        if not value:
+            return None
+        raw = value.encode("ascii")
+        start, end = 0, len(raw)
+    if raw.startswith(b"data:", start):
+        comma = raw.find(b",", start, end)
+        if comma >= 0:
+            start = comma + 1
+    if start >= end:
+        return None
+    return memoryview(raw)[start:end]
+
+
+def create_session(ssl_context: Optional[Any] = None, stats: Optional[Dict[str, Any]] = None) -> aiohttp.ClientSession:
+    """Create a session with its own connector tuned for the CVNET host.
+
+    When ``stats`` is given, connection and DNS events are counted into it so
+    reuse (and therefore skipped TLS handshakes) can be observed.
+    """
+    connector_kwargs = {}  # type: Dict[str, Any]
+    if ssl_context is not None:
+        connector_kwargs["ssl"] = ssl_context
+    connector = aiohttp.TCPConnector(
+        limit_per_host=POOL_LIMIT_PER_HOST,
+        keepalive_timeout=POOL_KEEPALIVE,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        **connector_kwargs,
+    )
+    trace_configs = [_connection_trace(stats)] if stats is not None else None
+    return aiohttp.ClientSession(connector=connector, trace_configs=trace_configs)
+
+
+def _connection_trace(stats: Dict[str, Any]) -> aiohttp.TraceConfig:
+    for key in ("connections_created", "connections_reused", "dns_lookups", "dns_cache_hits"):
+        stats.setdefault(key, 0)
+
+    def counter(key: str):
+        async def count(session, ctx, params) -> None:
+            stats[key] += 1
+        return count
+
+    trace = aiohttp.TraceConfig()
+    # A created connection is a new TCP (and TLS) handshake; a reused one skips it
+    trace.on_connection_create_end.append(counter("connections_created"))
+    trace.on_connection_reuseconn.append(counter("connections_reused"))
+    trace.on_dns_resolvehost_end.append(counter("dns_lookups"))
+    trace.on_dns_cache_hit.append(counter("dns_cache_hits"))
+    return trace
+
+
 class LoginError(Exception):
     """Raised when authentication fails."""
     pass
@@ -57,9 +170,12 @@ class ValidationError(Exception):
     pass
 
 class Client:
-    def __init__(self, session: Optional[aiohttp.ClientSession] = None) -> None:
-        # HTTP session and ownership
-        self._session = session or aiohttp.ClientSession()
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None, *, ssl_context: Optional[Any] = None) -> None:
+        # Counters surfaced through the ``stats`` property
+        self._stats = {"status_budget_exhausted": 0, "commands_unconfirmed": 0}  # type: Dict[str, Any]
+
+        # HTTP session and ownership; without one, a dedicated pool is created
+        self._session = session or create_session(ssl_context, self._stats)
         self._owns_session = session is None
 
         # State
@@ -74,6 +190,34 @@ class Client:
         self._creds = None  # type: Optional[tuple]
         self._last_successful_request = None  # type: Optional[float]
         self._ws_backoff_attempt = 0  # tracks consecutive WS failures
+        # Shared WebSocket: one background reader routes frames to waiters by address
+        self._ws_reader = None  # type: Optional[asyncio.Task]
+        self._ws_last_frame = 0.0  # monotonic time the shared socket last delivered any frame
+        self._ws_lock = asyncio.Lock()
+        self._ws_waiters = {}  # type: Dict[str, List[Tuple[asyncio.Future, bool]]]
+        self._status_listeners = {}  # type: Dict[str, List[Callable[[str, dict], None]]]
+        # Priming cache: page key -> monotonic time it was primed in this login session
+        self._primed = {}  # type: Dict[str, float]
+        # Recent command latencies in ms per delivery path ("ws" / "xhr")
+        self._latency = {}  # type: Dict[str, deque]
+        # Coalescing command queue: (address, number) -> (latest body, waiting futures)
+        self._pending_commands = {}  # type: Dict[Tuple[str, Optional[str]], Tuple[dict, List[asyncio.Future]]]
+        self._command_flush = None  # type: Optional[asyncio.Task]
+        # Single-flight re-authentication: concurrent callers share one login
+        self._reauth_task = None  # type: Optional[asyncio.Task]
+        self._login_generation = 0  # bumped after every successful login
+        # Keep-alive: learn how long the server keeps a session from observed 401s
+        self._login_at = None  # type: Optional[float]
+        # (monotonic time observed, lifetime in seconds)
+        self._session_lifetimes = deque(maxlen=SESSION_LIFETIME_SAMPLES)  # type: deque
+        self._keepalive_task = None  # type: Optional[asyncio.Task]
+
+        # Visitor snapshots never change for a file_name, so decoded bytes are cached
+        self._image_cache = ByteLRUCache(IMAGE_CACHE_MAX_BYTES)
+        self._image_fetches = {}  # type: Dict[str, asyncio.Future]
+        # Optional persistent store with async_get(file_name) / async_put(file_name, data)
+        self.image_store = None  # type: Optional[Any]
+        self._stats["keepalive_refreshes"] = 0
 
     # ---------- Auth / Priming ----------
     async def async_login(self, username: str, password: str) -> None:
@@ -94,27 +238,30 @@ class Client:
             
         self._username = username.strip()
         self._creds = (self._username, password)
+        # A new login session starts with fresh cookies: prime everything again
+        self._invalidate_priming()
         form = {"id": self._username, "password": password, "deviceId": "0", "tokenId": "0"}
         url = f"{BASE}/cvnet/web/login.do"
         _LOGGER.debug("Login POST -> %s as %s", url, self._username)
         async with self._session.post(url, data=form, headers=ajax_headers(), allow_redirects=False, timeout=DEFAULT_TIMEOUT) as resp:
-            txt = await resp.text()
+            raw = await resp.read()
             if resp.status != 200:
-                raise LoginError(f"login HTTP {resp.status}: {txt[:160]}")
+                raise LoginError(f"login HTTP {resp.status}: {_snippet(raw)}")
             try:
-                data = json.loads(txt)
+                data = codec.loads(raw)
                 if isinstance(data, dict):
                     res = str(data.get("result", "1")).lower()
                     if res in ("0", "fail", "false"):
                         msg = data.get("message") or "Invalid credentials"
                         raise LoginError(msg)
-            except json.JSONDecodeError:
+            except ValueError:
                 pass
         await self._prime_cookies()
         verify = f"{BASE}/cvnet/web/telemetering.view"
         async with self._session.get(verify, headers=common_headers(), timeout=DEFAULT_TIMEOUT) as r2:
             if r2.status == 401:
                 raise LoginError("Login appeared to succeed but telemetering.view returned 401.")
+        self._mark_primed(TELEMETERING_REFERER)
         try:
             await self.async_device_info("0x12")
         except Exception as e:
@@ -122,8 +269,12 @@ class Client:
         
         # Mark successful login
         self._last_successful_request = time.time()
+        self._login_generation += 1
+        self._login_at = time.monotonic()
 
     async def _prime_cookies(self) -> None:
+        if self._is_primed("cookies"):
+            return
         try:
             async with self._session.get(f"{BASE}/cvnet/web/", headers=common_headers(), timeout=DEFAULT_TIMEOUT) as r0:
                 _LOGGER.debug("Prime cookies GET /cvnet/web/ -> %s", r0.status)
@@ -131,16 +282,106 @@ class Client:
                 _LOGGER.debug("Prime cookies GET / -> %s", r1.status)
             async with self._session.get(f"{BASE}/cvnet/web/telemetering.view", headers=common_headers(), timeout=DEFAULT_TIMEOUT) as r2:
                 _LOGGER.debug("Prime cookies GET /telemetering.view -> %s", r2.status)
+                if r2.status < 400:
+                    self._mark_primed("cookies")
         except Exception as e:
             _LOGGER.debug("Prime cookies failed: %s", e)
 
+    async def _prime_page(self, path: str, headers: Optional[Dict[str, str]] = None) -> None:
+        """GET a referer page once per login session (refreshed after PRIME_TTL)."""
+        if self._is_primed(path):
+            return
+        url = f"{BASE}{path}"
+        try:
+            async with self._session.get(url, headers=headers or common_headers(), timeout=DEFAULT_TIMEOUT) as r:
+                _LOGGER.debug("Prime GET %s -> %s", path, r.status)
+                if r.status < 400:
+                    self._mark_primed(path)
+        except Exception as e:
+            _LOGGER.debug("Prime %s failed: %s", path, e)
+
+    def _is_primed(self, key: str) -> bool:
+        primed_at = self._primed.get(key)
+        return primed_at is not None and (time.monotonic() - primed_at) < PRIME_TTL
+
+    def _mark_primed(self, key: str) -> None:
+        self._primed[key] = time.monotonic()
+
+    def _invalidate_priming(self) -> None:
+        self._primed.clear()
+
     def _is_session_expired(self) -> bool:
         """Check if session might be expired based on time since last successful request."""
         if not self._last_successful_request:
             return True
         
         SESSION_TIMEOUT = SESSION_TIMEOUT_HOURS * 60 * 60
-        return (time.time() - self._last_successful_request) > SESSION_TIMEOUT
+        if (time.time() - self._last_successful_request) > SESSION_TIMEOUT:
+            return True
+        # Past the learned server-side lifetime the session is gone even if recently used
+        if self._lifetime_samples() and self._login_at is not None:
+            return (time.monotonic() - self._login_at) > self.session_lifetime
+        return False
+
+    @property
+    def session_lifetime(self) -> float:
+        """Estimated server session lifetime in seconds.
+
+        The median of recently observed lifetimes is used, never below
+        SESSION_LIFETIME_FLOOR, falling back to SESSION_TIMEOUT_HOURS until a
+        401 has been seen. Samples expire after SESSION_LIFETIME_SAMPLE_TTL:
+        while keep-alive refreshes early no new 401s arrive, so one early
+        expiry (e.g. a server restart) must not pin the estimate forever.
+        """
+        samples = self._lifetime_samples()
+        if samples:
+            return max(statistics.median(samples), SESSION_LIFETIME_FLOOR)
+        return SESSION_TIMEOUT_HOURS * 60 * 60
+
+    def _lifetime_samples(self) -> List[float]:
+        """Drop expired lifetime samples and return the remaining lifetimes."""
+        horizon = time.monotonic() - SESSION_LIFETIME_SAMPLE_TTL
+        while self._session_lifetimes and self._session_lifetimes[0][0] < horizon:
+            self._session_lifetimes.popleft()
+        return [lifetime for _, lifetime in self._session_lifetimes]
+
+    def _observe_session_expiry(self, generation: int) -> None:
+        """Record how long the session lived when a request got a 401."""
+        if self._login_at is None or generation != self._login_generation:
+            return
+        lifetime = time.monotonic() - self._login_at
+        if lifetime < MIN_SESSION_LIFETIME:
+            return
+        self._session_lifetimes.append((time.monotonic(), lifetime))
+        _LOGGER.debug("Session expired after %.0fs; estimated lifetime now %.0fs", lifetime, self.session_lifetime)
+
+    def start_keepalive(self) -> None:
+        """Start the background task that refreshes the session before it expires."""
+        if self._keepalive_task is None or self._keepalive_task.done():
+            self._keepalive_task = asyncio.create_task(self._keepalive_loop())
+
+    async def _keepalive_loop(self) -> None:
+        while True:
+            if self._login_at is None or not self._creds:
+                delay = KEEPALIVE_RETRY
+            else:
+                refresh_at = self._login_at + self.session_lifetime * KEEPALIVE_MARGIN
+                delay = max(refresh_at - time.monotonic(), 0.0)
+            await asyncio.sleep(delay)
+            if self._login_at is None or not self._creds:
+                continue
+            if time.monotonic() < self._login_at + self.session_lifetime * KEEPALIVE_MARGIN:
+                # A login happened meanwhile (e.g. after a 401); reschedule from it
+                continue
+            _LOGGER.debug("Refreshing session proactively after %.0fs", time.monotonic() - self._login_at)
+            try:
+                await self._async_relogin()
+                self._stats["keepalive_refreshes"] += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                _LOGGER.debug("Keep-alive login failed, retrying in %.0fs: %s", KEEPALIVE_RETRY, e)
+                await asyncio.sleep(KEEPALIVE_RETRY)
 
     async def _ensure_authenticated(self) -> None:
         """Ensure we have valid authentication, re-login if needed."""
@@ -150,7 +391,52 @@ class Client:
         # If session appears expired or we have no recent successful requests, try to re-login
         if self._is_session_expired():
             _LOGGER.debug("Session appears expired, attempting re-authentication")
-            await self.async_login(*self._creds)
+            await self._async_relogin()
+
+    async def _async_relogin(self) -> None:
+        """Log in again with cached credentials, sharing one login among concurrent callers.
+
+        Raises:
+            LoginError: If authentication fails
+        """
+        if self._reauth_task is None or self._reauth_task.done():
+            self._reauth_task = asyncio.create_task(self.async_login(*self._creds))
+            # Retrieve the outcome even if every waiter was cancelled
+            self._reauth_task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        # Shield so one cancelled caller does not abort the login for the others
+        await asyncio.shield(self._reauth_task)
+
+    async def _post_bytes(self, url: str, *, headers: Dict[str, str], data: Any,
+                          timeout: aiohttp.ClientTimeout, max_bytes: Optional[int] = None) -> Tuple[int, bytes]:
+        """POST and return ``(status, raw body)``.
+
+        A 401 triggers one (single-flight) re-login and the request is retried
+        once; a 401 after that is returned to the caller. Bodies over
+        ``max_bytes`` raise ApiError.
+        """
+        async def read(resp) -> bytes:
+            if max_bytes is None:
+                return await resp.read()
+            if resp.content_length is not None and resp.content_length > max_bytes:
+                raise ApiError(f"Response of {resp.content_length} bytes exceeds {max_bytes}")
+            # Chunked bodies have no length up front: stop reading once over the limit
+            buf = bytearray()
+            async for chunk in resp.content.iter_chunked(READ_CHUNK_SIZE):
+                buf += chunk
+                if len(buf) > max_bytes:
+                    raise ApiError(f"Response exceeds {max_bytes} bytes")
+            return bytes(buf)
+
+        generation = self._login_generation
+        async with self._session.post(url, headers=headers, data=data, timeout=timeout) as resp:
+            status, body = resp.status, await read(resp)
+        if status == 401:
+            _LOGGER.info("Got 401, attempting re-authentication")
+            self._observe_session_expiry(generation)
+            if await self._maybe_reauth(generation):
+                async with self._session.post(url, headers=headers, data=data, timeout=timeout) as resp:
+                    status, body = resp.status, await read(resp)
+        return status, body
 
     def _mark_successful_request(self) -> None:
         """Mark that we just had a successful request."""
@@ -159,6 +445,7 @@ class Client:
     def invalidate_session(self) -> None:
         """Force re-authentication on next request."""
         self._last_successful_request = None
+        self._invalidate_priming()
 
     @property
     def is_connected(self) -> bool:
@@ -175,6 +462,22 @@ class Client:
         """Whether the session appears expired."""
         return self._is_session_expired()
 
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Diagnostic counters collected by the client."""
+        stats = dict(self._stats)
+        stats["command_latency"] = {
+            path: {
+                "count": len(samples),
+                "last_ms": round(samples[-1], 1),
+                "avg_ms": round(sum(samples) / len(samples), 1),
+            }
+            for path, samples in self._latency.items()
+            if samples
+        }
+        stats["image_cache"] = self._image_cache.stats()
+        return stats
+
     # ---------- Basic REST endpoints ----------
     async def async_device_info(self, type_hex: str = "0x12") -> Dict[str, Any]:
         _LOGGER.debug("POST device_info.do type=%s", type_hex)
@@ -184,10 +487,10 @@ class Client:
             data={"type": type_hex},
             timeout=DEFAULT_TIMEOUT,
         ) as resp:
-            txt = await resp.text()
+            raw = await resp.read()
             if resp.status != 200:
-                raise ApiError(f"device_info.do HTTP {resp.status}: {txt[:160]}")
-            data = json.loads(txt)
+                raise ApiError(f"device_info.do HTTP {resp.status}: {_snippet(raw)}")
+            data = codec.loads(raw)
             wsaddr = data.get("websock_address")
             if wsaddr:
                 if wsaddr.startswith("http://"):
@@ -223,23 +526,18 @@ class Client:
         await self._prime_visitor()
         _LOGGER.debug("visitor_list POST %s body=%s", url, payload)
         
-        async with self._session.post(url, headers=headers, data=payload, timeout=DEFAULT_TIMEOUT) as resp:
-            if resp.status == 401:
-                _LOGGER.info("Got 401, attempting re-authentication")
-                if await self._maybe_reauth():
-                    return await self.async_visitor_list(page_no=page_no, rows=rows)
-                else:
-                    raise ApiError("Authentication failed after retry")
-            txt = await resp.text()
-            if resp.status != 200:
-                raise ApiError(f"visitor_list HTTP {resp.status}: {txt[:160]}")
-            try:
-                data = json.loads(txt)
-                self._mark_successful_request()  # Mark successful request
-            except Exception as ex:
-                _LOGGER.error("visitor_list invalid JSON: %s", ex)
-                return []
-            return data.get("contents", []) if isinstance(data, dict) else []
+        status, raw = await self._post_bytes(url, headers=headers, data=payload, timeout=DEFAULT_TIMEOUT)
+        if status == 401:
+            raise ApiError("Authentication failed after retry")
+        if status != 200:
+            raise ApiError(f"visitor_list HTTP {status}: {_snippet(raw)}")
+        try:
+            data = codec.loads(raw)
+            self._mark_successful_request()  # Mark successful request
+        except Exception as ex:
+            _LOGGER.error("visitor_list invalid JSON: %s", ex)
+            return []
+        return data.get("contents", []) if isinstance(data, dict) else []
 
     async def async_entrancecar_list(self, page_no: int = 1, rows: int = 14) -> dict:
         """Fetch car entrance list. Returns a dict with keys: contents, exist_next, page_no, rows, etc.
@@ -255,72 +553,108 @@ class Client:
         payload = {"pageNo": str(page_no), "rows": str(rows)}
         url = f"{BASE}{ENTRANCECAR_LIST_PATH}"
         # Prime cookies and referer page
-        try:
-            async with self._session.get(f"{BASE}{ENTRANCECAR_REFERER}", headers=common_headers(), timeout=DEFAULT_TIMEOUT) as r:
-                _LOGGER.debug("Prime entrance car GET %s -> %s", ENTRANCECAR_REFERER, r.status)
-        except Exception as e:
-            _LOGGER.debug("Prime entrance car failed: %s", e)
+        await self._prime_page(ENTRANCECAR_REFERER)
 
         _LOGGER.debug("entrancecar_list POST %s body=%s", url, payload)
-        async with self._session.post(url, headers=headers, data=payload, timeout=DEFAULT_TIMEOUT) as resp:
-            if resp.status == 401:
-                _LOGGER.info("Got 401, attempting re-authentication")
-                if await self._maybe_reauth():
-                    return await self.async_entrancecar_list(page_no=page_no, rows=rows)
-                else:
-                    raise ApiError("Authentication failed after retry")
-            txt = await resp.text()
-            if resp.status != 200:
-                raise ApiError(f"entrancecar_list HTTP {resp.status}: {txt[:160]}")
-            try:
-                data = json.loads(txt)
-                self._mark_successful_request()  # Mark successful request
-            except Exception as ex:
-                _LOGGER.error("entrancecar_list invalid JSON: %s", ex)
-                return {"result": 0, "contents": [], "exist_next": False, "page_no": str(page_no), "rows": str(rows)}
-            if isinstance(data, dict):
-                # Normalize fields
-                contents = data.get("contents") or []
-                exist_next = bool(data.get("exist_next"))
-                page_no_s = str(data.get("page_no") or data.get("pageNo") or str(page_no))
-                rows_s = str(data.get("rows") or str(rows))
-                return {"result": data.get("result", 1), "contents": contents, "exist_next": exist_next, "page_no": page_no_s, "rows": rows_s}
+        status, raw = await self._post_bytes(url, headers=headers, data=payload, timeout=DEFAULT_TIMEOUT)
+        if status == 401:
+            raise ApiError("Authentication failed after retry")
+        if status != 200:
+            raise ApiError(f"entrancecar_list HTTP {status}: {_snippet(raw)}")
+        try:
+            data = codec.loads(raw)
+            self._mark_successful_request()  # Mark successful request
+        except Exception as ex:
+            _LOGGER.error("entrancecar_list invalid JSON: %s", ex)
             return {"result": 0, "contents": [], "exist_next": False, "page_no": str(page_no), "rows": str(rows)}
+        if isinstance(data, dict):
+            # Normalize fields
+            contents = data.get("contents") or []
+            exist_next = bool(data.get("exist_next"))
+            page_no_s = str(data.get("page_no") or data.get("pageNo") or str(page_no))
+            rows_s = str(data.get("rows") or str(rows))
+            return {"result": data.get("result", 1), "contents": contents, "exist_next": exist_next, "page_no": page_no_s, "rows": rows_s}
+        return {"result": 0, "contents": [], "exist_next": False, "page_no": str(page_no), "rows": str(rows)}
 
     async def async_visitor_image_b64(self, file_name: str) -> Optional[str]:
-        await self._prime_visitor()
-        headers = dict(ajax_headers())
-        headers["Content-Type"] = "application/x-www-form-urlencoded; charset=UTF-8"
-        headers["Referer"] = f"{BASE}{VISITOR_REFERER}"
-        headers["Origin"] = BASE
-        headers["Accept"] = "application/json, text/javascript, */*; q=0.01"
-        headers["DNT"] = "1"
-        headers["Accept-Language"] = "en-GB,en-US;q=0.9,en;q=0.8"
-        payload = {"file_name": file_name}
-        url = f"{BASE}{VISITOR_CONTENT_PATH}"
-        _LOGGER.debug("visitor_content (b64) POST %s body=%s", url, payload)
         try:
-            async with self._session.post(url, headers=headers, data=payload, timeout=IMAGE_TIMEOUT) as resp:
-                if resp.status == 401:
-                    if await self._maybe_reauth():
-                        return await self.async_visitor_image_b64(file_name)
-                txt = await resp.text()
-                if resp.status != 200:
-                    _LOGGER.error("Image b64 fetch failed for %s: HTTP %s - %s", file_name, resp.status, (txt or "")[:160])
-                    return None
-                data = json.loads(txt)
+            raw = await self._post_visitor_content(file_name)
         except Exception as ex:
             _LOGGER.error("Image b64 fetch exception for %s: %s", file_name, ex)
             return None
-        b64 = data.get("image") if isinstance(data, dict) else None
-        if not b64:
-            _LOGGER.error("Image b64 fetch missing 'image' for %s: %s", file_name, data)
+        if raw is None:
+            return None
+        try:
+            view = _image_b64_view(raw)
+        except ValueError as ex:
+            _LOGGER.error("Image b64 fetch invalid payload for %s: %s", file_name, ex)
+            return None
+        if view is None:
+            _LOGGER.error("Image b64 fetch missing 'image' for %s", file_name)
             return None
-        if "," in b64:
-            b64 = b64.split(",", 1)[-1]
-        return b64
+        return str(view, "ascii")
 
     async def async_visitor_image_bytes(self, file_name: str) -> Optional[bytes]:
+        """Return decoded snapshot bytes, from the cache when possible.
+
+        Concurrent requests for the same file share one fetch.
+        """
+        cached = self._image_cache.get(file_name)
+        if cached is not None:
+            return cached
+        pending = self._image_fetches.get(file_name)
+        if pending is None:
+            pending = asyncio.ensure_future(self._load_visitor_image(file_name))
+            self._image_fetches[file_name] = pending
+            pending.add_done_callback(lambda _f: self._image_fetches.pop(file_name, None))
+        img = await asyncio.shield(pending)
+        if img:
+            self._image_cache.put(file_name, img)
+        return img
+
+    async def _load_visitor_image(self, file_name: str) -> Optional[bytes]:
+        """Read a snapshot from the persistent store, fetching and storing it on a miss."""
+        store = self.image_store
+        if store is not None:
+            try:
+                img = await store.async_get(file_name)
+            except Exception as ex:
+                _LOGGER.debug("Image store read failed for %s: %s", file_name, ex)
+                img = None
+            if img:
+                return img
+        img = await self._fetch_visitor_image_bytes(file_name)
+        if img and store is not None:
+            try:
+                await store.async_put(file_name, img)
+            except Exception as ex:
+                _LOGGER.debug("Image store write failed for %s: %s", file_name, ex)
+        return img
+
+    async def _fetch_visitor_image_bytes(self, file_name: str) -> Optional[bytes]:
+        raw = await self._post_visitor_content(file_name)
+        if raw is None:
+            return None
+        try:
+            view = _image_b64_view(raw)
+        except ValueError as ex:
+            _LOGGER.error("Image fetch invalid payload for %s: %s", file_name, ex)
+            return None
+        if view is None:
+            _LOGGER.error("Image fetch missing 'image' for %s", file_name)
+            return None
+        if len(view) * 3 // 4 > IMAGE_MAX_BYTES:
+            _LOGGER.error("Image for %s exceeds %d bytes, skipping", file_name, IMAGE_MAX_BYTES)
+            return None
+        try:
+            # a2b_base64 reads the view in place; the decoded bytes are the only new buffer
+            return binascii.a2b_base64(view)
+        except (binascii.Error, ValueError) as ex:
+            _LOGGER.error("Image fetch base64 decode error for %s: %s", file_name, ex)
+            return None
+
+    async def _post_visitor_content(self, file_name: str) -> Optional[bytes]:
+        """POST visitor_content.do and return the raw JSON body, or None on HTTP errors."""
         await self._prime_visitor()
         headers = dict(ajax_headers())
         headers["Content-Type"] = "application/x-www-form-urlencoded; charset=UTF-8"
@@ -332,43 +666,21 @@ class Client:
         payload = {"file_name": file_name}
         url = f"{BASE}{VISITOR_CONTENT_PATH}"
         _LOGGER.debug("visitor_content POST %s body=%s", url, payload)
-        async with self._session.post(url, headers=headers, data=payload, timeout=IMAGE_TIMEOUT) as resp:
-            if resp.status == 401:
-                if await self._maybe_reauth():
-                    return await self.async_visitor_image_bytes(file_name)
-            txt = await resp.text()
-            if resp.status != 200:
-                _LOGGER.error("Image fetch failed for %s: HTTP %s - %s", file_name, resp.status, (txt or "")[:160])
-                return None
-            try:
-                data = json.loads(txt)
-            except Exception as ex:
-                _LOGGER.error("Image fetch invalid JSON for %s: %s", file_name, ex)
-                return None
-            b64 = data.get("image") if isinstance(data, dict) else None
-            if not b64:
-                _LOGGER.error("Image fetch missing 'image' for %s: %s", file_name, data)
-                return None
-            if "," in b64:
-                b64 = b64.split(",", 1)[-1]
-            try:
-                return base64.b64decode(b64, validate=False)
-            except Exception as ex:
-                _LOGGER.error("Image fetch base64 decode error for %s: %s", file_name, ex)
-                return None
+        # Base64 inflates by 4/3; leave room for the JSON envelope
+        limit = IMAGE_MAX_BYTES * 4 // 3 + 4096
+        status, raw = await self._post_bytes(url, headers=headers, data=payload, timeout=IMAGE_TIMEOUT, max_bytes=limit)
+        if status != 200:
+            _LOGGER.error("Image fetch failed for %s: HTTP %s - %s", file_name, status, _snippet(raw))
+            return None
+        return raw
 
     async def _prime_visitor(self) -> None:
-        try:
-            url = f"{BASE}{VISITOR_REFERER}"
-            async with self._session.get(url, headers={"Accept": "text/html,application/xhtml+xml"}, timeout=DEFAULT_TIMEOUT) as r:
-                _ = await r.text()
-                _LOGGER.debug("Prime visitor GET %s -> %s", url, r.status)
-        except Exception as e:
-            _LOGGER.debug("Prime visitor failed: %s", e)
+        # Only the cookies matter; the HTML body is not read
+        await self._prime_page(VISITOR_REFERER, headers={"Accept": "text/html,application/xhtml+xml"})
 
     # ---------- SockJS helper ----------
     def _outer_array_of(self, obj: Dict[str, Any]) -> str:
-        return json.dumps([json.dumps(obj, separators=(",", ":"), ensure_ascii=False)], separators=(",", ":"), ensure_ascii=False)
+        return codec.dumps([codec.dumps(obj)])
 
     def _build_publish_payload(self, address: str, body: Dict[str, Any]) -> str:
         inner_body = {
@@ -382,7 +694,7 @@ class Client:
         envelope = {
             "type": "publish",
             "address": str(address),
-            "body": json.dumps(inner_body, separators=(",", ":"), ensure_ascii=False),
+            "body": codec.dumps(inner_body),
         }
         payload = self._outer_array_of(envelope)
         _LOGGER.debug("SockJS publish payload - id=%s, remote_addr=%s, body=%s",
@@ -419,20 +731,34 @@ class Client:
             pass
         return True
 
-    async def _ws_backoff_wait(self) -> None:
-        """Wait with exponential backoff + jitter before WS retry."""
+    def _ws_is_stale(self) -> bool:
+        """Whether the shared socket has delivered no frame at all for WS_STALE_AFTER."""
+        return self._ws is not None and (time.monotonic() - self._ws_last_frame) > WS_STALE_AFTER
+
+    async def _ws_backoff_wait(self, max_delay: Optional[float] = None) -> None:
+        """Wait with exponential backoff + jitter before WS retry.
+
+        Args:
+            max_delay: Upper bound for the wait, e.g. the time left in a caller's budget
+        """
         delay = min(
             WS_BACKOFF_BASE * (WS_BACKOFF_FACTOR ** self._ws_backoff_attempt),
             WS_BACKOFF_MAX,
         )
         jitter = random.uniform(0, delay * 0.3)
         total = delay + jitter
+        if max_delay is not None:
+            total = max(0.0, min(total, max_delay))
         _LOGGER.debug("WS backoff: waiting %.1fs (attempt %d)", total, self._ws_backoff_attempt)
         await asyncio.sleep(total)
         self._ws_backoff_attempt += 1
 
     async def _ensure_ws(self, force_new: bool = False) -> aiohttp.ClientWebSocketResponse:
-        """Ensure WebSocket connection is established and ready.
+        """Ensure the shared WebSocket connection is established and ready.
+
+        The connection is long-lived: once the SockJS handshake and Vert.x login
+        are done, a background reader task owns ``receive()`` and routes frames
+        to waiters, so concurrent callers share one socket.
 
         Args:
             force_new: Force creation of new connection even if existing one is available
@@ -446,51 +772,65 @@ class Client:
         if not force_new and self._is_ws_healthy():
             return self._ws
 
-        # Clean up existing connection
-        if self._ws:
+        async with self._ws_lock:
+            # Another caller may have connected while we waited for the lock
+            if not force_new and self._is_ws_healthy():
+                return self._ws
+
+            await self._close_ws()
+
             try:
-                await self._ws.close()
+                await self.async_device_info("0x12")
             except Exception as e:
-                _LOGGER.debug("Error closing existing WS connection: %s", e)
-            self._ws = None
-                
-        try:
-            await self.async_device_info("0x12")
-        except Exception as e:
-            _LOGGER.warning("device_info during WS ensure failed: %s", e)
-            
-        ws_base = self._ws_base or DEFAULT_WS_BASE
-        server_id = f"{random.randint(0, 999):03d}"
-        session_id = secrets.token_hex(4)
-        self._sockjs_server = server_id
-        self._sockjs_session = session_id
-        ws_url = f"{ws_base}/{server_id}/{session_id}/websocket"
-        
-        _LOGGER.debug("Opening WS %s", ws_url)
-        
-        try:
-            ws = await self._session.ws_connect(
-                ws_url,
-                headers=ws_headers(),
-                timeout=10,
-                autoclose=True,
-                autoping=True,
-                heartbeat=20,
-                ssl=True,
-            )
-        except Exception as e:
-            raise ConnectionError(f"Failed to establish WebSocket connection: {e}")
-            
+                _LOGGER.warning("device_info during WS ensure failed: %s", e)
+
+            ws_base = self._ws_base or DEFAULT_WS_BASE
+            server_id = f"{random.randint(0, 999):03d}"
+            session_id = secrets.token_hex(4)
+            self._sockjs_server = server_id
+            self._sockjs_session = session_id
+            ws_url = f"{ws_base}/{server_id}/{session_id}/websocket"
+
+            _LOGGER.debug("Opening WS %s", ws_url)
+
+            try:
+                ws = await self._session.ws_connect(
+                    ws_url,
+                    headers=ws_headers(),
+                    timeout=10,
+                    autoclose=True,
+                    autoping=True,
+                    heartbeat=20,
+                    ssl=True,
+                )
+            except Exception as e:
+                raise ConnectionError(f"Failed to establish WebSocket connection: {e}")
+
+            try:
+                await self._ws_handshake(ws)
+            except BaseException:
+                # Includes cancellation by a caller's deadline: never leak a half-open socket
+                if not ws.closed:
+                    await ws.close()
+                raise
+
+            self._registered.clear()
+            self._ws = ws
+            self._ws_last_frame = time.monotonic()
+            self._ws_reader = asyncio.create_task(self._ws_read_loop(ws))
+            self._ws_backoff_attempt = 0
+            return ws
+
+    async def _ws_handshake(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Wait for the SockJS open frame and log in to the Vert.x bridge."""
         try:
             msg = await ws.receive(timeout=5)
             _LOGGER.debug("WS first frame: %s", getattr(msg, "data", None))
             if msg.type != WSMsgType.TEXT or not (msg.data or "").lstrip().startswith("o"):
-                await ws.close()
                 raise ConnectionError(f"WS open failed: {msg.type} {getattr(msg,'data', '')!s}")
         except asyncio.TimeoutError:
-            await ws.close()
             raise ConnectionError("WebSocket connection timeout on initial frame")
-            
+
         # Send login payload
         try:
             await ws.send_str(self._build_login_payload())
@@ -500,20 +840,183 @@ class Client:
             except asyncio.TimeoutError:
                 _LOGGER.debug("WS login reply: timeout (ignored)")
         except Exception as e:
-            await ws.close()
             raise ConnectionError(f"WS login failed: {e}")
-            
+
+    async def _close_ws(self) -> None:
+        """Stop the reader task, close the socket and fail any pending waiters."""
+        ws, self._ws = self._ws, None
+        reader, self._ws_reader = self._ws_reader, None
         self._registered.clear()
-        self._ws = ws
-        self._ws_backoff_attempt = 0
-        return ws
+        if reader and not reader.done() and reader is not asyncio.current_task():
+            reader.cancel()
+        if ws and not ws.closed:
+            try:
+                await ws.close()
+            except Exception as e:
+                _LOGGER.debug("Error closing existing WS connection: %s", e)
+        self._fail_waiters(ConnectionError("WebSocket connection closed"))
+
+    async def _ws_read_loop(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Single consumer of ``ws.receive()``; dispatches frames until the socket closes."""
+        try:
+            while True:
+                msg = await ws.receive()
+                if msg.type == WSMsgType.TEXT:
+                    self._ws_last_frame = time.monotonic()
+                    self._dispatch_frame(msg.data)
+                elif msg.type in (WSMsgType.CLOSE, WSMsgType.CLOSING, WSMsgType.CLOSED, WSMsgType.ERROR):
+                    _LOGGER.debug("WS reader: socket closed (%s)", msg.type)
+                    break
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            _LOGGER.debug("WS reader stopped: %s", e)
+        finally:
+            if self._ws is ws:
+                self._ws = None
+                self._registered.clear()
+                self._fail_waiters(ConnectionError("WebSocket connection lost"))
+
+    def _dispatch_frame(self, text: str) -> None:
+        """Parse a SockJS frame and route each ``a[...]`` message by address."""
+        if not isinstance(text, str) or not text.startswith("a["):
+            # "o" (open), "h" (heartbeat) and "c" (close) frames carry no messages
+            return
+        try:
+            arr = codec.loads(text[1:])
+        except ValueError as ex:
+            _LOGGER.debug("Failed to parse WS frame: %s", ex)
+            return
+        for inner in arr if isinstance(arr, list) else []:
+            data = self._parse_message(inner)
+            if data is not None:
+                self._route_message(data)
+
+    @staticmethod
+    def _parse_message(inner: Any) -> Optional[dict]:
+        try:
+            data = codec.loads(inner) if isinstance(inner, str) else inner
+        except ValueError:
+            return None
+        if not isinstance(data, dict):
+            return None
+        body = data.get("body")
+        if isinstance(body, str):
+            try:
+                data["body"] = codec.loads(body)
+            except ValueError:
+                pass
+        return data
+
+    @staticmethod
+    def _is_status_message(data: dict) -> bool:
+        body = data.get("body")
+        return isinstance(body, dict) and "contents" in body
+
+    def _route_message(self, data: dict) -> None:
+        """Resolve waiters for the message's address.
+
+        Status waiters only accept messages carrying ``contents`` and are all
+        resolved by one reply; ack waiters take any message, first come first served.
+        """
+        address = str(data.get("address") or "")
+        if address:
+            waiters = self._ws_waiters.get(address, [])
+        else:
+            # Replies without an address go to whoever has waited longest
+            waiters = next((w for w in self._ws_waiters.values() if w), [])
+        is_status = self._is_status_message(data)
+        ack_taken = False
+        solicited = False
+        for fut, status_only in list(waiters):
+            if fut.done():
+                continue
+            if status_only:
+                if is_status:
+                    fut.set_result(data)
+                    solicited = True
+            elif not ack_taken:
+                fut.set_result(data)
+                ack_taken = True
+        if is_status and address and not solicited:
+            self._notify_status_listeners(address, data)
+
+    def _notify_status_listeners(self, address: str, data: dict) -> None:
+        for listener in list(self._status_listeners.get(address, [])):
+            try:
+                listener(address, data)
+            except Exception as e:
+                _LOGGER.warning("Status listener for address %s failed: %s", address, e)
+
+    def add_status_listener(self, address: str, listener: Callable[[str, dict], None]) -> Callable[[], None]:
+        """Call ``listener(address, data)`` for status frames pushed on ``address``.
+
+        Only unsolicited frames are delivered; replies to ``async_status_snapshot``
+        are returned to its caller. Returns a function that removes the listener.
+        """
+        address = str(address)
+        self._status_listeners.setdefault(address, []).append(listener)
+
+        def _remove() -> None:
+            listeners = self._status_listeners.get(address, [])
+            if listener in listeners:
+                listeners.remove(listener)
+            if not listeners:
+                self._status_listeners.pop(address, None)
+
+        return _remove
+
+    async def async_ensure_subscriptions(self) -> None:
+        """Make sure the shared socket is open and registered for all listened addresses.
+
+        Raises:
+            ConnectionError: If the WebSocket cannot be established
+        """
+        for address in list(self._status_listeners):
+            await self._ensure_registered(address)
+
+    def _add_waiter(self, address: str, status_only: bool) -> asyncio.Future:
+        fut = asyncio.get_running_loop().create_future()
+        self._ws_waiters.setdefault(address, []).append((fut, status_only))
+        return fut
+
+    def _remove_waiter(self, address: str, fut: asyncio.Future) -> None:
+        waiters = self._ws_waiters.get(address)
+        if not waiters:
+            return
+        waiters[:] = [w for w in waiters if w[0] is not fut]
+        if not waiters:
+            self._ws_waiters.pop(address, None)
+
+    def _fail_waiters(self, exc: Exception) -> None:
+        waiters, self._ws_waiters = self._ws_waiters, {}
+        for items in waiters.values():
+            for fut, _ in items:
+                if not fut.done():
+                    fut.set_exception(exc)
+
+    async def _wait_message(self, address: str, fut: asyncio.Future, timeout: float) -> dict:
+        try:
+            return await asyncio.wait_for(fut, timeout=timeout)
+        finally:
+            self._remove_waiter(address, fut)
+
+    async def _ws_send(self, payload_text: str) -> None:
+        if not self._is_ws_healthy():
+            raise ConnectionError("WebSocket is not connected")
+        await self._ws.send_str(payload_text)
 
     async def _ensure_registered(self, address: str) -> None:
+        await self._ensure_ws()
         if address in self._registered:
             return
-        ws = await self._ensure_ws()
-        await ws.send_str(self._build_register_payload(address))
+        # Claim the address before sending so concurrent callers register it once
         self._registered.add(address)
+        try:
+            await self._ws_send(self._build_register_payload(address))
+        except BaseException:
+            self._registered.discard(address)
+            raise
         _LOGGER.debug("WS registered address %s", address)
 
     async def _xhr_send(self, payload_text: str) -> None:
@@ -533,111 +1036,282 @@ class Client:
         async with self._session.post(url, data=payload_text, headers=headers, timeout=DEFAULT_TIMEOUT) as resp:
             txt = await resp.text()
             _LOGGER.debug("XHR_SEND HTTP %s (first 120): %s", resp.status, (txt or "")[:120])
+            if resp.status >= 400:
+                raise ApiError(f"xhr_send HTTP {resp.status}: {(txt or '')[:160]}")
+
+    async def _ws_publish(self, address: str, payload_text: str) -> Optional[dict]:
+        """Send one publish frame on the shared socket and wait briefly for an ack.
+
+        Returns the first frame received on ``address`` after the send, or None
+        if nothing arrived within WS_ACK_TIMEOUT.
+        """
+        ack = self._add_waiter(address, status_only=False)
+        try:
+            await self._ws_send(payload_text)
+            return await self._wait_message(address, ack, WS_ACK_TIMEOUT)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self._remove_waiter(address, ack)
 
     async def async_publish(self, address: str, body: dict) -> dict:
-        payload_text = self._build_publish_payload(str(address), body)
+        """Send a command once over the shared WebSocket.
+
+        ``xhr_send`` is only used as a fallback, when the WebSocket send fails or
+        no ack frame arrives, and runs before a failed socket is torn down so it
+        still reaches a live SockJS session. A command whose WebSocket write
+        succeeded is never written again: if neither an ack nor the fallback
+        confirms it, it is reported as unconfirmed instead of being duplicated.
+        Latency per delivery path is recorded in ``stats``.
+
+        Returns:
+            The ack frame, or ``{}`` when the command was delivered via xhr_send
+            or written to the socket without confirmation
+
+        Raises:
+            ApiError: If the command could not be delivered after all retries
+        """
+        address = str(address)
+        payload_text = self._build_publish_payload(address, body)
         _LOGGER.debug("Publishing to address %s: %s", address, body)
         last_err: Optional[Exception] = None
         for attempt in range(WS_MAX_RETRIES):
+            started = time.monotonic()
+            ws_error: Optional[Exception] = None
+            ack = None
             try:
                 await self._prime_cookies()
                 await self._ensure_ws(force_new=(attempt > 0))
-                await self._ensure_registered(str(address))
-                await self._ws.send_str(payload_text)
-                _LOGGER.debug("Publish sent on WS (attempt %s)", attempt + 1)
-                try:
-                    msg = await self._ws.receive(timeout=1.0)
-                    _LOGGER.debug("WS post-publish frame: type=%s data=%s", msg.type, getattr(msg, "data", None))
-                except asyncio.TimeoutError:
-                    pass  # No immediate reply is normal
-                try:
-                    await self._xhr_send(payload_text)
-                    _LOGGER.debug("XHR_SEND fallback also sent")
-                except Exception as e:
-                    _LOGGER.debug("XHR_SEND fallback failed (ignored): %s", e)
+                await self._ensure_registered(address)
+                ack = await self._ws_publish(address, payload_text)
+            except (ServerDisconnectedError, ClientError, ApiError, ConnectionError, ConnectionResetError, asyncio.TimeoutError) as e:
+                _LOGGER.warning("Publish attempt %s failed on WS: %s", attempt + 1, e)
+                last_err = ws_error = e
+            else:
+                if ack is not None:
+                    _LOGGER.debug("Publish acked on WS (attempt %s): %s", attempt + 1, ack)
+                    self._record_latency("ws", time.monotonic() - started)
+                    self._ws_backoff_attempt = 0
+                    return ack
+                _LOGGER.debug("No ack for publish on WS, falling back to xhr_send")
+            try:
+                await self._xhr_send(payload_text)
+            except Exception as e:
+                _LOGGER.warning("Publish attempt %s failed on xhr_send: %s", attempt + 1, e)
+                last_err = e
+            else:
+                self._record_latency("xhr", time.monotonic() - started)
                 self._ws_backoff_attempt = 0
+                if ws_error is not None:
+                    await self._close_ws()
                 return {}
-            except (ServerDisconnectedError, ClientError, ApiError, asyncio.TimeoutError) as e:
-                _LOGGER.warning("Publish attempt %s failed: %s", attempt + 1, e)
-                last_err = e
-                if self._ws and not self._ws.closed:
-                    try:
-                        await self._ws.close()
-                    except Exception:
-                        pass
-                self._ws = None
-                await self._ws_backoff_wait()
-                continue
+            if ws_error is None:
+                # The frame already went out on the socket; sending it again could apply it twice
+                _LOGGER.warning("Publish to address %s unconfirmed: no ack and xhr_send failed", address)
+                self._stats["commands_unconfirmed"] += 1
+                return {}
+            await self._close_ws()
+            await self._ws_backoff_wait()
         _LOGGER.error("Publish failed after %d retries: %s", WS_MAX_RETRIES, last_err)
         raise ApiError(str(last_err) if last_err else "Publish failed")
 
-    async def async_status_snapshot(self, address: str = "22") -> dict:
-        payload_text = self._build_publish_payload(str(address), {"request": "status"})
+    async def async_publish_many(self, address: str, bodies: List[dict]) -> List[dict]:
+        """Publish several commands to one address in a single round-trip.
+
+        The address is registered once, all frames are written back-to-back on
+        the shared socket and acks are collected concurrently. Acks on an address
+        are matched to commands in send order; commands left without an ack are
+        re-sent via xhr_send concurrently.
+
+        Returns:
+            One result per body, in order: ``{"ok": True, "path": "ws", "ack": {...}}``,
+            ``{"ok": True, "path": "xhr"}`` or ``{"ok": False, "error": "..."}``
+        """
+        address = str(address)
+        payloads = [self._build_publish_payload(address, body) for body in bodies]
+        if not payloads:
+            return []
+        _LOGGER.debug("Publishing %d commands to address %s", len(payloads), address)
+        started = time.monotonic()
+        acks: List[Optional[dict]] = [None] * len(payloads)
+        ws_failed = False
+        try:
+            await self._prime_cookies()
+            await self._ensure_ws()
+            await self._ensure_registered(address)
+            futs = [self._add_waiter(address, status_only=False) for _ in payloads]
+            try:
+                for payload_text in payloads:
+                    await self._ws_send(payload_text)
+                await asyncio.wait(futs, timeout=WS_ACK_TIMEOUT)
+            finally:
+                for fut in futs:
+                    self._remove_waiter(address, fut)
+            for i, fut in enumerate(futs):
+                if fut.done() and not fut.cancelled() and fut.exception() is None:
+                    acks[i] = fut.result()
+        except (ServerDisconnectedError, ClientError, ApiError, ConnectionError, ConnectionResetError, asyncio.TimeoutError) as e:
+            _LOGGER.warning("Batch publish on WS failed, falling back to xhr_send: %s", e)
+            ws_failed = True
+
+        if any(ack is not None for ack in acks):
+            self._record_latency("ws_batch", time.monotonic() - started)
+
+        missing = [i for i, ack in enumerate(acks) if ack is None]
+        # xhr_send reuses the SockJS session, so the failed socket is closed only afterwards
+        fallback = await asyncio.gather(
+            *(self._xhr_send(payloads[i]) for i in missing), return_exceptions=True
+        )
+        if ws_failed:
+            await self._close_ws()
+        results: List[dict] = [{"ok": True, "path": "ws", "ack": ack} for ack in acks]
+        for i, outcome in zip(missing, fallback):
+            if isinstance(outcome, BaseException):
+                _LOGGER.warning("Batch publish item %d failed on xhr_send: %s", i, outcome)
+                results[i] = {"ok": False, "error": str(outcome)}
+            else:
+                results[i] = {"ok": True, "path": "xhr"}
+        if missing:
+            self._record_latency("xhr", time.monotonic() - started)
+        return results
+
+    async def async_queue_command(self, address: str, body: dict) -> dict:
+        """Queue a command, keeping only the latest body per (address, number).
+
+        Commands are sent after COMMAND_COALESCE_WINDOW by a single flush task,
+        so rapid changes to one zone collapse into one write and writes never
+        race each other on the socket. Every superseded caller receives the
+        result of the command that was actually sent.
+
+        Raises:
+            ApiError: If the command that was sent for this key failed
+        """
+        address = str(address)
+        key = (address, str(body["number"]) if "number" in body else None)
+        fut = asyncio.get_running_loop().create_future()
+        _, waiters = self._pending_commands.pop(key, (None, []))
+        waiters.append(fut)
+        # Re-inserting moves the key to the end, so batches keep the latest order
+        self._pending_commands[key] = (body, waiters)
+        if self._command_flush is None or self._command_flush.done():
+            self._command_flush = asyncio.create_task(self._flush_commands())
+        return await fut
+
+    async def _flush_commands(self) -> None:
+        while True:
+            await asyncio.sleep(COMMAND_COALESCE_WINDOW)
+            batch, self._pending_commands = self._pending_commands, {}
+            if not batch:
+                return
+            by_address: Dict[str, List[Tuple[dict, List[asyncio.Future]]]] = {}
+            for (address, _), entry in batch.items():
+                by_address.setdefault(address, []).append(entry)
+            try:
+                for address, entries in by_address.items():
+                    await self._send_command_entries(address, entries)
+            except asyncio.CancelledError:
+                # Cancelled by async_close mid-send: waiters of this batch must not hang
+                for _, waiters in batch.values():
+                    for fut in waiters:
+                        if not fut.done():
+                            fut.set_exception(ApiError("Client closed"))
+                raise
+            # Commands queued while sending are picked up by the next pass
+
+    async def _send_command_entries(self, address: str, entries: List[Tuple[dict, List[asyncio.Future]]]) -> None:
+        if len(entries) == 1:
+            try:
+                results = [{"ok": True, "ack": await self.async_publish(address, entries[0][0])}]
+            except Exception as e:
+                results = [{"ok": False, "error": str(e)}]
+        else:
+            try:
+                results = await self.async_publish_many(address, [body for body, _ in entries])
+            except Exception as e:
+                results = [{"ok": False, "error": str(e)}] * len(entries)
+        for (_, waiters), result in zip(entries, results):
+            for fut in waiters:
+                if fut.done():
+                    continue
+                if result.get("ok"):
+                    fut.set_result(result.get("ack") or {})
+                else:
+                    fut.set_exception(ApiError(result.get("error") or "Command failed"))
+
+    def _record_latency(self, path: str, seconds: float) -> None:
+        self._latency.setdefault(path, deque(maxlen=LATENCY_SAMPLES)).append(seconds * 1000.0)
+
+    async def async_status_snapshot(self, address: str = "22", budget: Optional[float] = None) -> dict:
+        """Request a status snapshot for ``address`` over the shared WebSocket.
+
+        Retries and backoff all draw from one time budget, so a silent address
+        costs at most ``budget`` seconds. The first attempt gets at most half of
+        it, so a retry always fits. A silent address only gives up on itself:
+        the shared socket is replaced only once it has delivered no frame at
+        all (not even a heartbeat) for WS_STALE_AFTER.
+
+        Args:
+            address: Vert.x event bus address
+            budget: Seconds available for all attempts (defaults to STATUS_BUDGET_S)
+
+        Returns:
+            The parsed reply (with ``body`` decoded), or ``{}`` when no fresh data
+            arrived within the budget or after all retries
+        """
+        address = str(address)
+        payload_text = self._build_publish_payload(address, {"request": "status"})
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (STATUS_BUDGET_S if budget is None else budget)
+        reconnect = False
 
         for attempt in range(WS_MAX_RETRIES):
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            # The first attempt leaves half the budget for a retry on a new connection
+            attempt_timeout = remaining if reconnect else min(WS_STATUS_TIMEOUT, remaining / 2)
             try:
                 _LOGGER.debug("Sending status request for address %s (attempt %d)", address, attempt + 1)
-                # Always force new connection for status requests to avoid stale connections
-                await self._ensure_ws(force_new=True)
-                await self._ensure_registered(str(address))
-                await self._ws.send_str(payload_text)
-
-                for i in range(6):
-                    try:
-                        msg = await self._ws.receive(timeout=2.0)
-                        msg_data = getattr(msg, "data", None)
-                        _LOGGER.debug("WS status frame %d: type=%s", i, msg.type)
-                        if msg.type == WSMsgType.TEXT and isinstance(msg.data, str) and msg.data.startswith("a["):
-                            try:
-                                arr = json.loads(msg.data[1:])
-                                if not arr:
-                                    continue
-                                inner = arr[0]
-                                data = json.loads(inner) if isinstance(inner, str) else inner
-                                body = data.get("body")
-                                if isinstance(body, str):
-                                    try:
-                                        data["body"] = json.loads(body)
-                                    except Exception:
-                                        pass
-                                _LOGGER.debug("Parsed status data successfully for address %s", address)
-                                self._ws_backoff_attempt = 0
-                                return data
-                            except Exception as ex:
-                                _LOGGER.debug("Failed to parse WS message: %s", ex)
-                                continue
-                    except asyncio.TimeoutError:
-                        continue
-                # No valid response, try with new connection
-                _LOGGER.debug("No valid response, will retry with new connection")
-                await self._ws_backoff_wait()
-
+                data = await asyncio.wait_for(
+                    self._status_attempt(address, payload_text, reconnect), timeout=attempt_timeout
+                )
+                _LOGGER.debug("Parsed status data successfully for address %s", address)
+                self._ws_backoff_attempt = 0
+                return data
+            except asyncio.TimeoutError:
+                _LOGGER.debug("No valid response for address %s", address)
             except Exception as e:
                 _LOGGER.debug("status_snapshot attempt %d failed: %s", attempt + 1, e)
-                # Close bad connection before retry
-                if self._ws:
-                    try:
-                        await self._ws.close()
-                    except Exception:
-                        pass
-                    self._ws = None
-                await self._ws_backoff_wait()
-                continue
+            # Other addresses and push listeners share the socket: only replace a dead one
+            reconnect = self._ws_is_stale()
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            await self._ws_backoff_wait(max_delay=remaining)
+        else:
+            _LOGGER.debug("status_snapshot: no valid response after %d retries", WS_MAX_RETRIES)
+            return {}
 
-        _LOGGER.debug("status_snapshot: no valid response after %d retries", WS_MAX_RETRIES)
+        self._stats["status_budget_exhausted"] += 1
+        _LOGGER.debug("status_snapshot: budget exhausted for address %s", address)
         return {}
 
+    async def _status_attempt(self, address: str, payload_text: str, reconnect: bool) -> dict:
+        await self._ensure_ws(force_new=reconnect)
+        await self._ensure_registered(address)
+        fut = self._add_waiter(address, status_only=True)
+        try:
+            await self._ws_send(payload_text)
+            return await self._wait_message(address, fut, WS_STATUS_TIMEOUT)
+        finally:
+            self._remove_waiter(address, fut)
+
     async def async_telemetering(self) -> dict:
         """Fetch current telemetering data (electricity, water, gas)."""
         await self._ensure_authenticated()
 
         # Prime the telemetering page
-        try:
-            url = f"{BASE}{TELEMETERING_REFERER}"
-            async with self._session.get(url, headers=common_headers(), timeout=DEFAULT_TIMEOUT) as r:
-                _LOGGER.debug("Prime telemetering GET %s -> %s", url, r.status)
-        except Exception as e:
-            _LOGGER.debug("Prime telemetering failed: %s", e)
+        await self._prime_page(TELEMETERING_REFERER)
 
         headers = dict(ajax_headers())
         headers["Content-Type"] = "application/x-www-form-urlencoded; charset=UTF-8"
@@ -646,42 +1320,50 @@ class Client:
         url = f"{BASE}{TELEMETERING_LIST_PATH}"
         _LOGGER.debug("telemetering POST %s", url)
 
-        async with self._session.post(url, headers=headers, data={}, timeout=DEFAULT_TIMEOUT) as resp:
-            if resp.status == 401:
-                _LOGGER.info("Got 401 on telemetering, attempting re-authentication")
-                if await self._maybe_reauth():
-                    return await self.async_telemetering()
-                raise ApiError("Telemetering authentication failed after retry")
-            txt = await resp.text()
-            if resp.status != 200:
-                raise ApiError(f"telemetering HTTP {resp.status}: {txt[:160]}")
-            try:
-                data = json.loads(txt)
-                self._mark_successful_request()
-            except Exception as ex:
-                _LOGGER.error("telemetering invalid JSON: %s", ex)
-                return {}
-            return data if isinstance(data, dict) else {}
+        status, raw = await self._post_bytes(url, headers=headers, data={}, timeout=DEFAULT_TIMEOUT)
+        if status == 401:
+            raise ApiError("Telemetering authentication failed after retry")
+        if status != 200:
+            raise ApiError(f"telemetering HTTP {status}: {_snippet(raw)}")
+        try:
+            data = codec.loads(raw)
+            self._mark_successful_request()
+        except Exception as ex:
+            _LOGGER.error("telemetering invalid JSON: %s", ex)
+            return {}
+        return data if isinstance(data, dict) else {}
 
     async def async_close(self):
-        if self._ws and not self._ws.closed:
-            try:
-                await self._ws.close()
-            except Exception:
-                pass
-            self._ws = None
+        if self._keepalive_task and not self._keepalive_task.done():
+            self._keepalive_task.cancel()
+        if self._command_flush and not self._command_flush.done():
+            self._command_flush.cancel()
+        pending, self._pending_commands = self._pending_commands, {}
+        for _, waiters in pending.values():
+            for fut in waiters:
+                if not fut.done():
+                    fut.set_exception(ApiError("Client closed"))
+        await self._close_ws()
         if self._owns_session:
             await self._session.close()
 
-    async def _maybe_reauth(self) -> bool:
+    async def _maybe_reauth(self, generation: Optional[int] = None) -> bool:
         """Attempt to re-authenticate on 401 if we have cached credentials.
 
+        Args:
+            generation: Login generation the failed request was sent under. If a
+                login has completed since, the request is simply retried.
+
         Returns True if re-auth succeeded.
         """
         if not self._creds:
             return False
+        if generation is not None and generation != self._login_generation:
+            return True
+        # Cookies behind a 401 are stale: referer pages must be primed again
+        self._invalidate_priming()
         try:
-            await self.async_login(*self._creds)
+            await self._async_relogin()
             return True
         except Exception as e:
             _LOGGER.debug("Re-auth failed: %s", e)
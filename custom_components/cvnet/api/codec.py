@@ -0,0 +1,36 @@
+"""JSON codec used by the client.
+
+Uses orjson when it is installed (Home Assistant ships it) and the standard
+library otherwise. Both decoders accept ``bytes`` as well as ``str`` and raise
+a ``ValueError`` subclass on malformed input.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Compact JSON text with non-ASCII characters kept as-is."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            # e.g. integers beyond 64 bits or non-str keys; let the stdlib handle them
+            pass
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
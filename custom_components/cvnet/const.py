@@ -6,14 +6,40 @@ DOMAIN = "cvnet"
 BASE = "https://js-thehue.uasis.com"
 DEFAULT_TIMEOUT_S = 10  # seconds
 IMAGE_TIMEOUT_S = 30  # seconds, for potentially large visitor image fetches
-DEFAULT_UPDATE_INTERVAL = 15  # seconds
+IMAGE_MAX_BYTES = 5 * 1024 * 1024  # decoded size limit for one visitor snapshot
+IMAGE_CACHE_MAX_BYTES = 8 * 1024 * 1024  # decoded visitor snapshots kept in memory
+IMAGE_VARIANT_CACHE_MAX_BYTES = 2 * 1024 * 1024  # resized camera variants kept in memory
+IMAGE_VARIANT_QUALITY = 80  # JPEG quality of resized camera variants
+CAR_HISTORY_MAX = 500  # car entries kept locally by the incremental sync
+CAR_SYNC_MAX_PAGES = 10  # pages a catch-up may walk back after an outage
+CAR_SYNC_PAGE_ROWS = 50  # rows per catch-up page; page 1 uses the display rows
+SEEN_VISITORS_MAX = 500  # visitor file names remembered across restarts for new-visitor events
+SEEN_SAVE_DELAY_S = 10
+SEEN_STORE_VERSION = 1
+CAR_SEARCH_PAGE_ROWS = 50  # rows per page when a search backfills from the server
+CAR_SEARCH_MAX_PAGES = 20  # pages one search may fetch from the server
+CAR_SEARCH_CONCURRENCY = 3  # parallel page fetches during a search backfill
+CAR_SEARCH_MAX_RESULTS = 500
+IMAGE_PREFETCH_CONCURRENCY = 2  # parallel snapshot fetches for newly detected visitors
+IMAGE_PREFETCH_WAIT_S = 5  # seconds the new-visitor event waits for its image
+DEFAULT_UPDATE_INTERVAL = 15  # seconds; visitors and car entries
+DEFAULT_DEVICE_INTERVAL = 15  # seconds; heater/light polling when push is quiet
+DEFAULT_TELEMETER_INTERVAL = 600  # seconds; meter readings change slowly
+DEFAULT_IMAGE_STORE_MB = 50  # on-disk visitor snapshot cap; 0 disables the store
 DEFAULT_VISITOR_ROWS = 5
 DEFAULT_CAR_ROWS = 5
 MAX_VISITOR_ATTRIBUTES = 8  # Limit for state attributes to avoid 16KB cap
 SESSION_TIMEOUT_HOURS = 24  # Consider session expired after this many hours
+HTTP_SOURCE_TIMEOUT_S = 12  # seconds; per-source budget for HTTP fetches in one refresh
+WS_SOURCE_TIMEOUT_S = 12  # seconds; per-source budget for WebSocket status in one refresh
+STATUS_BUDGET_S = 10  # seconds; retries of one status snapshot must fit in this budget
+PUSH_SAFETY_INTERVAL = 300  # seconds; with push active, status is polled only if nothing refreshed it for this long
 
 # Options flow keys
 CONF_UPDATE_INTERVAL = "update_interval"
+CONF_DEVICE_INTERVAL = "device_interval"
+CONF_TELEMETER_INTERVAL = "telemeter_interval"
+CONF_IMAGE_STORE_MB = "image_store_mb"
 CONF_VISITOR_ROWS = "visitor_rows"
 CONF_CAR_ROWS = "car_rows"
 
@@ -39,6 +65,10 @@ TELEMETERING_REFERER = "/cvnet/web/telemetering.view"
 # WebSocket/SockJS
 DEFAULT_WS_BASE = "wss://js-thehue.uasis.com:9099/devicecontrol"
 
+# Vert.x event bus addresses
+HEATER_ADDRESS = "22"
+LIGHT_ADDRESS = "18"
+
 
 def common_headers() -> dict:
     return {
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import unicodedata
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from ..const import CAR_SEARCH_CONCURRENCY, CAR_SEARCH_MAX_PAGES
+from .history import HistoryStore
+
+_LOGGER = logging.getLogger(__name__)
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_SYLLABLES_PER_INITIAL = 21 * 28  # medial vowels x final consonants (incl. none)
+# Compatibility jamo as typed on a keyboard, in the order of the syllable block
+_COMPAT_INITIALS = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_CONJOINING_INITIAL_BASE = 0x1100
+
+DIRECTIONS = {"entered": "0", "exited": "1"}
+
+
+def normalize_plate(value: str) -> str:
+    """NFC-normalise a plate and drop whitespace, as typed plates often differ in both."""
+    return "".join(unicodedata.normalize("NFC", str(value)).split())
+
+
+def _initial_index(char: str) -> Optional[int]:
+    idx = _COMPAT_INITIALS.find(char)
+    if idx >= 0:
+        return idx
+    offset = ord(char) - _CONJOINING_INITIAL_BASE
+    return offset if 0 <= offset < len(_COMPAT_INITIALS) else None
+
+
+def _next(value: str) -> str:
+    return value[:-1] + chr(ord(value[-1]) + 1)
+
+
+def plate_ranges(query: str, exact: bool = False) -> List[Tuple[str, str]]:
+    """Half-open ``[low, high)`` plate ranges matching ``query``.
+
+    A prefix ending in a bare initial consonant (``14ㄹ``) also matches every
+    syllable that starts with it (``14라``..``14릿``), so a plate can be found
+    while its Hangul character is only half typed.
+    """
+    plate = normalize_plate(query)
+    if not plate:
+        return []
+    if exact:
+        return [(plate, plate + "\0")]
+    ranges = [(plate, _next(plate))]
+    idx = _initial_index(plate[-1])
+    if idx is not None:
+        low = _HANGUL_BASE + idx * _SYLLABLES_PER_INITIAL
+        ranges.append((plate[:-1] + chr(low), plate[:-1] + chr(low + _SYLLABLES_PER_INITIAL)))
+    elif _HANGUL_BASE <= ord(plate[-1]) <= _HANGUL_LAST and (ord(plate[-1]) - _HANGUL_BASE) % 28 == 0:
+        # An open syllable may still get a final consonant (러 -> 럭)
+        ranges = [(plate, plate[:-1] + chr(ord(plate[-1]) + 28))]
+    return ranges
+
+
+def normalize_time(value: Any, end: bool = False) -> Optional[str]:
+    """Convert a service time value to the server's ``YYYY-MM-DD HH:MM`` form.
+
+    A bare date as ``end`` covers the whole day.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M")
+    text = str(value).strip().replace("T", " ")
+    if len(text) == 10:
+        return text + (" 23:59" if end else " 00:00")
+    return text[:16]
+
+
+class CarEntrySearch:
+    """Search of car entries over the local history, backfilled from the server.
+
+    ``covered_from`` is the oldest ``date_time`` from which every server entry
+    is known to be in the history (``""`` once the whole feed was read). Only
+    searches reaching past it page the server, in bounded concurrent windows
+    continuing from the first page no earlier backfill has read, until the
+    requested start is reached. New entries only push older ones to later
+    pages, so resuming never skips a row.
+
+    A backfill that hits ``max_pages`` first marks its start as explored:
+    searches reaching no further (or, without a start, another search without
+    one) are then answered locally instead of paging the server again.
+    """
+
+    def __init__(self, history: HistoryStore, fetch_page: Callable[[int], Awaitable[dict]],
+                 max_pages: int = CAR_SEARCH_MAX_PAGES, concurrency: int = CAR_SEARCH_CONCURRENCY) -> None:
+        self.history = history
+        self.covered_from: Optional[str] = None
+        self._fetch_page = fetch_page
+        self._max_pages = max_pages
+        self._concurrency = concurrency
+        self._backfill_lock = asyncio.Lock()
+        self._next_page = 1  # first server page no backfill has read yet
+        self._explored_from: Optional[str] = None  # oldest start of a page-capped backfill
+        self._explored_all = False  # a backfill without a start hit the page cap
+
+    def covers(self, start: Optional[str]) -> bool:
+        if self.covered_from is None:
+            return False
+        return self.covered_from == "" or (start is not None and start >= self.covered_from)
+
+    def explored(self, start: Optional[str]) -> bool:
+        """Whether a page-capped backfill was already run for a search reaching ``start``."""
+        if start is None:
+            return self._explored_all
+        return self._explored_from is not None and start >= self._explored_from
+
+    def note_collected(self, entries: List[dict], contiguous: bool = True) -> None:
+        """Record entries the coordinator's sync collected.
+
+        With ``contiguous`` false the entries may be separated from earlier
+        ones by a gap, so coverage and backfill progress restart at the oldest
+        of them.
+        """
+        dates = [str(item["date_time"]) for item in entries if item.get("date_time")]
+        if not dates:
+            return
+        oldest = min(dates)
+        if not contiguous or self.covered_from is None:
+            self.covered_from = oldest
+            self._next_page = 1
+            self._explored_from = None
+            self._explored_all = False
+
+    async def async_search(self, plate: Optional[str] = None, exact: bool = False,
+                           direction: Optional[str] = None, start: Optional[str] = None,
+                           end: Optional[str] = None, limit: int = 20) -> Dict[str, Any]:
+        ranges = plate_ranges(plate, exact) if plate else None
+        inout = DIRECTIONS[direction] if direction else None
+        query = dict(start=start, end=end, plate_ranges=ranges, direction=inout, limit=limit)
+        await self.history.async_flush()  # make rows queued by the last poll visible
+        entries = await self.history.async_car_entries(**query)
+        pages = 0
+        if len(entries) < limit and not self.covers(start) and not self.explored(start):
+            pages = await self._async_backfill(start)
+            entries = await self.history.async_car_entries(**query)
+        for item in entries:
+            item["direction"] = "entered" if item.get("inout") == DIRECTIONS["entered"] else "exited"
+        return {"entries": entries, "server_pages": pages, "complete": self.covers(start)}
+
+    async def _async_backfill(self, start: Optional[str]) -> int:
+        """Page the server back to ``start`` into the history; returns pages read."""
+        async with self._backfill_lock:
+            if self.covers(start) or self.explored(start):
+                return 0
+            oldest: Optional[str] = None
+            reached_end = reached_start = False
+            first = self._next_page
+            last = first + self._max_pages - 1
+            page_no = first - 1
+            while page_no < last and not reached_end and not reached_start:
+                window = range(page_no + 1, min(page_no + self._concurrency, last) + 1)
+                pages = await asyncio.gather(*(self._fetch_page(n) for n in window))
+                if any(_is_error_page(page) for page in pages):
+                    # An error reply looks like an empty last page: keep coverage and progress as they were
+                    _LOGGER.warning("Car entry search got an error page from the server; backfill aborted")
+                    await self.history.async_flush()
+                    return window[-1] - first + 1
+                page_no = window[-1]
+                for page in pages:
+                    contents = page.get("contents") or []
+                    self.history.add_car_entries(contents)
+                    dates = [str(item["date_time"]) for item in contents if item.get("date_time")]
+                    if dates:
+                        oldest = min(dates) if oldest is None else min(oldest, *dates)
+                    if not contents or not page.get("exist_next"):
+                        reached_end = True
+                reached_start = start is not None and oldest is not None and oldest < start
+            await self.history.async_flush()
+            self._next_page = page_no + 1
+            if reached_end:
+                self.covered_from = ""
+            elif oldest is not None and (self.covered_from is None or oldest < self.covered_from):
+                self.covered_from = oldest
+            if not reached_end and not reached_start:
+                _LOGGER.info("Car entry search stopped after %d server pages", page_no - first + 1)
+                if start is None:
+                    self._explored_all = True
+                elif self._explored_from is None or start < self._explored_from:
+                    self._explored_from = start
+            return page_no - first + 1
+
+
+def _is_error_page(page: dict) -> bool:
+    """Whether a page is the client's error reply (``result`` 0) rather than real data."""
+    return str(page.get("result", "1")).lower() in ("0", "fail", "false")
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from ..const import CAR_HISTORY_MAX, CAR_SYNC_MAX_PAGES, CAR_SYNC_PAGE_ROWS
+from .seen import RecentlySeen
+
+_LOGGER = logging.getLogger(__name__)
+
+CarKey = Tuple[str, str]  # (date_time, plate)
+
+
+def car_key(item: dict) -> Optional[CarKey]:
+    title, dt = item.get("title"), item.get("date_time")
+    if not title or not dt:
+        return None
+    return (str(dt), str(title))
+
+
+class CarEntrySync:
+    """Incremental sync of the entrance-car feed against a local high-water mark.
+
+    The server lists entries newest first. Each sync reads page 1 and stops at
+    the first entry it already knows (or one older than the cursor), so a
+    steady-state poll reads one page. When page 1 holds nothing known, the gap
+    is caught up with larger pages; progress is kept per page, so a catch-up
+    cut short by a timeout resumes on the next sync. The known keys and cursor
+    can be saved with ``as_dict`` and restored, so a restart catches up instead
+    of re-baselining.
+    """
+
+    def __init__(self, max_history: int = CAR_HISTORY_MAX, max_pages: int = CAR_SYNC_MAX_PAGES,
+                 catchup_rows: int = CAR_SYNC_PAGE_ROWS) -> None:
+        self.seen = RecentlySeen(max_history)
+        self.cursor: Optional[CarKey] = None
+        self.first_page: Optional[dict] = None  # last page 1 response, reused for display
+        self._max_pages = max_pages
+        self._catchup_rows = catchup_rows
+        self._synced = False
+        self.truncated = False  # last sync stopped at max_pages, leaving a gap
+        # Catch-up in progress: entries collected so far and the next page to read
+        self._pending: Dict[CarKey, dict] = {}
+        self._catchup_page = 0
+
+    @property
+    def synced(self) -> bool:
+        return self._synced
+
+    @property
+    def catching_up(self) -> bool:
+        return self._catchup_page > 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"cursor": list(self.cursor) if self.cursor else None, "seen": [list(key) for key in self.seen]}
+
+    def restore(self, data: Dict[str, Any]) -> None:
+        """Restore state saved by ``as_dict``; the next sync then reports entries missed meanwhile."""
+        self.seen = RecentlySeen(self.seen.maxlen, (tuple(key) for key in data.get("seen") or []))
+        cursor = data.get("cursor")
+        self.cursor = tuple(cursor) if cursor else None
+        self._synced = self.cursor is not None
+
+    async def async_sync(self, fetch_page: Callable[[int, int], Awaitable[dict]], rows: int) -> List[dict]:
+        """Fetch entries newer than the cursor and return them oldest first.
+
+        ``fetch_page(page_no, rows)`` reads one page; page 1 is read with
+        ``rows`` so it can be reused for display, catch-up pages with the
+        larger catch-up size. The first sync only records page 1 as the
+        baseline and returns nothing. A failed page fetch propagates; cursor
+        and seen keys only change once a catch-up has completed.
+        """
+        baseline = not self._synced
+        self.truncated = False
+        page = await fetch_page(1, rows)
+        self.first_page = page
+        reached_known = self._collect(page)
+        if baseline:
+            return self._commit(report=False)
+        if not self._catchup_page:
+            if reached_known or not page.get("exist_next"):
+                return self._commit()
+            self._catchup_page = 1
+        while True:
+            page = await fetch_page(self._catchup_page, self._catchup_rows)
+            if self._collect(page) or not page.get("exist_next"):
+                break
+            if self._catchup_page >= self._max_pages:
+                _LOGGER.warning("Car entry sync stopped after %d pages; older entries may be missing", self._catchup_page)
+                self.truncated = True
+                break
+            self._catchup_page += 1
+        return self._commit()
+
+    def _collect(self, page: dict) -> bool:
+        """Add a page's unknown entries to the pending batch; True once a known entry is met."""
+        for item in page.get("contents") or []:
+            key = car_key(item)
+            if key is None or key in self._pending:
+                continue
+            if key in self.seen or (self.cursor is not None and key[0] < self.cursor[0]):
+                return True
+            self._pending[key] = item
+        return False
+
+    def _commit(self, report: bool = True) -> List[dict]:
+        keys = sorted(self._pending)  # (date_time, plate) sorts oldest first
+        for key in keys:
+            self.seen.add(key)
+        if keys and (self.cursor is None or keys[-1] > self.cursor):
+            self.cursor = keys[-1]
+        entries = [self._pending[key] for key in keys]
+        self._pending = {}
+        self._catchup_page = 0
+        self._synced = True
+        return entries if report else []
@@ -7,7 +7,9 @@ from homeassistant.helpers import aiohttp_client
 from ..const import (
     DOMAIN,
     CONF_UPDATE_INTERVAL, CONF_VISITOR_ROWS, CONF_CAR_ROWS,
+    CONF_DEVICE_INTERVAL, CONF_TELEMETER_INTERVAL, CONF_IMAGE_STORE_MB,
     DEFAULT_UPDATE_INTERVAL, DEFAULT_VISITOR_ROWS, DEFAULT_CAR_ROWS,
+    DEFAULT_DEVICE_INTERVAL, DEFAULT_TELEMETER_INTERVAL, DEFAULT_IMAGE_STORE_MB,
 )
 from ..api.client import Client, LoginError, ValidationError, ConnectionError
 
@@ -72,6 +74,14 @@ class OptionsFlow(config_entries.OptionsFlow):
                 CONF_UPDATE_INTERVAL,
                 default=current.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
             ): vol.All(int, vol.Range(min=5, max=300)),
+            vol.Optional(
+                CONF_DEVICE_INTERVAL,
+                default=current.get(CONF_DEVICE_INTERVAL, DEFAULT_DEVICE_INTERVAL),
+            ): vol.All(int, vol.Range(min=5, max=300)),
+            vol.Optional(
+                CONF_TELEMETER_INTERVAL,
+                default=current.get(CONF_TELEMETER_INTERVAL, DEFAULT_TELEMETER_INTERVAL),
+            ): vol.All(int, vol.Range(min=60, max=3600)),
             vol.Optional(
                 CONF_VISITOR_ROWS,
                 default=current.get(CONF_VISITOR_ROWS, DEFAULT_VISITOR_ROWS),
@@ -80,5 +90,9 @@ class OptionsFlow(config_entries.OptionsFlow):
                 CONF_CAR_ROWS,
                 default=current.get(CONF_CAR_ROWS, DEFAULT_CAR_ROWS),
             ): vol.All(int, vol.Range(min=1, max=50)),
+            vol.Optional(
+                CONF_IMAGE_STORE_MB,
+                default=current.get(CONF_IMAGE_STORE_MB, DEFAULT_IMAGE_STORE_MB),
+            ): vol.All(int, vol.Range(min=0, max=2000)),
         })
         return self.async_show_form(step_id="init", data_schema=schema)
@@ -1,35 +1,150 @@
 from __future__ import annotations
+import abc
+import asyncio
+import hashlib
+import itertools
+import json
 import logging
 import time
 from datetime import timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Dict, FrozenSet, List, Optional
 
 from homeassistant.const import CONF_USERNAME, CONF_PASSWORD
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.ssl import client_context
 from homeassistant.components.persistent_notification import async_create as pn_async_create
 
 from ..const import (
     DOMAIN, DEFAULT_UPDATE_INTERVAL, DEFAULT_VISITOR_ROWS, DEFAULT_CAR_ROWS,
     CONF_UPDATE_INTERVAL, CONF_VISITOR_ROWS, CONF_CAR_ROWS,
+    CONF_DEVICE_INTERVAL, CONF_TELEMETER_INTERVAL, CONF_IMAGE_STORE_MB,
+    DEFAULT_DEVICE_INTERVAL, DEFAULT_TELEMETER_INTERVAL, DEFAULT_IMAGE_STORE_MB,
+    HEATER_ADDRESS, LIGHT_ADDRESS, PUSH_SAFETY_INTERVAL,
+    HTTP_SOURCE_TIMEOUT_S, WS_SOURCE_TIMEOUT_S,
+    IMAGE_PREFETCH_CONCURRENCY, IMAGE_PREFETCH_WAIT_S, CAR_SEARCH_PAGE_ROWS,
+    SEEN_VISITORS_MAX, SEEN_SAVE_DELAY_S, SEEN_STORE_VERSION,
 )
 from ..api.client import Client, LoginError, ApiError, ConnectionError
+from .car_search import CarEntrySearch
+from .car_sync import CarEntrySync
+from .history import HistoryStore
+from .image_store import VisitorImageStore
+from .seen import RecentlySeen
+from .zones import HeaterZone, LightZone, parse_heater_zones, parse_light_zones
 
 _LOGGER = logging.getLogger(__name__)
 
-class CvnetCoordinator(DataUpdateCoordinator[dict]):
-    def __init__(self, hass: HomeAssistant, entry) -> None:
-        interval = entry.options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+class _CvnetBaseCoordinator(DataUpdateCoordinator[dict], abc.ABC):
+    """Shared refresh plumbing for the per-source coordinators."""
+
+    def __init__(self, hass: HomeAssistant, name: str, interval: int) -> None:
         super().__init__(
             hass,
             _LOGGER,
-            name="cvnet",
+            name=name,
             update_interval=timedelta(seconds=interval)
         )
         self.hass = hass
+        # Refresh cycle metrics
+        self._last_cycle_seconds: Optional[float] = None
+        self._cycle_overruns = 0
+        # Per-source change detection; None means every source counts as changed
+        self._digests: Dict[str, str] = {}
+        self._changed_sources: Optional[FrozenSet[str]] = None
+        self._last_available: Optional[bool] = None
+        self._skipped_updates = 0
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify listeners only when a source digest or availability changed."""
+        changed = self._update_digests(self.data)
+        available = getattr(self, "last_update_success", True)
+        if available != self._last_available:
+            self._last_available = available
+            self._changed_sources = None
+        elif changed:
+            self._changed_sources = frozenset(changed)
+        else:
+            self._skipped_updates += 1
+            return
+        super().async_update_listeners()
+
+    def source_changed(self, *sources: str) -> bool:
+        """Return True if any of the given data keys changed in the last notification."""
+        if self._changed_sources is None:
+            return True
+        return any(source in self._changed_sources for source in sources)
+
+    def invalidate_source(self, source: str) -> None:
+        """Forget a source digest so the next update notifies its listeners.
+
+        Entities call this after an optimistic local change, so server data that
+        did not move still gets a chance to correct them.
+        """
+        self._digests.pop(source, None)
+
+    def _update_digests(self, data: Optional[dict]) -> List[str]:
+        changed = []
+        for key, value in (data or {}).items():
+            digest = _digest(value)
+            if self._digests.get(key) != digest:
+                self._digests[key] = digest
+                changed.append(key)
+        return changed
+
+    async def _async_update_data(self) -> dict:
+        started = time.monotonic()
+        try:
+            return await self._async_update_cycle()
+        finally:
+            self._record_cycle(time.monotonic() - started)
+
+    @abc.abstractmethod
+    async def _async_update_cycle(self) -> dict:
+        """Fetch this source's data; timed by ``_async_update_data``."""
+
+    def _record_cycle(self, duration: float) -> None:
+        """Track cycle duration and count cycles that overran the update interval."""
+        self._last_cycle_seconds = duration
+        interval = self.update_interval.total_seconds() if self.update_interval else None
+        if interval and duration > interval:
+            self._cycle_overruns += 1
+            _LOGGER.warning("%s refresh took %.1fs, longer than the %ss update interval", self.name, duration, interval)
+
+    async def _async_run_source(self, label: str, coro: Awaitable[Any], timeout: float, default: Any) -> Any:
+        """Await one source with its own timeout so a slow endpoint cannot stall the cycle."""
+        try:
+            return await asyncio.wait_for(coro, timeout=timeout)
+        except asyncio.TimeoutError:
+            _LOGGER.warning("%s timed out after %ss during update", label, timeout)
+        except Exception as err:
+            _LOGGER.error("Unexpected error during %s update: %s", label, err)
+        return default
+
+
+class CvnetCoordinator(_CvnetBaseCoordinator):
+    """Visitor and car entry source.
+
+    Owns the client, login and notification state, and the separately
+    scheduled ``devices`` (heaters/lights) and ``telemeter`` coordinators.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry) -> None:
+        super().__init__(hass, "cvnet", entry.options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL))
         self.entry = entry
-        self.client = Client(async_get_clientsession(hass))
+        # Own connection pool instead of HA's shared session, closed in async_close
+        self.client = Client(ssl_context=client_context())
+        self.image_store = VisitorImageStore(
+            hass,
+            hass.config.path(DOMAIN, "visitor_images"),
+            entry.options.get(CONF_IMAGE_STORE_MB, DEFAULT_IMAGE_STORE_MB) * 1024 * 1024,
+        )
+        self.client.image_store = self.image_store
+        self.history = HistoryStore(hass, hass.config.path(DOMAIN, "history.db"))
+        self._prefetch_semaphore = asyncio.Semaphore(IMAGE_PREFETCH_CONCURRENCY)
+        self._prefetch_tasks: set = set()
         self._visitor_list = []
         self._selected = None
         # Visitor pagination
@@ -41,10 +156,23 @@ class CvnetCoordinator(DataUpdateCoordinator[dict]):
         self._car_page_no = 1
         self._car_exist_next = False
         self._car_contents = []
-        # Tracking for new visitor/car notifications
-        self._seen_visitors: set[str] = set()
-        self._seen_cars: set[str] = set()  # Track by "title_datetime" composite key
+        # Tracking for new visitor/car notifications, persisted so a restart
+        # reports arrivals missed while Home Assistant was down
+        self._seen_visitors = RecentlySeen(SEEN_VISITORS_MAX)
+        self._seen_store = Store(hass, SEEN_STORE_VERSION, f"{DOMAIN}.{entry.entry_id}.seen")
+        self._seen_loaded = False
+        self._seen_saved_version: tuple = (0, 0)
+        self._car_sync = CarEntrySync()
+        self._new_car_entries: List[dict] = []
+        self.car_search = CarEntrySearch(
+            self.history,
+            lambda page_no: self.client.async_entrancecar_list(page_no=page_no, rows=CAR_SEARCH_PAGE_ROWS),
+        )
         self._first_run: bool = True
+        # Sources refreshed on their own schedules share one login
+        self._login_lock = asyncio.Lock()
+        self.devices = CvnetDeviceCoordinator(hass, self)
+        self.telemeter = CvnetTelemeterCoordinator(hass, self)
 
     async def async_prime_visitors(self) -> None:
         try:
@@ -55,24 +183,34 @@ class CvnetCoordinator(DataUpdateCoordinator[dict]):
         except Exception as err:
             _LOGGER.debug("visitor_list failed during prime: %s", err)
 
-    async def _async_update_data(self) -> dict:
-        """Fetch data from CVNET API.
-        
-        Returns:
-            Dictionary containing visitor and car entry data
-            
+    @property
+    def sources(self) -> List[_CvnetBaseCoordinator]:
+        """All coordinators of this entry, each with its own refresh interval."""
+        return [self, self.devices, self.telemeter]
+
+    async def async_request_refresh_all(self) -> None:
+        for source in self.sources:
+            await source.async_request_refresh()
+
+    async def async_ensure_login(self) -> None:
+        """Log in with the entry's credentials if the client has none yet.
+
         Raises:
-            UpdateFailed: If critical data update fails
+            UpdateFailed: If credentials are missing or the login fails
         """
         username = self.entry.data.get(CONF_USERNAME)
         password = self.entry.data.get(CONF_PASSWORD)
         if not username or not password:
             raise UpdateFailed("Missing credentials in config entry")
 
-        if not self.client.has_credentials:
+        async with self._login_lock:
+            if self.client.has_credentials:
+                return
             try:
                 await self.client.async_login(username, password)
                 _LOGGER.debug("Initial login successful")
+                # Refresh the session in the background before the server expires it
+                self.client.start_keepalive()
             except LoginError as e:
                 _LOGGER.warning("cvnet initial login failed during update: %s", e)
                 raise UpdateFailed(f"Initial login failed: {e}")
@@ -80,76 +218,24 @@ class CvnetCoordinator(DataUpdateCoordinator[dict]):
                 _LOGGER.warning("cvnet initial connection failed during update: %s", e)
                 raise UpdateFailed(f"Initial connection failed: {e}")
 
-        visitor_success = False
-        car_success = False
-
-        try:
-            data = await self.client.async_visitor_list(page_no=self._visitor_page_no, rows=self._visitor_rows)
-            self._visitor_list = data or []
-            if self._visitor_list and (self._selected is None or self._selected not in [i.get("file_name") for i in self._visitor_list]):
-                self._selected = self._visitor_list[0].get("file_name")
-            self._visitor_exist_next = len(self._visitor_list) >= self._visitor_rows
-            visitor_success = True
-            _LOGGER.debug("Visitor list updated successfully: %d items", len(self._visitor_list))
-        except (ApiError, ConnectionError) as err:
-            _LOGGER.warning("visitor_list failed during update: %s", err)
-        except Exception as err:
-            _LOGGER.error("Unexpected error during visitor_list update: %s", err)
-
-        try:
-            car = await self.client.async_entrancecar_list(page_no=self._car_page_no, rows=self._car_rows)
-            self._car_contents = car.get("contents", [])
-            try:
-                self._car_page_no = int(str(car.get("page_no") or self._car_page_no).lstrip("0") or "1")
-            except (ValueError, TypeError):
-                self._car_page_no = max(1, self._car_page_no)
-            try:
-                self._car_rows = int(str(car.get("rows") or self._car_rows))
-            except (ValueError, TypeError):
-                pass
-            self._car_exist_next = bool(car.get("exist_next", False))
-            car_success = True
-            _LOGGER.debug("Car entries updated successfully: %d items", len(self._car_contents))
-        except (ApiError, ConnectionError) as err:
-            _LOGGER.warning("entrancecar_list failed during update: %s", err)
-        except Exception as err:
-            _LOGGER.error("Unexpected error during entrancecar_list update: %s", err)
-
-        heater_data = {}
-        try:
-            heater_data = await self.client.async_status_snapshot("22")
-            if heater_data:
-                _LOGGER.debug("Heater status updated: %d rooms", len(heater_data.get("body", {}).get("contents", [])))
-            else:
-                _LOGGER.debug("Heater status_snapshot returned empty data")
-        except (ApiError, ConnectionError) as err:
-            _LOGGER.warning("heater status_snapshot failed during update: %s", err)
-        except Exception as err:
-            _LOGGER.warning("heater status_snapshot error: %s", err)
-
-        light_data = {}
-        try:
-            light_data = await self.client.async_status_snapshot("18")
-            if light_data:
-                _LOGGER.debug("Light status updated successfully")
-            else:
-                _LOGGER.debug("Light status_snapshot returned empty data")
-        except (ApiError, ConnectionError) as err:
-            _LOGGER.warning("light status_snapshot failed during update: %s", err)
-        except Exception as err:
-            _LOGGER.warning("light status_snapshot error: %s", err)
-
-        telemeter_data = {}
-        try:
-            telemeter_data = await self.client.async_telemetering()
-            if telemeter_data:
-                _LOGGER.debug("Telemeter data updated successfully")
-            else:
-                _LOGGER.debug("Telemeter data returned empty")
-        except (ApiError, ConnectionError) as err:
-            _LOGGER.warning("telemetering failed during update: %s", err)
-        except Exception as err:
-            _LOGGER.warning("telemetering unexpected error: %s", err)
+    async def _async_update_cycle(self) -> dict:
+        """Fetch visitor and car entry data from CVNET API.
+        
+        Returns:
+            Dictionary containing visitor and car entry data
+            
+        Raises:
+            UpdateFailed: If critical data update fails
+        """
+        await self.async_ensure_login()
+        if not self._seen_loaded:
+            await self._async_load_seen()
+
+        # Independent sources run concurrently, each bounded by its own timeout
+        visitor_success, car_success = await asyncio.gather(
+            self._async_run_source("visitor_list", self._async_fetch_visitors(), HTTP_SOURCE_TIMEOUT_S, False),
+            self._async_run_source("entrancecar_list", self._async_fetch_cars(), HTTP_SOURCE_TIMEOUT_S, False),
+        )
 
         if not visitor_success and not car_success:
             _LOGGER.error("Both visitor and car data updates failed - this may indicate session expiration or connectivity issues")
@@ -158,15 +244,16 @@ class CvnetCoordinator(DataUpdateCoordinator[dict]):
 
         # Check for new visitors and fire notifications
         if visitor_success:
+            self.history.add_visitors(self._visitor_list)
             await self._check_new_visitors()
 
         # Check for new car entries and fire notifications
         if car_success:
-            await self._check_new_car_entries()
+            self.history.add_car_entries(itertools.chain(self._new_car_entries, self._car_contents))
+            await self._check_new_car_entries(self._new_car_entries)
 
-        # Mark first run as complete
-        if self._first_run:
-            self._first_run = False
+        if self._seen_version() != self._seen_saved_version:
+            self._seen_store.async_delay_save(self._seen_data, SEEN_SAVE_DELAY_S)
 
         return {
             "ok": True,
@@ -183,11 +270,58 @@ class CvnetCoordinator(DataUpdateCoordinator[dict]):
                 "rows": self._car_rows,
                 "exist_next": self._car_exist_next,
             },
-            "heaters": heater_data,
-            "lights": light_data,
-            "telemeter": telemeter_data,
         }
 
+    # ---------- Per-source fetchers ----------
+    async def _async_fetch_visitors(self) -> bool:
+        try:
+            data = await self.client.async_visitor_list(page_no=self._visitor_page_no, rows=self._visitor_rows)
+            self._visitor_list = data or []
+            if self._visitor_list and (self._selected is None or self._selected not in [i.get("file_name") for i in self._visitor_list]):
+                self._selected = self._visitor_list[0].get("file_name")
+            self._visitor_exist_next = len(self._visitor_list) >= self._visitor_rows
+            _LOGGER.debug("Visitor list updated successfully: %d items", len(self._visitor_list))
+            return True
+        except (ApiError, ConnectionError) as err:
+            _LOGGER.warning("visitor_list failed during update: %s", err)
+        except Exception as err:
+            _LOGGER.error("Unexpected error during visitor_list update: %s", err)
+        return False
+
+    async def _async_fetch_cars(self) -> bool:
+        try:
+            baseline = not self._car_sync.synced
+            self._new_car_entries = await self._car_sync.async_sync(
+                lambda page_no, rows: self.client.async_entrancecar_list(page_no=page_no, rows=rows),
+                self._car_rows,
+            )
+            if baseline:
+                self.car_search.note_collected((self._car_sync.first_page or {}).get("contents") or [])
+            else:
+                self.car_search.note_collected(self._new_car_entries, contiguous=not self._car_sync.truncated)
+            if self._car_page_no == 1 and self._car_sync.first_page is not None:
+                # The sync already fetched page 1
+                car = self._car_sync.first_page
+            else:
+                car = await self.client.async_entrancecar_list(page_no=self._car_page_no, rows=self._car_rows)
+            self._car_contents = car.get("contents", [])
+            try:
+                self._car_page_no = int(str(car.get("page_no") or self._car_page_no).lstrip("0") or "1")
+            except (ValueError, TypeError):
+                self._car_page_no = max(1, self._car_page_no)
+            try:
+                self._car_rows = int(str(car.get("rows") or self._car_rows))
+            except (ValueError, TypeError):
+                pass
+            self._car_exist_next = bool(car.get("exist_next", False))
+            _LOGGER.debug("Car entries updated successfully: %d items", len(self._car_contents))
+            return True
+        except (ApiError, ConnectionError) as err:
+            _LOGGER.warning("entrancecar_list failed during update: %s", err)
+        except Exception as err:
+            _LOGGER.error("Unexpected error during entrancecar_list update: %s", err)
+        return False
+
     # Visitor pagination controls
     async def async_visitor_set_rows(self, rows: int) -> None:
         if rows <= 0:
@@ -268,85 +402,351 @@ class CvnetCoordinator(DataUpdateCoordinator[dict]):
         }
         if last_req:
             info["last_successful_ago_hours"] = (time.time() - last_req) / 3600
+        info["last_cycle_seconds"] = {
+            source.name: round(source._last_cycle_seconds, 2)
+            for source in self.sources
+            if source._last_cycle_seconds is not None
+        }
+        info["cycle_overruns"] = sum(source._cycle_overruns for source in self.sources)
+        info["skipped_updates"] = sum(source._skipped_updates for source in self.sources)
+        stats = self.client.stats
+        info["session_lifetime_hours"] = round(self.client.session_lifetime / 3600, 2)
+        info["keepalive_refreshes"] = stats.get("keepalive_refreshes", 0)
+        info["status_budget_exhausted"] = stats.get("status_budget_exhausted", 0)
+        info["commands_unconfirmed"] = stats.get("commands_unconfirmed", 0)
+        info["command_latency"] = stats.get("command_latency", {})
+        info["image_cache"] = stats.get("image_cache", {})
+        info["connections"] = {
+            key: stats.get(key, 0)
+            for key in ("connections_created", "connections_reused", "dns_lookups", "dns_cache_hits")
+        }
         return info
 
     def apply_options(self, options: dict) -> None:
-        """Apply new options without recreating the coordinator."""
+        """Apply new options without recreating the coordinators."""
         interval = options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
         self.update_interval = timedelta(seconds=interval)
+        self.devices.update_interval = timedelta(
+            seconds=options.get(CONF_DEVICE_INTERVAL, DEFAULT_DEVICE_INTERVAL)
+        )
+        self.telemeter.update_interval = timedelta(
+            seconds=options.get(CONF_TELEMETER_INTERVAL, DEFAULT_TELEMETER_INTERVAL)
+        )
         self._visitor_rows = options.get(CONF_VISITOR_ROWS, DEFAULT_VISITOR_ROWS)
         self._car_rows = options.get(CONF_CAR_ROWS, DEFAULT_CAR_ROWS)
+        self.image_store.set_max_bytes(options.get(CONF_IMAGE_STORE_MB, DEFAULT_IMAGE_STORE_MB) * 1024 * 1024)
         self._visitor_page_no = 1
         self._car_page_no = 1
 
     async def async_close(self) -> None:
+        for task in self._prefetch_tasks:
+            task.cancel()
+        self.devices.async_stop_push()
+        if self._seen_loaded and self._seen_version() != self._seen_saved_version:
+            try:
+                await self._seen_store.async_save(self._seen_data())
+            except Exception as err:
+                _LOGGER.debug("Saving seen state failed: %s", err)
+        try:
+            await self.history.async_close()
+        except Exception as err:
+            _LOGGER.debug("Closing history store failed: %s", err)
         try:
             await self.client.async_close()
         except Exception:
             pass
 
+    # ---------- Seen state ----------
+    async def _async_load_seen(self) -> None:
+        self._seen_loaded = True
+        try:
+            data = await self._seen_store.async_load()
+        except Exception as err:
+            _LOGGER.warning("Loading seen visitor/car state failed, starting fresh: %s", err)
+            data = None
+        if not data:
+            return
+        visitors = data.get("visitors") or []
+        self._seen_visitors = RecentlySeen(SEEN_VISITORS_MAX, visitors)
+        if visitors:
+            self._first_run = False
+        self._car_sync.restore(data.get("cars") or {})
+        self._seen_saved_version = self._seen_version()
+
+    def _seen_version(self) -> tuple:
+        return (self._seen_visitors.version, self._car_sync.seen.version)
+
+    def _seen_data(self) -> dict:
+        self._seen_saved_version = self._seen_version()
+        return {"visitors": list(self._seen_visitors), "cars": self._car_sync.as_dict()}
+
     async def _check_new_visitors(self) -> None:
         """Check for new visitors and fire events/notifications."""
-        current = {v.get("file_name") for v in self._visitor_list if v.get("file_name")}
-
-        if not self._first_run:
-            new_visitors = current - self._seen_visitors
-            for file_name in new_visitors:
-                # Find visitor data
-                visitor_data = next(
-                    (v for v in self._visitor_list if v.get("file_name") == file_name),
-                    None
-                )
-                if visitor_data:
-                    _LOGGER.info("New visitor detected: %s", file_name)
-                    # Select the new visitor so the camera shows their image
-                    self._selected = file_name
-                    # Fire event
-                    self.hass.bus.async_fire("cvnet_new_visitor", {
-                        "file_name": file_name,
-                        "date_time": visitor_data.get("date_time"),
-                        "title": visitor_data.get("title"),
-                    })
-                    # Create persistent notification
-                    pn_async_create(
-                        self.hass,
-                        f"Visitor at {visitor_data.get('date_time', 'unknown time')}",
-                        title="New Visitor",
-                        notification_id=f"cvnet_visitor_{file_name}",
-                    )
-
-        self._seen_visitors = current
-
-    async def _check_new_car_entries(self) -> None:
-        """Check for new car entries and fire events/notifications."""
-        current_map = {}
-        for c in self._car_contents:
-            title, dt = c.get("title"), c.get("date_time")
-            if title and dt:
-                current_map[f"{title}_{dt}"] = c
-        current = set(current_map)
-
-        if not self._first_run:
-            new_cars = current - self._seen_cars
-            for car_key in new_cars:
-                car_data = current_map.get(car_key)
-                if car_data:
-                    inout = "entered" if car_data.get("inout") == "0" else "exited"
-                    plate = car_data.get("title")
-                    date_time = car_data.get("date_time")
-                    _LOGGER.info("Car %s: %s at %s", inout, plate, date_time)
-                    # Fire event
-                    self.hass.bus.async_fire("cvnet_car_entry", {
-                        "plate": plate,
-                        "date_time": date_time,
-                        "direction": inout,
-                    })
-                    # Create persistent notification
-                    pn_async_create(
-                        self.hass,
-                        f"{plate} {inout} at {date_time}",
-                        title=f"Car {inout.title()}",
-                        notification_id=f"cvnet_car_{car_key.replace(' ', '_')}",
-                    )
-
-        self._seen_cars = current
+        # The list is newest first; report arrivals oldest first
+        new_visitors = self._seen_visitors.add_new(reversed(self._visitor_list), _visitor_key)
+        if self._first_run:
+            # Nothing persisted yet: the current list is the baseline
+            self._first_run = False
+            return
+
+        # Fetch images first so they are local by the time the event fires
+        prefetches = [(visitor, self._start_prefetch(visitor["file_name"])) for visitor in new_visitors]
+        if prefetches:
+            await asyncio.wait([task for _, task in prefetches], timeout=IMAGE_PREFETCH_WAIT_S)
+        for visitor, task in prefetches:
+            file_name = visitor["file_name"]
+            _LOGGER.info("New visitor detected: %s", file_name)
+            # Select the new visitor so the camera shows their image
+            self._selected = file_name
+            # Fire event
+            payload = {
+                "file_name": file_name,
+                "date_time": visitor.get("date_time"),
+                "title": visitor.get("title"),
+                "image_ready": _prefetch_ready(task),
+            }
+            self.hass.bus.async_fire("cvnet_new_visitor", payload)
+            # Create persistent notification
+            pn_async_create(
+                self.hass,
+                f"Visitor at {payload['date_time'] or 'unknown time'}",
+                title="New Visitor",
+                notification_id=f"cvnet_visitor_{file_name}",
+            )
+
+    def _start_prefetch(self, file_name: str) -> asyncio.Task:
+        """Fetch a snapshot in the background; it keeps running past the event wait."""
+        task = asyncio.ensure_future(self._async_prefetch_image(file_name))
+        self._prefetch_tasks.add(task)
+        task.add_done_callback(self._prefetch_tasks.discard)
+        return task
+
+    async def _async_prefetch_image(self, file_name: str) -> bool:
+        async with self._prefetch_semaphore:
+            try:
+                return bool(await self.client.async_visitor_image_bytes(file_name))
+            except Exception as err:
+                _LOGGER.debug("Image prefetch failed for %s: %s", file_name, err)
+                return False
+
+    async def _check_new_car_entries(self, new_entries: List[dict]) -> None:
+        """Fire events/notifications for car entries the sync has not seen before."""
+        for car_data in new_entries:
+            plate = car_data.get("title")
+            date_time = car_data.get("date_time")
+            if not plate or not date_time:
+                continue
+            inout = "entered" if car_data.get("inout") == "0" else "exited"
+            _LOGGER.info("Car %s: %s at %s", inout, plate, date_time)
+            # Fire event
+            self.hass.bus.async_fire("cvnet_car_entry", {"plate": plate, "date_time": date_time, "direction": inout})
+            # Create persistent notification
+            pn_async_create(
+                self.hass,
+                f"{plate} {inout} at {date_time}",
+                title=f"Car {inout.title()}",
+                notification_id=f"cvnet_car_{plate}_{date_time.replace(' ', '_')}",
+            )
+
+
+class CvnetDeviceCoordinator(_CvnetBaseCoordinator):
+    """Heater and light status, updated by push frames with polling as a safety net."""
+
+    def __init__(self, hass: HomeAssistant, hub: CvnetCoordinator) -> None:
+        super().__init__(
+            hass, "cvnet_devices",
+            hub.entry.options.get(CONF_DEVICE_INTERVAL, DEFAULT_DEVICE_INTERVAL),
+        )
+        self.hub = hub
+        self._status: Dict[str, dict] = {HEATER_ADDRESS: {}, LIGHT_ADDRESS: {}}
+        # Monotonic time of the last status per address, from a push frame or a poll
+        self._last_status: Dict[str, float] = {}
+        self._push_unsubs: List = []
+        self._push_active = False
+        # Addresses a push frame has actually arrived on; only these may skip polls
+        self._pushed: set = set()
+        # Set by requested refreshes (commands, services) so the next cycle always polls
+        self._force_poll = False
+        # Per-number zone indexes, rebuilt only when a status slice changes
+        self.heater_zones: Dict[str, HeaterZone] = {}
+        self.light_zones: Dict[str, LightZone] = {}
+        self._zone_digests: Dict[str, str] = {}
+
+    @property
+    def client(self) -> Client:
+        return self.hub.client
+
+    def heater_zone(self, number: str) -> Optional[HeaterZone]:
+        return self.heater_zones.get(number)
+
+    def light_zone(self, number: str) -> Optional[LightZone]:
+        return self.light_zones.get(number)
+
+    def _set_status(self, address: str, status: dict) -> None:
+        self._status[address] = status
+        digest = _digest(status)
+        if self._zone_digests.get(address) == digest:
+            return
+        self._zone_digests[address] = digest
+        if address == HEATER_ADDRESS:
+            self.heater_zones = parse_heater_zones(status)
+        elif address == LIGHT_ADDRESS:
+            self.light_zones = parse_light_zones(status)
+
+    async def async_request_refresh(self) -> None:
+        """Request a refresh that polls status even while push keeps it fresh."""
+        self._force_poll = True
+        await super().async_request_refresh()
+
+    async def _async_update_cycle(self) -> dict:
+        await self.hub.async_ensure_login()
+        force, self._force_poll = self._force_poll, False
+        await asyncio.gather(
+            self._async_run_source("heater status", self._async_status_slice(HEATER_ADDRESS, "heater", force),
+                                   WS_SOURCE_TIMEOUT_S, None),
+            self._async_run_source("light status", self._async_status_slice(LIGHT_ADDRESS, "light", force),
+                                   WS_SOURCE_TIMEOUT_S, None),
+        )
+        return self._snapshot()
+
+    # ---------- Push-driven heater/light status ----------
+    async def _async_ensure_push(self) -> None:
+        """Subscribe to status frames and keep the shared socket registered."""
+        if not self._push_unsubs:
+            self._push_unsubs = [
+                self.client.add_status_listener(address, self._handle_push)
+                for address in (HEATER_ADDRESS, LIGHT_ADDRESS)
+            ]
+        try:
+            await self.client.async_ensure_subscriptions()
+            self._push_active = True
+        except Exception as err:
+            self._push_active = False
+            _LOGGER.debug("push subscription failed, falling back to polling: %s", err)
+
+    def _status_is_fresh(self, address: str) -> bool:
+        """Whether push covers ``address`` and its status is recent enough to skip a poll.
+
+        Until subscriptions are active and a push frame has arrived on the
+        address, every cycle polls; after that, a poll only runs once neither
+        a push frame nor a poll has refreshed the address for
+        PUSH_SAFETY_INTERVAL, even in a quiet house.
+        """
+        if not self._push_active or address not in self._pushed:
+            return False
+        last = self._last_status.get(address)
+        return last is not None and (time.monotonic() - last) < PUSH_SAFETY_INTERVAL
+
+    async def _async_status_slice(self, address: str, label: str, force: bool = False) -> dict:
+        """Return the status slice for address, polling only when push has gone quiet or ``force`` is set."""
+        await self._async_ensure_push()
+        if not force and self._status_is_fresh(address):
+            return self._status[address]
+        try:
+            data = await self.client.async_status_snapshot(address)
+            if data:
+                self._set_status(address, _merge_status(self._status[address], data))
+                self._last_status[address] = time.monotonic()
+                _LOGGER.debug("%s status updated: %d items", label, len(data.get("body", {}).get("contents", [])))
+            else:
+                _LOGGER.debug("%s status_snapshot returned empty data", label)
+        except (ApiError, ConnectionError) as err:
+            _LOGGER.warning("%s status_snapshot failed during update: %s", label, err)
+        except Exception as err:
+            _LOGGER.warning("%s status_snapshot error: %s", label, err)
+        return self._status[address]
+
+    @callback
+    def _handle_push(self, address: str, data: dict) -> None:
+        """Merge a pushed status frame and notify entities right away.
+
+        Setting the data also pushes back the next poll, so polling only runs
+        once push frames stop arriving.
+        """
+        self._set_status(address, _merge_status(self._status[address], data))
+        self._last_status[address] = time.monotonic()
+        self._pushed.add(address)
+        self.async_set_updated_data(self._snapshot())
+
+    def _snapshot(self) -> dict:
+        return {
+            "heaters": self._status[HEATER_ADDRESS],
+            "lights": self._status[LIGHT_ADDRESS],
+            # Carried in the data so connection changes still reach listeners
+            "connected": bool(self.client.is_connected),
+        }
+
+    @callback
+    def async_stop_push(self) -> None:
+        for unsub in self._push_unsubs:
+            unsub()
+        self._push_unsubs = []
+
+
+class CvnetTelemeterCoordinator(_CvnetBaseCoordinator):
+    """Electricity, water and gas meter readings, which change slowly."""
+
+    def __init__(self, hass: HomeAssistant, hub: CvnetCoordinator) -> None:
+        super().__init__(
+            hass, "cvnet_telemeter",
+            hub.entry.options.get(CONF_TELEMETER_INTERVAL, DEFAULT_TELEMETER_INTERVAL),
+        )
+        self.hub = hub
+
+    @property
+    def client(self) -> Client:
+        return self.hub.client
+
+    async def _async_update_cycle(self) -> dict:
+        await self.hub.async_ensure_login()
+        previous = (self.data or {}).get("telemeter") or {}
+        telemeter = await self._async_run_source(
+            "telemetering", self._async_fetch_telemeter(), HTTP_SOURCE_TIMEOUT_S, previous
+        )
+        return {"telemeter": telemeter or previous}
+
+    async def _async_fetch_telemeter(self) -> dict:
+        try:
+            telemeter_data = await self.client.async_telemetering()
+            if telemeter_data:
+                _LOGGER.debug("Telemeter data updated successfully")
+            else:
+                _LOGGER.debug("Telemeter data returned empty")
+            return telemeter_data or {}
+        except (ApiError, ConnectionError) as err:
+            _LOGGER.warning("telemetering failed during update: %s", err)
+        except Exception as err:
+            _LOGGER.warning("telemetering unexpected error: %s", err)
+        return {}
+
+
+def _visitor_key(visitor: dict) -> Optional[str]:
+    return visitor.get("file_name") or None
+
+
+def _prefetch_ready(task: asyncio.Task) -> bool:
+    return task.done() and not task.cancelled() and task.result()
+
+
+def _digest(value: Any) -> str:
+    """Cheap content digest of one data source, stable across dict ordering."""
+    raw = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _merge_status(current: dict, update: dict) -> dict:
+    """Merge a status message into the current snapshot by item number.
+
+    Pushed frames may only carry the zones that changed, so items are replaced
+    per ``number`` instead of swapping the whole ``contents`` list.
+    """
+    new_body = update.get("body") if isinstance(update, dict) else None
+    old_body = current.get("body") if isinstance(current, dict) else None
+    if not isinstance(new_body, dict) or not isinstance(old_body, dict):
+        return update
+    merged = {str(item.get("number")): item for item in old_body.get("contents") or []}
+    for item in new_body.get("contents") or []:
+        merged[str(item.get("number"))] = item
+    result = dict(update)
+    result["body"] = dict(new_body, contents=list(merged.values()))
+    return result
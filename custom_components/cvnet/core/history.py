@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from homeassistant.core import HomeAssistant
+
+from .car_sync import car_key
+
+_LOGGER = logging.getLogger(__name__)
+
+HISTORY_RECENT_KEYS = 2000  # keys remembered in memory so re-seen rows are not queued again
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS visitors (
+        file_name TEXT PRIMARY KEY,
+        date_time TEXT,
+        title TEXT,
+        seen_at REAL NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS visitors_date_time ON visitors (date_time)",
+    """CREATE TABLE IF NOT EXISTS car_entries (
+        date_time TEXT NOT NULL,
+        plate TEXT NOT NULL,
+        inout TEXT,
+        seen_at REAL NOT NULL,
+        PRIMARY KEY (date_time, plate)
+    ) WITHOUT ROWID""",
+    "CREATE INDEX IF NOT EXISTS car_entries_plate ON car_entries (plate, date_time)",
+)
+
+
+class HistoryStore:
+    """SQLite history of every visitor and car entry the coordinator has seen.
+
+    Rows are queued on the event loop and written in batches by one background
+    task in the executor. Time is indexed by the server's ``date_time`` string
+    (``YYYY-MM-DD HH:MM``), which sorts chronologically.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str) -> None:
+        self.hass = hass
+        self._path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pending_visitors: List[Tuple[str, Any, Any, float]] = []
+        self._pending_cars: List[Tuple[str, str, Any, float]] = []
+        self._recent: "OrderedDict[Tuple[str, ...], None]" = OrderedDict()
+        self._flush_task: Optional[asyncio.Task] = None
+
+    # ---------- Queueing (event loop) ----------
+    def add_visitors(self, items: Iterable[dict]) -> None:
+        now = time.time()
+        for item in items:
+            file_name = item.get("file_name")
+            if file_name and self._is_new(("v", file_name)):
+                self._pending_visitors.append((file_name, item.get("date_time"), item.get("title"), now))
+        self._schedule_flush()
+
+    def add_car_entries(self, items: Iterable[dict]) -> None:
+        now = time.time()
+        for item in items:
+            key = car_key(item)
+            if key is not None and self._is_new(("c",) + key):
+                plate = unicodedata.normalize("NFC", key[1])
+                self._pending_cars.append((key[0], plate, item.get("inout"), now))
+        self._schedule_flush()
+
+    def _is_new(self, key: Tuple[str, ...]) -> bool:
+        if key in self._recent:
+            self._recent.move_to_end(key)
+            return False
+        self._recent[key] = None
+        if len(self._recent) > HISTORY_RECENT_KEYS:
+            self._recent.popitem(last=False)
+        return True
+
+    def _schedule_flush(self) -> None:
+        if not (self._pending_visitors or self._pending_cars):
+            return
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.ensure_future(self.async_flush())
+
+    async def async_flush(self) -> None:
+        """Write queued rows; rows queued while a batch is written go in the next one."""
+        while self._pending_visitors or self._pending_cars:
+            visitors, self._pending_visitors = self._pending_visitors, []
+            cars, self._pending_cars = self._pending_cars, []
+            try:
+                await self.hass.async_add_executor_job(self._write, visitors, cars)
+            except Exception as err:
+                _LOGGER.warning("History write of %d rows failed: %s", len(visitors) + len(cars), err)
+                # Forget the recent keys so the rows are queued again when next seen
+                self._recent.clear()
+                return
+
+    async def async_close(self) -> None:
+        if self._flush_task is not None and not self._flush_task.done():
+            await self._flush_task
+        await self.async_flush()
+        await self.hass.async_add_executor_job(self._close)
+
+    # ---------- Queries ----------
+    async def async_visitors(self, start: Optional[str] = None, end: Optional[str] = None,
+                             limit: int = 100) -> List[Dict[str, Any]]:
+        return await self.hass.async_add_executor_job(self.query_visitors, start, end, limit)
+
+    async def async_visitor(self, file_name: str) -> Optional[Dict[str, Any]]:
+        rows = await self.hass.async_add_executor_job(
+            self._query, "SELECT file_name, date_time, title FROM visitors WHERE file_name = ?", (file_name,)
+        )
+        return rows[0] if rows else None
+
+    async def async_car_entries(self, start: Optional[str] = None, end: Optional[str] = None,
+                                plate_ranges: Optional[List[Tuple[str, str]]] = None,
+                                direction: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        return await self.hass.async_add_executor_job(
+            self.query_car_entries, start, end, plate_ranges, direction, limit
+        )
+
+    def query_visitors(self, start: Optional[str], end: Optional[str], limit: int) -> List[Dict[str, Any]]:
+        clauses, params = _time_range(start, end)
+        sql = "SELECT file_name, date_time, title FROM visitors"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY date_time DESC LIMIT ?"
+        return self._query(sql, (*params, limit))
+
+    def query_car_entries(self, start: Optional[str], end: Optional[str],
+                          plate_ranges: Optional[List[Tuple[str, str]]],
+                          direction: Optional[str], limit: int) -> List[Dict[str, Any]]:
+        """Car entries newest first.
+
+        ``plate_ranges`` are half-open ``[low, high)`` ranges on the plate so
+        prefix searches can use the plate index.
+        """
+        clauses, params = _time_range(start, end)
+        if plate_ranges:
+            clauses.append("(" + " OR ".join("(plate >= ? AND plate < ?)" for _ in plate_ranges) + ")")
+            for low, high in plate_ranges:
+                params.extend((low, high))
+        if direction is not None:
+            clauses.append("inout = ?")
+            params.append(direction)
+        sql = "SELECT date_time, plate AS title, inout FROM car_entries"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY date_time DESC LIMIT ?"
+        return self._query(sql, (*params, limit))
+
+    # ---------- Executor side ----------
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            conn = sqlite3.connect(self._path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                for statement in _SCHEMA:
+                    conn.execute(statement)
+            self._conn = conn
+        return self._conn
+
+    def _write(self, visitors: List[tuple], cars: List[tuple]) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                if visitors:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO visitors (file_name, date_time, title, seen_at) VALUES (?, ?, ?, ?)",
+                        visitors,
+                    )
+                if cars:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO car_entries (date_time, plate, inout, seen_at) VALUES (?, ?, ?, ?)",
+                        cars,
+                    )
+
+    def _query(self, sql: str, params: tuple) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(row) for row in self._connect().execute(sql, params)]
+
+    def _close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def _time_range(start: Optional[str], end: Optional[str]) -> Tuple[List[str], List[Any]]:
+    clauses: List[str] = []
+    params: List[Any] = []
+    if start:
+        clauses.append("date_time >= ?")
+        params.append(start)
+    if end:
+        clauses.append("date_time <= ?")
+        params.append(end)
+    return clauses, params
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class VisitorImageStore:
+    """Visitor snapshots persisted under the HA config directory.
+
+    Files are keyed by a hash of ``file_name`` and the directory is kept under
+    ``max_bytes`` by removing the oldest writes first. All file I/O runs in the
+    executor; the index is guarded by a lock since jobs may run concurrently.
+    """
+
+    def __init__(self, hass: HomeAssistant, directory: str, max_bytes: int) -> None:
+        self.hass = hass
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # name -> (mtime, size); loaded from disk on first use
+        self._index: Optional[Dict[str, Tuple[float, int]]] = None
+        self._size = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_bytes > 0
+
+    def set_max_bytes(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+
+    async def async_get(self, file_name: str) -> Optional[bytes]:
+        if not self.enabled:
+            return None
+        return await self.hass.async_add_executor_job(self.read, file_name)
+
+    async def async_put(self, file_name: str, data: bytes) -> None:
+        if not self.enabled:
+            return
+        await self.hass.async_add_executor_job(self.write, file_name, data)
+
+    async def async_prune(self) -> None:
+        """Apply the current size cap, e.g. after the option was lowered."""
+        await self.hass.async_add_executor_job(self._prune)
+
+    # ---------- Executor side ----------
+    def read(self, file_name: str) -> Optional[bytes]:
+        path = self._path(self._key(file_name))
+        try:
+            # Unbuffered: a single read straight into the returned bytes object
+            with open(path, "rb", buffering=0) as fh:
+                return fh.read()
+        except FileNotFoundError:
+            return None
+        except OSError as err:
+            _LOGGER.debug("Visitor image read failed for %s: %s", file_name, err)
+            return None
+
+    def write(self, file_name: str, data: bytes) -> None:
+        if len(data) > self._max_bytes:
+            return
+        key = self._key(file_name)
+        path = self._path(key)
+        tmp = f"{path}.tmp"
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            with open(tmp, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp, path)
+            mtime = os.stat(path).st_mtime
+        except OSError as err:
+            _LOGGER.warning("Visitor image write failed for %s: %s", file_name, err)
+            return
+        with self._lock:
+            index = self._load_index()
+            old = index.pop(key, None)
+            if old is not None:
+                self._size -= old[1]
+            index[key] = (mtime, len(data))
+            self._size += len(data)
+        self._prune()
+
+    def _prune(self) -> None:
+        with self._lock:
+            index = self._load_index()
+            if self._size <= self._max_bytes:
+                return
+            for key in sorted(index, key=lambda k: index[k][0]):
+                if self._size <= self._max_bytes:
+                    break
+                _, size = index.pop(key)
+                self._size -= size
+                try:
+                    os.remove(self._path(key))
+                except OSError:
+                    pass
+
+    def _load_index(self) -> Dict[str, Tuple[float, int]]:
+        if self._index is not None:
+            return self._index
+        index: Dict[str, Tuple[float, int]] = {}
+        try:
+            with os.scandir(self._directory) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.endswith(".jpg"):
+                        st = entry.stat()
+                        index[entry.name] = (st.st_mtime, st.st_size)
+        except FileNotFoundError:
+            pass
+        self._index = index
+        self._size = sum(size for _, size in index.values())
+        return index
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, key)
+
+    @staticmethod
+    def _key(file_name: str) -> str:
+        return hashlib.blake2b(file_name.encode("utf-8"), digest_size=16).hexdigest() + ".jpg"
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import io
+import logging
+from typing import Optional
+
+from ..const import IMAGE_VARIANT_QUALITY
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def resize_jpeg(data: bytes, width: Optional[int], height: Optional[int]) -> bytes:
+    """Downscale a JPEG to fit within ``width`` x ``height``, keeping its aspect ratio.
+
+    Blocking; run it in the executor. Images that already fit, and every image
+    when Pillow is unavailable or cannot read the data, are returned unchanged.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        return data
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            box = (width or img.width, height or img.height)
+            if img.width <= box[0] and img.height <= box[1]:
+                return data
+            # Let the JPEG decoder scale down by DCT before any pixel work
+            img.draft("RGB", box)
+            small = img.convert("RGB") if img.mode != "RGB" else img
+            small.thumbnail(box)
+            out = io.BytesIO()
+            small.save(out, "JPEG", quality=IMAGE_VARIANT_QUALITY)
+            return out.getvalue()
+    except Exception as err:
+        _LOGGER.debug("Image resize to %sx%s failed: %s", width, height, err)
+        return data
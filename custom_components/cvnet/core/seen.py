@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Callable, Deque, Hashable, Iterable, Iterator, List, Optional, Set, TypeVar
+
+T = TypeVar("T")
+
+
+class RecentlySeen:
+    """Bounded set of the most recently seen keys.
+
+    A ring buffer keeps insertion order and a hash set answers membership, so
+    ``add`` and ``in`` are O(1) and memory stays at ``maxlen`` keys: adding a
+    key to a full buffer forgets the oldest one.
+    """
+
+    __slots__ = ("maxlen", "version", "_order", "_keys")
+
+    def __init__(self, maxlen: int, keys: Iterable[Hashable] = ()) -> None:
+        self.maxlen = maxlen
+        self.version = 0  # bumped on every change, so callers can tell when to persist
+        self._order: Deque[Hashable] = deque()
+        self._keys: Set[Hashable] = set()
+        for key in keys:
+            self.add(key)
+
+    def add(self, key: Hashable) -> bool:
+        """Remember ``key``; returns True if it was not already known."""
+        if key in self._keys:
+            return False
+        self._order.append(key)
+        self._keys.add(key)
+        if len(self._order) > self.maxlen:
+            self._keys.discard(self._order.popleft())
+        self.version += 1
+        return True
+
+    def add_new(self, items: Iterable[T], key: Callable[[T], Optional[Hashable]]) -> List[T]:
+        """Remember every item's key in one pass; returns the items that were new, in order.
+
+        Items whose key is None are skipped.
+        """
+        new: List[T] = []
+        known = self._keys
+        for item in items:
+            k = key(item)
+            # Known keys, the common case on a steady poll, skip the call to add
+            if k is None or k in known:
+                continue
+            self.add(k)
+            new.append(item)
+        return new
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """Keys oldest first, the order they are restored in."""
+        return iter(self._order)
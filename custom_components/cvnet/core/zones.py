@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+@dataclass(frozen=True, slots=True)
+class HeaterZone:
+    number: str
+    title: Optional[str]
+    is_on: bool
+    current_temp: Optional[float]
+    setting_temp: Optional[float]
+
+
+@dataclass(frozen=True, slots=True)
+class LightZone:
+    number: str
+    title: Optional[str]
+    is_on: bool
+
+
+def _contents(status: Any) -> list:
+    body = status.get("body") if isinstance(status, dict) else None
+    if not isinstance(body, dict):
+        return []
+    return body.get("contents") or []
+
+
+def _to_float(value: Any) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_heater_zones(status: Any) -> Dict[str, HeaterZone]:
+    """Index a heater status snapshot by zone number."""
+    zones: Dict[str, HeaterZone] = {}
+    for item in _contents(status):
+        if not isinstance(item, dict):
+            continue
+        number = str(item.get("number"))
+        zones[number] = HeaterZone(
+            number=number,
+            title=item.get("title"),
+            is_on=str(item.get("onoff")) == "1",
+            current_temp=_to_float(item.get("current_temp")),
+            setting_temp=_to_float(item.get("setting_temp")),
+        )
+    return zones
+
+
+def parse_light_zones(status: Any) -> Dict[str, LightZone]:
+    """Index a light status snapshot by zone number."""
+    zones: Dict[str, LightZone] = {}
+    for item in _contents(status):
+        if not isinstance(item, dict):
+            continue
+        number = str(item.get("number"))
+        zones[number] = LightZone(
+            number=number,
+            title=item.get("title"),
+            is_on=str(item.get("onoff", "0")) == "1",
+        )
+    return zones
@@ -6,14 +6,14 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorDeviceClass,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from ..const import DOMAIN
-from ..core.coordinator import CvnetCoordinator
+from ..core.coordinator import CvnetCoordinator, CvnetDeviceCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,7 +24,8 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     coord: CvnetCoordinator = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities([CvnetConnectionStatusSensor(coord, entry)], update_before_add=False)
+    # WebSocket health changes with the device source, which owns the socket traffic
+    async_add_entities([CvnetConnectionStatusSensor(coord.devices, entry)], update_before_add=False)
 
 
 class CvnetConnectionStatusSensor(CoordinatorEntity, BinarySensorEntity):
@@ -34,7 +35,7 @@ class CvnetConnectionStatusSensor(CoordinatorEntity, BinarySensorEntity):
     _attr_icon = "mdi:lan-connect"
     _attr_name = "CVNET Connection Status"
 
-    def __init__(self, coordinator: CvnetCoordinator, entry: ConfigEntry) -> None:
+    def __init__(self, coordinator: CvnetDeviceCoordinator, entry: ConfigEntry) -> None:
         super().__init__(coordinator)
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_connection_status"
@@ -44,6 +45,11 @@ class CvnetConnectionStatusSensor(CoordinatorEntity, BinarySensorEntity):
             manufacturer="CVNET",
         )
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if self.coordinator.source_changed("connected"):
+            super()._handle_coordinator_update()
+
     @property
     def is_on(self) -> bool:
         """Return True if WebSocket connection is healthy."""
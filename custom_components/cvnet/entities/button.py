@@ -106,9 +106,9 @@ class CvnetHeatingAllOnButton(_BaseButton):
 
     async def async_press(self) -> None:
         body = {"request": "control_all", "onoff": "1"}
-        await self.coordinator.client.async_publish(address="22", body=body)
+        await self.coordinator.client.async_queue_command(address="22", body=body)
         _LOGGER.info("Heating ALL ON command sent")
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.devices.async_request_refresh()
 
 
 class CvnetHeatingAllOffButton(_BaseButton):
@@ -122,6 +122,6 @@ class CvnetHeatingAllOffButton(_BaseButton):
 
     async def async_press(self) -> None:
         body = {"request": "control_all", "onoff": "0"}
-        await self.coordinator.client.async_publish(address="22", body=body)
+        await self.coordinator.client.async_queue_command(address="22", body=body)
         _LOGGER.info("Heating ALL OFF command sent")
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.devices.async_request_refresh()
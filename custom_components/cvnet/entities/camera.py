@@ -10,8 +10,10 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import DeviceInfo
 
-from ..const import DOMAIN
+from ..const import DOMAIN, IMAGE_VARIANT_CACHE_MAX_BYTES
+from ..api.cache import ByteLRUCache
 from ..core.coordinator import CvnetCoordinator
+from ..core.images import resize_jpeg
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,6 +37,8 @@ class CvnetVisitorCamera(Camera):
             manufacturer="CVNET"
         )
         self._unsubscribe = None
+        # Downscaled variants keyed by file_name and requested size
+        self._variants = ByteLRUCache(IMAGE_VARIANT_CACHE_MAX_BYTES)
     
     async def async_added_to_hass(self) -> None:
         """Subscribe to coordinator updates."""
@@ -42,8 +46,9 @@ class CvnetVisitorCamera(Camera):
         
         def _handle_coordinator_update() -> None:
             """Handle updated data from the coordinator."""
-            # Signal that image has changed
-            self.async_write_ha_state()
+            # Signal that image has changed, unless the visitor list and selection are unchanged
+            if self.coordinator.source_changed("vis", "selected"):
+                self.async_write_ha_state()
         
         # Subscribe to coordinator updates
         self._unsubscribe = self.coordinator.async_add_listener(_handle_coordinator_update)
@@ -75,10 +80,18 @@ class CvnetVisitorCamera(Camera):
             vis_len = len((self.coordinator.data or {}).get("vis", {}).get("contents", []) if isinstance(self.coordinator.data, dict) else [])
             _LOGGER.error("No file_name available for visitor image fetch (visitor_count=%s).", vis_len)
             return None
+        variant_key = f"{file_name}@{width}x{height}" if width or height else None
+        if variant_key:
+            cached = self._variants.get(variant_key)
+            if cached is not None:
+                return cached
         try:
             img = await self.coordinator.client.async_visitor_image_bytes(file_name)
             if img is None:
                 _LOGGER.error(f"Image fetch returned None for file_name={file_name}")
+            elif variant_key:
+                img = await self.hass.async_add_executor_job(resize_jpeg, img, width, height)
+                self._variants.put(variant_key, img)
             return img
         except Exception as e:
             _LOGGER.error(f"Exception during visitor image fetch for file_name={file_name}: {e}")
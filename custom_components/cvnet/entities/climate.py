@@ -15,7 +15,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from ..const import DOMAIN
-from ..core.coordinator import CvnetCoordinator
+from ..core.coordinator import CvnetCoordinator, CvnetDeviceCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,7 +32,7 @@ REFRESH_DELAY_SECONDS = 2.0  # Wait this long after last command before refreshi
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
     coordinator: CvnetCoordinator = hass.data[DOMAIN][entry.entry_id]
-    entities = [CVNETClimate(coordinator, room) for room in ROOMS]
+    entities = [CVNETClimate(coordinator.devices, room) for room in ROOMS]
     async_add_entities(entities)
 
 
@@ -53,7 +53,7 @@ class CVNETClimate(CoordinatorEntity, ClimateEntity):
     _attr_precision = 1.0
     _attr_target_temperature_step = 1
 
-    def __init__(self, coordinator: CvnetCoordinator, room: dict) -> None:
+    def __init__(self, coordinator: CvnetDeviceCoordinator, room: dict) -> None:
         super().__init__(coordinator)
         self._name = room["name"]
         self._number = room["number"]
@@ -81,7 +81,7 @@ class CVNETClimate(CoordinatorEntity, ClimateEntity):
             "onoff": onoff,
             "temp": str(t),
         }
-        publish = getattr(self.coordinator.client, "async_publish", None)
+        publish = getattr(self.coordinator.client, "async_queue_command", None)
         if callable(publish):
             try:
                 _LOGGER.debug("Setting HVAC mode %s for room %s: %s", hvac_mode, self._number, body)
@@ -93,7 +93,7 @@ class CVNETClimate(CoordinatorEntity, ClimateEntity):
             except Exception as ex:
                 _LOGGER.error("Failed to set HVAC mode for room %s: %s", self._number, ex)
         else:
-            _LOGGER.warning("async_publish not available on coordinator.client")
+            _LOGGER.warning("async_queue_command not available on coordinator.client")
             self._attr_hvac_mode = hvac_mode
             self.async_write_ha_state()
 
@@ -108,7 +108,7 @@ class CVNETClimate(CoordinatorEntity, ClimateEntity):
             "onoff": "1" if self._attr_hvac_mode != HVACMode.OFF else "0",
             "temp": str(t),
         }
-        publish = getattr(self.coordinator.client, "async_publish", None)
+        publish = getattr(self.coordinator.client, "async_queue_command", None)
         if callable(publish):
             try:
                 _LOGGER.debug("Setting temperature %s for room %s: %s", t, self._number, body)
@@ -120,7 +120,7 @@ class CVNETClimate(CoordinatorEntity, ClimateEntity):
             except Exception as ex:
                 _LOGGER.error("Failed to set temperature for room %s: %s", self._number, ex)
         else:
-            _LOGGER.warning("async_publish not available on coordinator.client")
+            _LOGGER.warning("async_queue_command not available on coordinator.client")
             self._attr_target_temperature = float(t)
             self.async_write_ha_state()
 
@@ -128,6 +128,7 @@ class CVNETClimate(CoordinatorEntity, ClimateEntity):
         """Schedule a coordinator refresh after debounce delay, canceling any pending one."""
         if self._pending_refresh_task and not self._pending_refresh_task.done():
             self._pending_refresh_task.cancel()
+        self.coordinator.invalidate_source("heaters")
         self._pending_refresh_task = asyncio.create_task(self._delayed_refresh())
 
     async def _delayed_refresh(self) -> None:
@@ -143,40 +144,34 @@ class CVNETClimate(CoordinatorEntity, ClimateEntity):
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        heaters = (self.coordinator.data or {}).get("heaters") or {}
-        body = heaters.get("body") if isinstance(heaters, dict) else None
-        if isinstance(body, dict):
-            for item in body.get("contents", []):
-                if str(item.get("number")) == self._number:
-                    ct = item.get("current_temp")
-                    if ct is not None:
-                        try:
-                            self._attr_current_temperature = float(ct)
-                        except (ValueError, TypeError):
-                            pass
-                    onoff = item.get("onoff")
-                    server_hvac_mode = HVACMode.HEAT if str(onoff) == "1" else HVACMode.OFF
-                    time_since_command = time.monotonic() - self._last_command_time
-                    if time_since_command > COMMAND_DEBOUNCE_SECONDS:
-                        self._attr_hvac_mode = server_hvac_mode
-                    elif server_hvac_mode == self._attr_hvac_mode:
-                        _LOGGER.debug("Server confirmed HVAC mode %s for room %s", server_hvac_mode, self._number)
-                    else:
-                        _LOGGER.debug(
-                            "Ignoring stale server HVAC mode %s for room %s (local: %s, %.1fs since command)",
-                            server_hvac_mode, self._number, self._attr_hvac_mode, time_since_command
-                        )
-                    st = item.get("setting_temp")
-                    if st is not None:
-                        server_temp = float(_clamp_int_temp(st))
-                        if time_since_command > COMMAND_DEBOUNCE_SECONDS:
-                            self._attr_target_temperature = server_temp
-                        elif server_temp == self._attr_target_temperature:
-                            _LOGGER.debug("Server confirmed temp %s for room %s", server_temp, self._number)
-                        else:
-                            _LOGGER.debug(
-                                "Ignoring stale server temp %s for room %s (local: %s, %.1fs since command)",
-                                server_temp, self._number, self._attr_target_temperature, time_since_command
-                            )
-                    break
+        if not self.coordinator.source_changed("heaters"):
+            return
+        zone = self.coordinator.heater_zone(self._number)
+        if zone is not None:
+            if zone.current_temp is not None:
+                self._attr_current_temperature = zone.current_temp
+            server_hvac_mode = HVACMode.HEAT if zone.is_on else HVACMode.OFF
+            time_since_command = time.monotonic() - self._last_command_time
+            if time_since_command > COMMAND_DEBOUNCE_SECONDS:
+                self._attr_hvac_mode = server_hvac_mode
+            elif server_hvac_mode == self._attr_hvac_mode:
+                _LOGGER.debug("Server confirmed HVAC mode %s for room %s", server_hvac_mode, self._number)
+            else:
+                self.coordinator.invalidate_source("heaters")
+                _LOGGER.debug(
+                    "Ignoring stale server HVAC mode %s for room %s (local: %s, %.1fs since command)",
+                    server_hvac_mode, self._number, self._attr_hvac_mode, time_since_command
+                )
+            if zone.setting_temp is not None:
+                server_temp = float(_clamp_int_temp(zone.setting_temp))
+                if time_since_command > COMMAND_DEBOUNCE_SECONDS:
+                    self._attr_target_temperature = server_temp
+                elif server_temp == self._attr_target_temperature:
+                    _LOGGER.debug("Server confirmed temp %s for room %s", server_temp, self._number)
+                else:
+                    self.coordinator.invalidate_source("heaters")
+                    _LOGGER.debug(
+                        "Ignoring stale server temp %s for room %s (local: %s, %.1fs since command)",
+                        server_temp, self._number, self._attr_target_temperature, time_since_command
+                    )
         super()._handle_coordinator_update()
@@ -8,7 +8,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from ..const import DOMAIN
-from ..core.coordinator import CvnetCoordinator
+from ..core.coordinator import CvnetCoordinator, CvnetDeviceCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,19 +19,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     coord: CvnetCoordinator = hass.data[DOMAIN][entry.entry_id]
     lights: List[dict] = []
     # Try to discover lights from the coordinator's light status data
-    light_data = (coord.data or {}).get("lights") or {}
-    body = light_data.get("body") if isinstance(light_data, dict) else None
-    if isinstance(body, dict):
-        for item in body.get("contents", []):
-            try:
-                num = str(item.get("number"))
-                title = item.get("title") or f"Light {num}"
-                lights.append({"name": title, "number": num})
-            except Exception:
-                continue
+    for zone in coord.devices.light_zones.values():
+        lights.append({"name": zone.title or f"Light {zone.number}", "number": zone.number})
     if not lights:
         lights = FALLBACK_LIGHTS
-    entities = [CvnetLight(coord, l) for l in lights]
+    entities = [CvnetLight(coord.devices, l) for l in lights]
     async_add_entities(entities, update_before_add=False)
 
 
@@ -41,7 +33,7 @@ class CvnetLight(CoordinatorEntity, LightEntity):
     _attr_supported_color_modes = {ColorMode.ONOFF}
     _attr_color_mode = ColorMode.ONOFF
 
-    def __init__(self, coordinator: CvnetCoordinator, li: dict):
+    def __init__(self, coordinator: CvnetDeviceCoordinator, li: dict):
         super().__init__(coordinator)
         self._name = li["name"]
         self._number = str(li["number"])
@@ -60,19 +52,19 @@ class CvnetLight(CoordinatorEntity, LightEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        lights_data = (self.coordinator.data or {}).get("lights", {})
-        body = lights_data.get("body", {})
-        for light in body.get("contents", []):
-            if str(light.get("number")) == self._number:
-                self._is_on = str(light.get("onoff", "0")) == "1"
-                break
+        if not self.coordinator.source_changed("lights"):
+            return
+        zone = self.coordinator.light_zone(self._number)
+        if zone is not None:
+            self._is_on = zone.is_on
 
         self.async_write_ha_state()
 
     async def _async_set_light(self, onoff: str) -> None:
         body = {"request": "control", "number": self._number, "onoff": onoff, "brightness": "0", "zone": "1"}
-        await self.coordinator.client.async_publish(address="18", body=body)
+        await self.coordinator.client.async_queue_command(address="18", body=body)
         self._is_on = onoff == "1"
+        self.coordinator.invalidate_source("lights")
         self.async_write_ha_state()
 
     async def async_turn_on(self, **kwargs: Any):
@@ -6,7 +6,7 @@ from typing import List, Optional
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -68,6 +68,11 @@ class CvnetVisitorSelect(CoordinatorEntity, SelectEntity):
     def device_info(self) -> DeviceInfo:
         return DeviceInfo(identifiers={(DOMAIN, "cvnet_visitors")}, name="Visitors", manufacturer="CVNET")
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if self.coordinator.source_changed("vis", "selected"):
+            super()._handle_coordinator_update()
+
     @property
     def options(self) -> List[str]:
         opts = self.coordinator.visitor_options()
@@ -1,13 +1,13 @@
 from __future__ import annotations
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
 from homeassistant.const import UnitOfEnergy, UnitOfVolume, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from ..const import DOMAIN, MAX_VISITOR_ATTRIBUTES
-from ..core.coordinator import CvnetCoordinator
+from ..core.coordinator import CvnetCoordinator, CvnetDeviceCoordinator, CvnetTelemeterCoordinator
 
 ROOMS = [
     {"name": "거실", "number": "1"},
@@ -18,8 +18,8 @@ ROOMS = [
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
     coord: CvnetCoordinator = hass.data[DOMAIN][entry.entry_id]
-    entities = [ElecSensor(coord), WaterSensor(coord), GasSensor(coord)]
-    entities.extend([RoomTempSensor(coord, r) for r in ROOMS])
+    entities = [ElecSensor(coord.telemeter), WaterSensor(coord.telemeter), GasSensor(coord.telemeter)]
+    entities.extend([RoomTempSensor(coord.devices, r) for r in ROOMS])
     entities.append(CvnetVisitorsSensor(coord))
     entities.append(CvnetCarEntriesSensor(coord, entry))
     async_add_entities(entities, update_before_add=False)
@@ -29,7 +29,7 @@ class BaseEntity(SensorEntity):
         self.coordinator = coordinator
 
 class BaseTele(CoordinatorEntity, BaseEntity):
-    def __init__(self, coordinator: CvnetCoordinator, name: str, key: str):
+    def __init__(self, coordinator: CvnetTelemeterCoordinator, name: str, key: str):
         CoordinatorEntity.__init__(self, coordinator)
         BaseEntity.__init__(self, coordinator)
         self._key = key
@@ -37,6 +37,11 @@ class BaseTele(CoordinatorEntity, BaseEntity):
         self._attr_unique_id = f"cvnet_{key}"
         self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, "cvnet_telemeter")}, name="Telemeter", manufacturer="CVNET")
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if self.coordinator.source_changed("telemeter"):
+            super()._handle_coordinator_update()
+
     @property
     def native_value(self):
         tele = (self.coordinator.data or {}).get("telemeter") or {}
@@ -70,26 +75,27 @@ class GasSensor(BaseTele):
     _attr_translation_key = "gas"
     def __init__(self, coord): super().__init__(coord, "Gas (m³)", "gas")
 
-class RoomTempSensor(BaseEntity):
+class RoomTempSensor(CoordinatorEntity, BaseEntity):
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
 
-    def __init__(self, coordinator: CvnetCoordinator, room: dict):
-        super().__init__(coordinator)
+    def __init__(self, coordinator: CvnetDeviceCoordinator, room: dict):
+        CoordinatorEntity.__init__(self, coordinator)
+        BaseEntity.__init__(self, coordinator)
         self._number = str(room["number"])
         self._attr_name = f"{room['name']} 현재온도"
         self._attr_unique_id = f"cvnet_room_{self._number}_current_temp"
         self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, "cvnet_heating")}, name="Heating", manufacturer="CVNET")
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if self.coordinator.source_changed("heaters"):
+            super()._handle_coordinator_update()
+
     @property
     def native_value(self):
-        heaters = (self.coordinator.data or {}).get("heaters") or {}
-        body = heaters.get("body") if isinstance(heaters, dict) else None
-        if isinstance(body, dict):
-            for item in body.get("contents", []):
-                if str(item.get("number")) == self._number:
-                    return item.get("current_temp")
-        return None
+        zone = self.coordinator.heater_zone(self._number)
+        return zone.current_temp if zone is not None else None
 
 
 
@@ -137,6 +143,8 @@ class CvnetVisitorsSensor(CoordinatorEntity, BaseEntity):
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        if not self.coordinator.source_changed("vis", "selected"):
+            return
         items = (self.coordinator.data.get("vis") or {}).get("contents") if self.coordinator.data else None
         self._visitor_list = items or []
         file_name = self.coordinator.get_visitor_selected()
@@ -166,6 +174,11 @@ class CvnetCarEntriesSensor(CoordinatorEntity, BaseEntity):
             manufacturer="CVNET",
         )
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if self.coordinator.source_changed("car"):
+            super()._handle_coordinator_update()
+
     @property
     def native_value(self):
         car = self.coordinator.car_state()
@@ -22,13 +22,13 @@ class CvnetAllLightsSwitch(SwitchEntity):
     async def async_turn_on(self, **kwargs):
         username = getattr(self.coordinator.client, "_username", "homeassistant")
         body = {"id": username, "remote_addr": "127.0.0.1", "request": "control_all", "onoff": "1", "brightness": "0", "zone": "0"}
-        await self.coordinator.client.async_publish(address="18", body=body)
+        await self.coordinator.client.async_queue_command(address="18", body=body)
         self._attr_is_on = True
         self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs):
         username = getattr(self.coordinator.client, "_username", "homeassistant")
         body = {"id": username, "remote_addr": "127.0.0.1", "request": "control_all", "onoff": "0", "brightness": "0", "zone": "0"}
-        await self.coordinator.client.async_publish(address="18", body=body)
+        await self.coordinator.client.async_queue_command(address="18", body=body)
         self._attr_is_on = False
         self.async_write_ha_state()
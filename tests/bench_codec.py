@@ -0,0 +1,93 @@
+"""Micro-benchmark of the client JSON codec against the stdlib.
+
+Not collected by pytest; run it directly:
+
+    python tests/bench_codec.py
+"""
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import timeit
+
+_CODEC_PATH = os.path.join(os.path.dirname(__file__), "..", "custom_components", "cvnet", "api", "codec.py")
+_spec = importlib.util.spec_from_file_location("cvnet_codec", _CODEC_PATH)
+codec = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(codec)
+
+VISITOR_LIST = json.dumps({
+    "result": 1,
+    "contents": [
+        {"file_name": f"20250801_1200{i:02d}_0101.jpg", "date_time": f"2025-08-01 12:00:{i:02d}", "title": "현관 방문자"}
+        for i in range(14)
+    ],
+}, ensure_ascii=False).encode("utf-8")
+
+CAR_LIST = json.dumps({
+    "result": 1, "exist_next": True, "page_no": "1", "rows": "14",
+    "contents": [
+        {"inout": str(i % 2), "date_time": f"2025-08-09 17:{i:02d}", "title": f"{10 + i}러{1700 + i}"}
+        for i in range(14)
+    ],
+}, ensure_ascii=False).encode("utf-8")
+
+_STATUS_BODY = json.dumps({
+    "contents": [
+        {"number": str(n), "onoff": "1", "current_temp": "22", "setting_temp": "24", "title": f"방{n}"}
+        for n in range(1, 5)
+    ],
+}, ensure_ascii=False)
+STATUS_FRAME = "a" + json.dumps([json.dumps({"type": "rec", "address": "22", "body": _STATUS_BODY}, ensure_ascii=False)])
+
+PUBLISH_BODY = {"id": "homeassistant", "remote_addr": "10.0.0.2", "request": "control",
+                "number": "1", "onoff": "1", "temp": "24"}
+
+
+def _stdlib_frame(text: str) -> dict:
+    inner = json.loads(text[1:])[0]
+    data = json.loads(inner)
+    data["body"] = json.loads(data["body"])
+    return data
+
+
+def _codec_frame(text: str) -> dict:
+    inner = codec.loads(text[1:])[0]
+    data = codec.loads(inner)
+    data["body"] = codec.loads(data["body"])
+    return data
+
+
+def _stdlib_publish() -> str:
+    env = {"type": "publish", "address": "22",
+           "body": json.dumps(PUBLISH_BODY, separators=(",", ":"), ensure_ascii=False)}
+    return json.dumps([json.dumps(env, separators=(",", ":"), ensure_ascii=False)],
+                      separators=(",", ":"), ensure_ascii=False)
+
+
+def _codec_publish() -> str:
+    env = {"type": "publish", "address": "22", "body": codec.dumps(PUBLISH_BODY)}
+    return codec.dumps([codec.dumps(env)])
+
+
+CASES = {
+    # The stdlib path decoded text, so it pays for resp.text() as well
+    "visitor_list": (lambda: json.loads(VISITOR_LIST.decode("utf-8")), lambda: codec.loads(VISITOR_LIST)),
+    "entrancecar_list": (lambda: json.loads(CAR_LIST.decode("utf-8")), lambda: codec.loads(CAR_LIST)),
+    "status_frame": (lambda: _stdlib_frame(STATUS_FRAME), lambda: _codec_frame(STATUS_FRAME)),
+    "publish_payload": (_stdlib_publish, _codec_publish),
+}
+
+
+def main(number: int = 20000) -> None:
+    print(f"codec backend: {codec.BACKEND}")
+    for name, (baseline, candidate) in CASES.items():
+        assert baseline() == candidate(), name
+        base_t = min(timeit.repeat(baseline, number=number, repeat=5))
+        cand_t = min(timeit.repeat(candidate, number=number, repeat=5))
+        print(f"{name:18s} stdlib {base_t / number * 1e6:7.2f} us  codec {cand_t / number * 1e6:7.2f} us"
+              f"  x{base_t / cand_t:.1f}")
+
+
+if __name__ == "__main__":
+    main()
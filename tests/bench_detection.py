@@ -0,0 +1,127 @@
+"""Benchmark of new-visitor and new-car detection on 1,000-row pages.
+
+Compares the single keyed pass (``RecentlySeen.add_new`` and ``CarEntrySync``)
+with the detection it replaced, for a steady-state poll (one new row) and a
+burst (every row new). Not collected by pytest; run it directly:
+
+    python tests/bench_detection.py
+"""
+from __future__ import annotations
+
+import asyncio
+import importlib
+import os
+import sys
+import time
+import types
+
+_PACKAGE_DIR = os.path.join(os.path.dirname(__file__), "..", "custom_components", "cvnet")
+
+# Register bare packages so the core modules import without Home Assistant
+for _name, _path in (("cvnet", _PACKAGE_DIR), ("cvnet.core", os.path.join(_PACKAGE_DIR, "core"))):
+    _pkg = types.ModuleType(_name)
+    _pkg.__path__ = [_path]
+    sys.modules[_name] = _pkg
+
+CarEntrySync = importlib.import_module("cvnet.core.car_sync").CarEntrySync
+RecentlySeen = importlib.import_module("cvnet.core.seen").RecentlySeen
+
+ROWS = 1000
+
+
+def _visitors(start: int) -> list:
+    return [{"file_name": f"2025{n:08d}.jpg", "date_time": f"2025-08-01 {n:08d}", "title": "방문자"}
+            for n in range(start + ROWS - 1, start - 1, -1)]
+
+
+def _cars(start: int) -> dict:
+    rows = [{"inout": str(n % 2), "date_time": f"2025-08-09 {n:08d}", "title": f"{n % 90 + 10}러{n:04d}"}
+            for n in range(start + ROWS - 1, start - 1, -1)]
+    return {"contents": rows, "exist_next": True}
+
+
+def _legacy_visitors(items: list, seen: set) -> list:
+    current = {v.get("file_name") for v in items if v.get("file_name")}
+    out = []
+    for file_name in current - seen:
+        visitor = next((v for v in items if v.get("file_name") == file_name), None)
+        if visitor:
+            out.append({"file_name": file_name, "date_time": visitor.get("date_time"), "title": visitor.get("title")})
+    return out
+
+
+def _legacy_cars(page: dict, seen: set) -> list:
+    out = []
+    current = set()
+    for car in page.get("contents", []):
+        key = f"{car.get('title')}_{car.get('date_time')}"
+        current.add(key)
+        if key not in seen:
+            out.append({"plate": car.get("title"), "date_time": car.get("date_time"),
+                        "direction": "entered" if car.get("inout") == "0" else "exited"})
+    return out
+
+
+# Each case is (setup, detect): setup builds the state left by the previous
+# poll outside the timed region, detect runs one poll against it.
+def _visitor_cases(new_rows: int):
+    previous, current = _visitors(0), _visitors(new_rows)
+    legacy = (lambda: {v["file_name"] for v in previous}, lambda seen: _legacy_visitors(current, seen))
+    keyed = (
+        lambda: RecentlySeen(2 * ROWS, (v["file_name"] for v in previous)),
+        lambda seen: seen.add_new(reversed(current), lambda v: v.get("file_name")),
+    )
+    return legacy, keyed
+
+
+def _car_cases(new_rows: int):
+    previous, current = _cars(0), _cars(new_rows)
+    base = CarEntrySync(max_history=2 * ROWS)
+    asyncio.run(base.async_sync(_fetch(previous), ROWS))
+    state = base.as_dict()
+    loop = asyncio.new_event_loop()
+
+    def restored():
+        sync = CarEntrySync(max_history=2 * ROWS)
+        sync.restore(state)
+        return sync
+
+    legacy = (lambda: {f"{c['title']}_{c['date_time']}" for c in previous["contents"]},
+              lambda seen: _legacy_cars(current, seen))
+    keyed = (restored, lambda sync: loop.run_until_complete(sync.async_sync(_fetch(current), ROWS)))
+    return legacy, keyed
+
+
+def _fetch(page: dict):
+    async def fetch(page_no: int, rows: int) -> dict:
+        return page if page_no == 1 else {"contents": [], "exist_next": False}
+    return fetch
+
+
+def _time(case, number: int, repeat: int = 5) -> float:
+    setup, detect = case
+    best = float("inf")
+    for _ in range(repeat):
+        states = [setup() for _ in range(number)]
+        start = time.perf_counter()
+        for state in states:
+            detect(state)
+        best = min(best, time.perf_counter() - start)
+    return best / number
+
+
+def main(number: int = 20) -> None:
+    cases = {
+        "visitors steady": _visitor_cases(1),
+        "visitors burst": _visitor_cases(ROWS),
+        "cars steady": _car_cases(1),
+        "cars burst": _car_cases(ROWS),
+    }
+    for name, (legacy, keyed) in cases.items():
+        assert len(legacy[1](legacy[0]())) == len(keyed[1](keyed[0]())), name
+        base_t, cand_t = _time(legacy, number), _time(keyed, number)
+        print(f"{name:16s} legacy {base_t * 1e3:8.3f} ms  keyed {cand_t * 1e3:8.3f} ms  x{base_t / cand_t:.1f}")
+
+
+if __name__ == "__main__":
+    main()
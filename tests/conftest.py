@@ -46,6 +46,7 @@ class _FakeDataUpdateCoordinator:
     async def async_config_entry_first_refresh(self): pass
     async def async_request_refresh(self): pass
     def async_set_updated_data(self, data): self.data = data
+    def async_update_listeners(self): pass
     def __class_getitem__(cls, item): return cls
 
 class _FakeUpdateFailed(Exception):
@@ -85,6 +86,22 @@ class _FakeUnitOfVolume:
 class _FakeUnitOfTemperature:
     CELSIUS = "°C"
 
+_STORE_DATA: dict = {}
+
+class _FakeStore:
+    """In-memory stand-in for helpers.storage.Store, shared per key like files on disk."""
+    def __init__(self, hass, version, key, **kw):
+        self.key = key
+
+    async def async_load(self):
+        return _STORE_DATA.get(self.key)
+
+    async def async_save(self, data):
+        _STORE_DATA[self.key] = data
+
+    def async_delay_save(self, data_func, delay=0):
+        _STORE_DATA[self.key] = data_func()
+
 # Build the HA module tree
 ha = _make_module("homeassistant")
 ha_core = _make_module("homeassistant.core", ha, {"HomeAssistant": MagicMock, "callback": lambda f: f})
@@ -100,10 +117,17 @@ ha_config_entries = _make_module("homeassistant.config_entries", ha, {
     "ConfigFlow": _FakeConfigFlow,
     "OptionsFlow": _FakeOptionsFlow,
 })
+ha_util = _make_module("homeassistant.util", ha)
+ha_util_ssl = _make_module("homeassistant.util.ssl", ha_util, {
+    "client_context": MagicMock(),
+})
 ha_helpers = _make_module("homeassistant.helpers", ha)
 ha_helpers_aiohttp = _make_module("homeassistant.helpers.aiohttp_client", ha_helpers, {
     "async_get_clientsession": MagicMock(),
 })
+ha_helpers_storage = _make_module("homeassistant.helpers.storage", ha_helpers, {
+    "Store": _FakeStore,
+})
 ha_helpers_entity = _make_module("homeassistant.helpers.entity", ha_helpers, {
     "DeviceInfo": _FakeDeviceInfo,
 })
@@ -251,10 +275,19 @@ def client(mock_session):
     return Client(session=mock_session)
 
 
+@pytest.fixture(autouse=True)
+def _clear_stores():
+    _STORE_DATA.clear()
+    yield
+    _STORE_DATA.clear()
+
+
 @pytest.fixture
-def mock_hass():
+def mock_hass(tmp_path):
     """Minimal mock HomeAssistant object."""
     hass = MagicMock()
+    hass.config.path = lambda *parts: os.path.join(str(tmp_path), *parts)
+    hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
     hass.bus.async_fire = MagicMock()
     hass.services.async_call = AsyncMock()
     return hass
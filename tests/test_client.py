@@ -16,12 +16,21 @@ def _mock_response(status=200, text="", json_data=None):
     if json_data is not None:
         text = json.dumps(json_data)
     resp.text = AsyncMock(return_value=text)
+    resp.read = AsyncMock(return_value=text.encode())
+    resp.content_length = None
+    resp.content = MagicMock()
+    resp.content.iter_chunked = lambda size: _aiter_chunks(text.encode(), size)
     cm = MagicMock()
     cm.__aenter__ = AsyncMock(return_value=resp)
     cm.__aexit__ = AsyncMock(return_value=False)
     return cm
 
 
+async def _aiter_chunks(raw, size):
+    for start in range(0, len(raw), size):
+        yield raw[start:start + size]
+
+
 class TestLogin:
     async def test_login_success(self, client, mock_session):
         """Successful login stores credentials and marks session active."""
@@ -91,6 +100,43 @@ class TestSessionExpiry:
         assert time.time() - client._last_successful_request < 2
 
 
+class TestSingleFlightReauth:
+    async def test_concurrent_reauth_shares_one_login(self, client):
+        import asyncio
+        client._creds = ("user", "pass")
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_login(username, password):
+            started.set()
+            await release.wait()
+            client._login_generation += 1
+
+        client.async_login = AsyncMock(side_effect=slow_login)
+        callers = [asyncio.ensure_future(client._maybe_reauth(0)) for _ in range(5)]
+        await started.wait()
+        release.set()
+        results = await asyncio.gather(*callers)
+
+        assert results == [True] * 5
+        client.async_login.assert_awaited_once()
+
+    async def test_stale_401_after_completed_login_skips_login(self, client):
+        client._creds = ("user", "pass")
+        client._login_generation = 3
+        client.async_login = AsyncMock()
+        assert await client._maybe_reauth(2) is True
+        client.async_login.assert_not_called()
+
+    async def test_failed_login_reported_to_all_waiters(self, client):
+        import asyncio
+        client._creds = ("user", "pass")
+        client.async_login = AsyncMock(side_effect=LoginError("nope"))
+        results = await asyncio.gather(*(client._maybe_reauth(0) for _ in range(3)))
+        assert results == [False] * 3
+        client.async_login.assert_awaited_once()
+
+
 class TestVisitorList:
     async def test_returns_contents(self, client, mock_session):
         client._creds = ("user", "pass")
@@ -133,6 +179,18 @@ class TestVisitorList:
         assert len(result) == 1
         client._maybe_reauth.assert_called_once()
 
+    async def test_persistent_401_retried_only_once(self, client, mock_session):
+        client._creds = ("user", "pass")
+        client._last_successful_request = time.time()
+        mock_session.get.return_value = _mock_response(200, text="ok")
+        mock_session.post.side_effect = lambda *a, **kw: _mock_response(401, text="Unauthorized")
+        client._maybe_reauth = AsyncMock(return_value=True)
+
+        with pytest.raises(ApiError, match="Authentication failed after retry"):
+            await client.async_visitor_list(page_no=1, rows=5)
+        assert mock_session.post.call_count == 2
+        client._maybe_reauth.assert_called_once()
+
     async def test_empty_json_returns_empty_list(self, client, mock_session):
         client._creds = ("user", "pass")
         client._last_successful_request = time.time()
@@ -144,6 +202,203 @@ class TestVisitorList:
         assert result == []
 
 
+class TestPrimingCache:
+    async def test_referer_primed_once_per_session(self, client, mock_session):
+        client._creds = ("user", "pass")
+        client._last_successful_request = time.time()
+        mock_session.get.return_value = _mock_response(200, text="ok")
+        mock_session.post.return_value = _mock_response(200, json_data={"contents": []})
+
+        await client.async_visitor_list(page_no=1, rows=5)
+        await client.async_visitor_list(page_no=1, rows=5)
+        assert mock_session.get.call_count == 1
+        assert mock_session.post.call_count == 2
+
+    async def test_priming_expires_after_ttl(self, client, mock_session):
+        client._creds = ("user", "pass")
+        client._last_successful_request = time.time()
+        mock_session.get.return_value = _mock_response(200, text="ok")
+        mock_session.post.return_value = _mock_response(200, json_data={})
+
+        await client.async_telemetering()
+        client._primed = {k: v - 3600 for k, v in client._primed.items()}
+        await client.async_telemetering()
+        assert mock_session.get.call_count == 2
+
+    async def test_failed_prime_not_cached(self, client, mock_session):
+        mock_session.get.return_value = _mock_response(500, text="err")
+        await client._prime_visitor()
+        await client._prime_visitor()
+        assert mock_session.get.call_count == 2
+
+    async def test_invalidate_session_clears_priming(self, client, mock_session):
+        mock_session.get.return_value = _mock_response(200, text="ok")
+        await client._prime_cookies()
+        assert client._is_primed("cookies")
+        client.invalidate_session()
+        assert not client._is_primed("cookies")
+
+
+class TestImageCache:
+    async def test_image_fetched_once_and_served_from_cache(self, client, mock_session):
+        import base64
+        client._creds = ("user", "pass")
+        client._last_successful_request = time.time()
+        mock_session.get.return_value = _mock_response(200, text="ok")
+        payload = base64.b64encode(b"\xff\xd8jpeg").decode()
+        mock_session.post.return_value = _mock_response(200, json_data={"image": f"data:image/jpeg;base64,{payload}"})
+
+        assert await client.async_visitor_image_bytes("a.jpg") == b"\xff\xd8jpeg"
+        assert await client.async_visitor_image_bytes("a.jpg") == b"\xff\xd8jpeg"
+        assert mock_session.post.call_count == 1
+        assert client.stats["image_cache"]["hits"] == 1
+
+    async def test_oversized_response_rejected(self, client, mock_session):
+        client._creds = ("user", "pass")
+        client._last_successful_request = time.time()
+        mock_session.get.return_value = _mock_response(200, text="ok")
+        resp = _mock_response(200, json_data={"image": "AAAA"})
+        resp.__aenter__.return_value.content_length = 100 * 1024 * 1024
+        mock_session.post.return_value = resp
+        with pytest.raises(ApiError, match="exceeds"):
+            await client.async_visitor_image_bytes("a.jpg")
+
+    async def test_oversized_chunked_response_stops_reading(self, client, mock_session):
+        client._creds = ("user", "pass")
+        client._last_successful_request = time.time()
+        mock_session.get.return_value = _mock_response(200, text="ok")
+        chunks_read = []
+
+        async def endless(size):
+            while True:
+                chunks_read.append(size)
+                yield b"A" * size
+
+        resp = _mock_response(200)
+        resp.__aenter__.return_value.content.iter_chunked = endless
+        mock_session.post.return_value = resp
+        with patch("cvnet.api.client.IMAGE_MAX_BYTES", 200 * 1024):
+            with pytest.raises(ApiError, match="exceeds"):
+                await client.async_visitor_image_bytes("a.jpg")
+        assert len(chunks_read) < 10
+        resp.__aenter__.return_value.read.assert_not_awaited()
+
+    async def test_concurrent_requests_share_one_fetch(self, client):
+        import asyncio
+        client._fetch_visitor_image_bytes = AsyncMock(return_value=b"img")
+        results = await asyncio.gather(*(client.async_visitor_image_bytes("a.jpg") for _ in range(3)))
+        assert results == [b"img"] * 3
+        client._fetch_visitor_image_bytes.assert_awaited_once()
+
+    async def test_failed_fetch_not_cached(self, client):
+        client._fetch_visitor_image_bytes = AsyncMock(return_value=None)
+        await client.async_visitor_image_bytes("a.jpg")
+        await client.async_visitor_image_bytes("a.jpg")
+        assert client._fetch_visitor_image_bytes.await_count == 2
+
+    async def test_persistent_store_used_before_network(self, client):
+        store = MagicMock()
+        store.async_get = AsyncMock(return_value=b"disk")
+        store.async_put = AsyncMock()
+        client.image_store = store
+        client._fetch_visitor_image_bytes = AsyncMock()
+        assert await client.async_visitor_image_bytes("a.jpg") == b"disk"
+        client._fetch_visitor_image_bytes.assert_not_called()
+
+    async def test_fetched_image_written_to_store(self, client):
+        store = MagicMock()
+        store.async_get = AsyncMock(return_value=None)
+        store.async_put = AsyncMock()
+        client.image_store = store
+        client._fetch_visitor_image_bytes = AsyncMock(return_value=b"net")
+        assert await client.async_visitor_image_bytes("a.jpg") == b"net"
+        store.async_put.assert_awaited_once_with("a.jpg", b"net")
+
+    def test_lru_evicts_by_total_bytes(self):
+        from cvnet.api.cache import ByteLRUCache
+        cache = ByteLRUCache(10)
+        cache.put("a", b"1234")
+        cache.put("b", b"1234")
+        cache.get("a")
+        cache.put("c", b"1234")
+        assert "b" not in cache
+        assert "a" in cache and "c" in cache
+        assert cache.size == 8
+        cache.put("big", b"x" * 11)
+        assert "big" not in cache and len(cache) == 2
+
+
+class TestCodec:
+    @pytest.mark.parametrize("fast", [True, False])
+    def test_round_trip_matches_stdlib(self, fast, monkeypatch):
+        from cvnet.api import codec
+        if not fast:
+            monkeypatch.setattr(codec, "orjson", None)
+        obj = {"title": "14러1706", "contents": [{"number": "1"}]}
+        text = codec.dumps(obj)
+        assert text == json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+        assert codec.loads(text.encode("utf-8")) == obj
+        assert codec.loads(memoryview(text.encode("utf-8"))) == obj
+        with pytest.raises(ValueError):
+            codec.loads(b"{broken")
+
+    def test_publish_payload_is_nested_json(self, client):
+        payload = client._build_publish_payload("22", {"request": "control", "number": 1})
+        envelope = json.loads(json.loads(payload)[0])
+        assert json.loads(envelope["body"])["number"] == "1"
+
+
+class TestConnectionPool:
+    async def test_dedicated_session_counts_reuse(self):
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+        from cvnet.api.client import create_session, POOL_LIMIT_PER_HOST
+
+        async def handler(request):
+            return web.Response(text="ok")
+
+        app = web.Application()
+        app.router.add_get("/", handler)
+        stats = {}
+        async with TestServer(app) as server:
+            session = create_session(stats=stats)
+            assert session.connector.limit_per_host == POOL_LIMIT_PER_HOST
+            try:
+                for _ in range(3):
+                    async with session.get(server.make_url("/")) as resp:
+                        await resp.read()
+            finally:
+                await session.close()
+        assert stats["connections_created"] == 1
+        assert stats["connections_reused"] == 2
+
+    async def test_client_owns_and_closes_its_pool(self):
+        client = Client()
+        try:
+            assert client._owns_session
+            assert client.stats["connections_created"] == 0
+        finally:
+            await client.async_close()
+        assert client._session.closed
+
+
+class TestImagePayload:
+    def test_locates_payload_without_parsing(self):
+        from cvnet.api.client import _image_b64_view
+        raw = b'{"type": "image", "image" : "data:image/jpeg;base64,QUJD", "result": 1}'
+        assert bytes(_image_b64_view(raw)) == b"QUJD"
+
+    def test_escaped_payload_falls_back_to_json(self):
+        from cvnet.api.client import _image_b64_view
+        raw = b'{"image":"QU\\/D"}'
+        assert bytes(_image_b64_view(raw)) == b"QU/D"
+
+    def test_missing_or_null_image(self):
+        from cvnet.api.client import _image_b64_view
+        assert _image_b64_view(b'{"result":"ok"}') is None
+        assert _image_b64_view(b'{"image":null}') is None
+
+
 class TestEntranceCarList:
     async def test_returns_normalized_data(self, client, mock_session):
         client._creds = ("user", "pass")
@@ -228,3 +483,438 @@ class TestBackoff:
         client._ws = ws
         client._ws_backoff_attempt = 0
         assert client._ws_backoff_attempt == 0
+
+
+def _status_frame(address, contents):
+    """Build a SockJS ``a[...]`` frame as sent by the Vert.x bridge."""
+    inner = json.dumps({"type": "rec", "address": address, "body": json.dumps({"contents": contents})})
+    return "a" + json.dumps([inner])
+
+
+def _fake_ws(client, replies=None):
+    """Create an open fake WebSocket whose sends trigger frames via the dispatcher."""
+    ws = MagicMock()
+    ws.closed = False
+    del ws._writer
+    sent = []
+
+    async def send_str(payload):
+        sent.append(payload)
+        for frame in (replies or {}).get(len(sent), []):
+            client._dispatch_frame(frame)
+
+    ws.send_str = AsyncMock(side_effect=send_str)
+    ws.close = AsyncMock()
+    ws.sent = sent
+    return ws
+
+
+class TestWebSocketMultiplexing:
+    async def test_status_reply_routed_to_waiter(self, client):
+        fut = client._add_waiter("22", status_only=True)
+        client._dispatch_frame(_status_frame("22", [{"number": "1"}]))
+        data = fut.result()
+        assert data["body"]["contents"] == [{"number": "1"}]
+
+    async def test_frame_for_other_address_not_delivered(self, client):
+        fut = client._add_waiter("22", status_only=True)
+        client._dispatch_frame(_status_frame("18", [{"number": "1"}]))
+        assert not fut.done()
+
+    async def test_status_waiter_ignores_non_status_frames(self, client):
+        fut = client._add_waiter("22", status_only=True)
+        ack = client._add_waiter("22", status_only=False)
+        inner = json.dumps({"address": "22", "body": json.dumps({"request": "control"})})
+        client._dispatch_frame("a" + json.dumps([inner]))
+        assert not fut.done()
+        assert ack.result()["body"] == {"request": "control"}
+
+    async def test_heartbeat_frames_ignored(self, client):
+        fut = client._add_waiter("22", status_only=True)
+        client._dispatch_frame("h")
+        client._dispatch_frame("o")
+        assert not fut.done()
+
+    async def test_status_snapshot_reuses_socket(self, client, mock_session):
+        # send #1 registers, #2 and #3 are status requests
+        ws = _fake_ws(client, replies={
+            2: [_status_frame("22", [{"number": "1"}])],
+            3: [_status_frame("22", [{"number": "2"}])],
+        })
+        client._ws = ws
+
+        first = await client.async_status_snapshot("22")
+        second = await client.async_status_snapshot("22")
+
+        assert first["body"]["contents"] == [{"number": "1"}]
+        assert second["body"]["contents"] == [{"number": "2"}]
+        mock_session.ws_connect.assert_not_called()
+        assert len(ws.sent) == 3
+        assert client._ws_waiters == {}
+
+    async def test_close_fails_pending_waiters(self, client):
+        from cvnet.api.client import ConnectionError as CvnetConnectionError
+        client._ws = _fake_ws(client)
+        fut = client._add_waiter("22", status_only=True)
+        await client._close_ws()
+        with pytest.raises(CvnetConnectionError):
+            fut.result()
+        assert client._ws is None
+
+    async def test_unsolicited_status_frame_reaches_listener(self, client):
+        listener = MagicMock()
+        remove = client.add_status_listener("22", listener)
+        client._dispatch_frame(_status_frame("22", [{"number": "1"}]))
+        listener.assert_called_once()
+        assert listener.call_args[0][0] == "22"
+        remove()
+        client._dispatch_frame(_status_frame("22", [{"number": "1"}]))
+        listener.assert_called_once()
+
+    async def test_solicited_reply_not_sent_to_listener(self, client):
+        listener = MagicMock()
+        client.add_status_listener("22", listener)
+        fut = client._add_waiter("22", status_only=True)
+        client._dispatch_frame(_status_frame("22", []))
+        assert fut.done()
+        listener.assert_not_called()
+
+
+class TestStatusBudget:
+    async def test_silent_address_returns_empty_within_budget(self, client):
+        import asyncio
+        client._ws = _fake_ws(client)  # never replies
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        with patch.object(client, "_ensure_ws", AsyncMock(return_value=client._ws)):
+            result = await client.async_status_snapshot("22", budget=0.2)
+        assert result == {}
+        assert loop.time() - started < 1.0
+        assert client.stats["status_budget_exhausted"] == 1
+        assert client._ws_waiters == {}
+
+    @staticmethod
+    async def _fast_snapshot(client, ensure_ws, timeouts):
+        """Run async_status_snapshot with the real default budget, 100x faster."""
+        import asyncio
+        real_wait_for, real_sleep = asyncio.wait_for, asyncio.sleep
+
+        async def fast_wait_for(aw, timeout):
+            timeouts.append(timeout)
+            return await real_wait_for(aw, timeout / 100)
+
+        async def fast_sleep(delay):
+            await real_sleep(delay / 100)
+
+        with patch.object(client, "_ensure_ws", AsyncMock(side_effect=ensure_ws)) as ensure, \
+                patch("cvnet.api.client.asyncio.wait_for", fast_wait_for), \
+                patch("cvnet.api.client.asyncio.sleep", fast_sleep):
+            result = await client.async_status_snapshot("22")
+        return result, ensure
+
+    async def test_dead_socket_replaced_within_default_budget(self, client):
+        from cvnet.const import STATUS_BUDGET_S
+        silent = _fake_ws(client)
+        fresh = _fake_ws(client, replies={2: [_status_frame("22", [{"number": "1"}])]})
+        client._ws = silent
+        client._ws_last_frame = time.monotonic() - 120  # not even heartbeats lately
+
+        async def ensure_ws(force_new=False):
+            if force_new:
+                client._registered.clear()
+                client._ws = fresh
+            return client._ws
+
+        timeouts = []
+        result, _ = await self._fast_snapshot(client, ensure_ws, timeouts)
+
+        assert result["body"]["contents"] == [{"number": "1"}]
+        assert timeouts[0] <= STATUS_BUDGET_S / 2
+        assert client._ws is fresh
+        assert client.stats["status_budget_exhausted"] == 0
+
+    async def test_silent_address_keeps_live_shared_socket(self, client):
+        ws = _fake_ws(client)  # the socket is alive but "22" never answers
+        client._ws = ws
+        client._ws_last_frame = time.monotonic()
+        client._registered.update({"22", "18"})
+        other = client._add_waiter("18", status_only=True)
+
+        async def ensure_ws(force_new=False):
+            return client._ws
+
+        result, ensure = await self._fast_snapshot(client, ensure_ws, [])
+
+        assert result == {}
+        assert client._ws is ws
+        ws.close.assert_not_awaited()
+        assert not other.done()
+        assert "18" in client._registered
+        assert all(not call.kwargs.get("force_new") for call in ensure.await_args_list)
+
+    async def test_backoff_capped_by_max_delay(self, client):
+        client._ws_backoff_attempt = 5
+        with patch("cvnet.api.client.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            await client._ws_backoff_wait(max_delay=0.5)
+        assert sleep.await_args[0][0] <= 0.5
+
+
+class TestPublish:
+    async def test_acked_publish_skips_xhr(self, client, mock_session):
+        ack = "a" + json.dumps([json.dumps({"address": "18", "body": json.dumps({"result": "ok"})})])
+        ws = _fake_ws(client, replies={2: [ack]})  # send #1 registers, #2 publishes
+        client._ws = ws
+        client._mark_primed("cookies")
+
+        result = await client.async_publish("18", {"request": "control", "number": "2", "onoff": "1"})
+
+        assert result["body"] == {"result": "ok"}
+        assert len(ws.sent) == 2
+        mock_session.post.assert_not_called()
+        assert client.stats["command_latency"]["ws"]["count"] == 1
+
+    async def test_missing_ack_falls_back_to_xhr(self, client, mock_session):
+        client._ws = _fake_ws(client)
+        client._mark_primed("cookies")
+        mock_session.post.return_value = _mock_response(204, text="")
+
+        with patch("cvnet.api.client.WS_ACK_TIMEOUT", 0.01):
+            result = await client.async_publish("18", {"request": "control", "number": "2", "onoff": "1"})
+
+        assert result == {}
+        mock_session.post.assert_called_once()
+        assert "xhr_send" in mock_session.post.call_args[0][0]
+        assert client.stats["command_latency"]["xhr"]["count"] == 1
+
+    async def test_ws_send_failure_falls_back_to_xhr(self, client, mock_session):
+        ws = _fake_ws(client)
+        ws.send_str = AsyncMock(side_effect=ConnectionResetError("gone"))
+        client._ws = ws
+        client._registered.add("18")
+        client._mark_primed("cookies")
+        mock_session.post.return_value = _mock_response(204, text="")
+
+        await client.async_publish("18", {"request": "control", "number": "2", "onoff": "0"})
+
+        mock_session.post.assert_called_once()
+        assert client._ws is None
+
+    async def test_xhr_fallback_runs_before_socket_teardown(self, client, mock_session):
+        ws = _fake_ws(client)
+        ws.send_str = AsyncMock(side_effect=ConnectionResetError("gone"))
+        client._ws = ws
+        client._registered.add("18")
+        client._sockjs_server, client._sockjs_session = "123", "abcd1234"
+        client._mark_primed("cookies")
+        closed_at_post = []
+
+        def post(url, **kwargs):
+            closed_at_post.append(ws.close.await_count)
+            return _mock_response(204, text="")
+
+        mock_session.post.side_effect = post
+        await client.async_publish("18", {"request": "control", "number": "2", "onoff": "0"})
+
+        assert "/123/abcd1234/xhr_send" in mock_session.post.call_args[0][0]
+        assert closed_at_post == [0]
+        ws.close.assert_awaited_once()
+
+    async def test_written_but_unconfirmed_command_not_resent(self, client, mock_session):
+        ws = _fake_ws(client)
+        client._ws = ws
+        client._registered.add("18")
+        client._mark_primed("cookies")
+        mock_session.post.return_value = _mock_response(500, text="error")
+
+        with patch("cvnet.api.client.WS_ACK_TIMEOUT", 0.01):
+            result = await client.async_publish("18", {"request": "control", "number": "2", "onoff": "1"})
+
+        assert result == {}
+        assert len(ws.sent) == 1
+        mock_session.post.assert_called_once()
+        assert client.stats["commands_unconfirmed"] == 1
+
+
+class TestPublishMany:
+    async def test_frames_pipelined_on_one_socket(self, client, mock_session):
+        def ack(n):
+            return "a" + json.dumps([json.dumps({"address": "22", "body": json.dumps({"n": n})})])
+
+        # send #1 registers; acks arrive after the last of the three publishes
+        ws = _fake_ws(client, replies={4: [ack(1), ack(2), ack(3)]})
+        client._ws = ws
+        client._mark_primed("cookies")
+        bodies = [{"request": "control", "number": str(n), "onoff": "1", "temp": "21"} for n in (1, 2, 3)]
+
+        results = await client.async_publish_many("22", bodies)
+
+        assert [r["path"] for r in results] == ["ws", "ws", "ws"]
+        assert [r["ack"]["body"]["n"] for r in results] == [1, 2, 3]
+        assert len(ws.sent) == 4
+        assert sum("register" in p for p in ws.sent) == 1
+        mock_session.post.assert_not_called()
+        mock_session.ws_connect.assert_not_called()
+
+    async def test_unacked_items_fall_back_to_xhr(self, client, mock_session):
+        ack = "a" + json.dumps([json.dumps({"address": "22", "body": "{}"})])
+        client._ws = _fake_ws(client, replies={3: [ack]})
+        client._mark_primed("cookies")
+        mock_session.post.return_value = _mock_response(204, text="")
+        bodies = [{"request": "control", "number": str(n)} for n in (1, 2)]
+
+        with patch("cvnet.api.client.WS_ACK_TIMEOUT", 0.01):
+            results = await client.async_publish_many("22", bodies)
+
+        assert results[0]["path"] == "ws"
+        assert results[1] == {"ok": True, "path": "xhr"}
+        assert mock_session.post.call_count == 1
+
+    async def test_empty_batch(self, client, mock_session):
+        assert await client.async_publish_many("22", []) == []
+        mock_session.post.assert_not_called()
+
+
+class TestCommandQueue:
+    async def test_rapid_commands_for_same_zone_coalesce(self, client):
+        import asyncio
+        client.async_publish = AsyncMock(return_value={"body": "ack"})
+        bodies = [{"request": "control", "number": "1", "onoff": "1", "temp": str(t)} for t in range(20, 25)]
+
+        with patch("cvnet.api.client.COMMAND_COALESCE_WINDOW", 0.01):
+            results = await asyncio.gather(*(client.async_queue_command("22", b) for b in bodies))
+
+        client.async_publish.assert_awaited_once_with("22", bodies[-1])
+        assert results == [{"body": "ack"}] * 5
+
+    async def test_different_zones_sent_as_one_batch(self, client):
+        import asyncio
+        client.async_publish_many = AsyncMock(return_value=[
+            {"ok": True, "path": "ws", "ack": {"n": 1}},
+            {"ok": False, "error": "boom"},
+        ])
+        first = {"request": "control", "number": "1", "temp": "21"}
+        second = {"request": "control", "number": "2", "temp": "19"}
+
+        with patch("cvnet.api.client.COMMAND_COALESCE_WINDOW", 0.01):
+            results = await asyncio.gather(
+                client.async_queue_command("22", first),
+                client.async_queue_command("22", second),
+                return_exceptions=True,
+            )
+
+        client.async_publish_many.assert_awaited_once_with("22", [first, second])
+        assert results[0] == {"n": 1}
+        assert isinstance(results[1], ApiError)
+
+    async def test_control_all_keeps_order_with_zone_commands(self, client):
+        import asyncio
+        client.async_publish_many = AsyncMock(return_value=[{"ok": True, "path": "ws", "ack": {}}] * 2)
+        zone_on = {"request": "control", "number": "1", "onoff": "1"}
+        all_off = {"request": "control_all", "onoff": "0"}
+
+        with patch("cvnet.api.client.COMMAND_COALESCE_WINDOW", 0.01):
+            await asyncio.gather(
+                client.async_queue_command("22", zone_on),
+                client.async_queue_command("22", all_off),
+            )
+
+        client.async_publish_many.assert_awaited_once_with("22", [zone_on, all_off])
+
+    async def test_close_fails_commands_being_sent(self, client):
+        import asyncio
+        sending = asyncio.Event()
+
+        async def publish(address, body):
+            sending.set()
+            await asyncio.sleep(10)
+
+        client.async_publish = AsyncMock(side_effect=publish)
+        with patch("cvnet.api.client.COMMAND_COALESCE_WINDOW", 0.01):
+            queued = asyncio.ensure_future(client.async_queue_command("22", {"number": "1", "temp": "21"}))
+            await sending.wait()
+            await client.async_close()
+            with pytest.raises(ApiError, match="Client closed"):
+                await asyncio.wait_for(queued, timeout=1)
+
+    async def test_commands_queued_during_send_are_flushed_next(self, client):
+        import asyncio
+        sent = []
+
+        async def publish(address, body):
+            sent.append(body["temp"])
+            if len(sent) == 1:
+                # A newer command arrives while the first one is on the wire
+                asyncio.ensure_future(client.async_queue_command("22", {"number": "1", "temp": "23"}))
+                await asyncio.sleep(0.02)
+            return {}
+
+        client.async_publish = AsyncMock(side_effect=publish)
+        with patch("cvnet.api.client.COMMAND_COALESCE_WINDOW", 0.01):
+            await client.async_queue_command("22", {"number": "1", "temp": "21"})
+            await asyncio.sleep(0.1)
+
+        assert sent == ["21", "23"]
+
+
+class TestKeepAlive:
+    def test_lifetime_defaults_to_configured_timeout(self, client):
+        assert client.session_lifetime == 24 * 3600
+
+    def test_401_teaches_session_lifetime(self, client):
+        client._login_generation = 1
+        client._login_at = time.monotonic() - 1800
+        client._observe_session_expiry(1)
+        assert 1790 < client.session_lifetime < 1810
+
+    def test_401_from_older_session_ignored(self, client):
+        client._login_generation = 2
+        client._login_at = time.monotonic() - 1800
+        client._observe_session_expiry(1)
+        assert client.session_lifetime == 24 * 3600
+
+    def test_early_401_does_not_pin_short_lifetime(self, client):
+        from cvnet.api.client import SESSION_LIFETIME_FLOOR
+        client._login_generation = 1
+        for age in (1800, 1800, 301):
+            client._login_at = time.monotonic() - age
+            client._observe_session_expiry(1)
+        assert 1790 < client.session_lifetime < 1810
+        client._session_lifetimes.clear()
+        client._observe_session_expiry(1)
+        assert client.session_lifetime == SESSION_LIFETIME_FLOOR
+
+    def test_lifetime_samples_expire(self, client):
+        from cvnet.api.client import SESSION_LIFETIME_SAMPLE_TTL
+        client._session_lifetimes.append((time.monotonic() - SESSION_LIFETIME_SAMPLE_TTL - 1, 1800.0))
+        assert client.session_lifetime == 24 * 3600
+        assert not client._session_lifetimes
+
+    def test_learned_lifetime_marks_session_expired(self, client):
+        client._last_successful_request = time.time()
+        client._session_lifetimes.append((time.monotonic(), 1800.0))
+        client._login_at = time.monotonic() - 1900
+        assert client._is_session_expired() is True
+
+    async def test_keepalive_refreshes_before_expiry(self, client):
+        import asyncio
+        client._creds = ("user", "pass")
+        client._session_lifetimes.append((time.monotonic(), 2000.0))
+        client._login_at = time.monotonic() - 1700  # past 80% of the lifetime
+        refreshed = asyncio.Event()
+
+        async def login(username, password):
+            client._login_at = time.monotonic()
+            client._login_generation += 1
+            refreshed.set()
+
+        client.async_login = AsyncMock(side_effect=login)
+        client.start_keepalive()
+        await asyncio.wait_for(refreshed.wait(), timeout=1)
+        for _ in range(10):
+            if client.stats["keepalive_refreshes"]:
+                break
+            await asyncio.sleep(0)
+        await client.async_close()
+
+        client.async_login.assert_awaited_once_with("user", "pass")
+        assert client.stats["keepalive_refreshes"] == 1
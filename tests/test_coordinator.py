@@ -6,16 +6,20 @@ from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from cvnet.core.coordinator import CvnetCoordinator
+from cvnet.core.seen import RecentlySeen
+from cvnet.api.client import ApiError
 from cvnet.const import (
     DEFAULT_UPDATE_INTERVAL, DEFAULT_VISITOR_ROWS, DEFAULT_CAR_ROWS,
+    DEFAULT_DEVICE_INTERVAL, DEFAULT_TELEMETER_INTERVAL,
     CONF_UPDATE_INTERVAL, CONF_VISITOR_ROWS, CONF_CAR_ROWS,
+    CONF_DEVICE_INTERVAL, CONF_TELEMETER_INTERVAL,
 )
 
 
 @pytest.fixture
 def coordinator(mock_hass, mock_entry):
     """Create a CvnetCoordinator with mocked HA and entry."""
-    with patch("cvnet.core.coordinator.async_get_clientsession", return_value=MagicMock()):
+    with patch("cvnet.api.client.create_session", return_value=MagicMock()):
         coord = CvnetCoordinator(mock_hass, mock_entry)
     coord.client = MagicMock()
     coord.client.async_login = AsyncMock()
@@ -25,6 +29,8 @@ def coordinator(mock_hass, mock_entry):
     })
     coord.client.async_status_snapshot = AsyncMock(return_value={})
     coord.client.async_telemetering = AsyncMock(return_value={})
+    coord.client.async_ensure_subscriptions = AsyncMock()
+    coord.client.async_visitor_image_bytes = AsyncMock(return_value=b"img")
     coord.client.has_credentials = True
     coord.client._creds = ("testuser", "testpass")
     coord.async_request_refresh = AsyncMock()
@@ -33,25 +39,27 @@ def coordinator(mock_hass, mock_entry):
 
 class TestCoordinatorInit:
     def test_default_interval(self, mock_hass, mock_entry):
-        with patch("cvnet.core.coordinator.async_get_clientsession"):
+        with patch("cvnet.api.client.create_session"):
             coord = CvnetCoordinator(mock_hass, mock_entry)
         assert coord.update_interval == timedelta(seconds=DEFAULT_UPDATE_INTERVAL)
+        assert coord.devices.update_interval == timedelta(seconds=DEFAULT_DEVICE_INTERVAL)
+        assert coord.telemeter.update_interval == timedelta(seconds=DEFAULT_TELEMETER_INTERVAL)
 
     def test_default_rows(self, mock_hass, mock_entry):
-        with patch("cvnet.core.coordinator.async_get_clientsession"):
+        with patch("cvnet.api.client.create_session"):
             coord = CvnetCoordinator(mock_hass, mock_entry)
         assert coord._visitor_rows == DEFAULT_VISITOR_ROWS
         assert coord._car_rows == DEFAULT_CAR_ROWS
 
     def test_options_override_interval(self, mock_hass, mock_entry):
         mock_entry.options = {CONF_UPDATE_INTERVAL: 30}
-        with patch("cvnet.core.coordinator.async_get_clientsession"):
+        with patch("cvnet.api.client.create_session"):
             coord = CvnetCoordinator(mock_hass, mock_entry)
         assert coord.update_interval == timedelta(seconds=30)
 
     def test_options_override_rows(self, mock_hass, mock_entry):
         mock_entry.options = {CONF_VISITOR_ROWS: 10, CONF_CAR_ROWS: 20}
-        with patch("cvnet.core.coordinator.async_get_clientsession"):
+        with patch("cvnet.api.client.create_session"):
             coord = CvnetCoordinator(mock_hass, mock_entry)
         assert coord._visitor_rows == 10
         assert coord._car_rows == 20
@@ -62,6 +70,11 @@ class TestApplyOptions:
         coordinator.apply_options({CONF_UPDATE_INTERVAL: 60})
         assert coordinator.update_interval == timedelta(seconds=60)
 
+    def test_apply_options_updates_source_intervals(self, coordinator):
+        coordinator.apply_options({CONF_DEVICE_INTERVAL: 20, CONF_TELEMETER_INTERVAL: 900})
+        assert coordinator.devices.update_interval == timedelta(seconds=20)
+        assert coordinator.telemeter.update_interval == timedelta(seconds=900)
+
     def test_apply_options_updates_rows(self, coordinator):
         coordinator.apply_options({CONF_VISITOR_ROWS: 15, CONF_CAR_ROWS: 25})
         assert coordinator._visitor_rows == 15
@@ -131,7 +144,6 @@ class TestPagination:
 
 class TestNewVisitorDetection:
     async def test_first_run_skips_notification(self, coordinator, mock_hass):
-        coordinator._first_run = True
         coordinator._visitor_list = [
             {"file_name": "img1.jpg", "date_time": "2025-01-01", "title": "Visitor 1"},
         ]
@@ -142,7 +154,7 @@ class TestNewVisitorDetection:
 
     async def test_fires_event_on_new_visitor(self, coordinator, mock_hass):
         coordinator._first_run = False
-        coordinator._seen_visitors = {"old.jpg"}
+        coordinator._seen_visitors = RecentlySeen(10, ["old.jpg"])
         coordinator._visitor_list = [
             {"file_name": "old.jpg", "date_time": "2025-01-01", "title": "old"},
             {"file_name": "new.jpg", "date_time": "2025-01-02", "title": "new"},
@@ -155,16 +167,42 @@ class TestNewVisitorDetection:
 
     async def test_selects_new_visitor(self, coordinator, mock_hass):
         coordinator._first_run = False
-        coordinator._seen_visitors = {"old.jpg"}
+        coordinator._seen_visitors = RecentlySeen(10, ["old.jpg"])
         coordinator._visitor_list = [
             {"file_name": "new.jpg", "date_time": "2025-01-02", "title": "new"},
         ]
         await coordinator._check_new_visitors()
         assert coordinator._selected == "new.jpg"
 
+    async def test_image_prefetched_before_event(self, coordinator, mock_hass):
+        coordinator._first_run = False
+        coordinator._seen_visitors = RecentlySeen(10)
+        coordinator._visitor_list = [{"file_name": "new.jpg", "date_time": "2025-01-02"}]
+        await coordinator._check_new_visitors()
+        coordinator.client.async_visitor_image_bytes.assert_awaited_once_with("new.jpg")
+        assert mock_hass.bus.async_fire.call_args[0][1]["image_ready"] is True
+
+    async def test_slow_prefetch_does_not_hold_event(self, coordinator, mock_hass):
+        import asyncio
+        started = asyncio.Event()
+
+        async def slow(file_name):
+            started.set()
+            await asyncio.sleep(10)
+
+        coordinator._first_run = False
+        coordinator._seen_visitors = RecentlySeen(10)
+        coordinator._visitor_list = [{"file_name": "new.jpg", "date_time": "2025-01-02"}]
+        coordinator.client.async_visitor_image_bytes = AsyncMock(side_effect=slow)
+        with patch("cvnet.core.coordinator.IMAGE_PREFETCH_WAIT_S", 0.05):
+            await coordinator._check_new_visitors()
+        assert mock_hass.bus.async_fire.call_args[0][1]["image_ready"] is False
+        assert len(coordinator._prefetch_tasks) == 1
+        await coordinator.async_close()
+
     async def test_no_event_when_no_new_visitors(self, coordinator, mock_hass):
         coordinator._first_run = False
-        coordinator._seen_visitors = {"img1.jpg"}
+        coordinator._seen_visitors = RecentlySeen(10, ["img1.jpg"])
         coordinator._visitor_list = [
             {"file_name": "img1.jpg", "date_time": "2025-01-01", "title": "same"},
         ]
@@ -172,24 +210,26 @@ class TestNewVisitorDetection:
         mock_hass.bus.async_fire.assert_not_called()
 
 
+def _car_page(entries, exist_next=False):
+    return {"contents": entries, "exist_next": exist_next, "page_no": "1", "rows": "5"}
+
+
 class TestNewCarDetection:
-    async def test_first_run_skips_notification(self, coordinator, mock_hass):
-        coordinator._first_run = True
-        coordinator._car_contents = [
+    async def test_first_sync_skips_notification(self, coordinator, mock_hass):
+        coordinator.client.async_entrancecar_list = AsyncMock(return_value=_car_page([
             {"title": "12가3456", "date_time": "2025-01-01 10:00", "inout": "0"},
-        ]
-        await coordinator._check_new_car_entries()
+        ]))
+        await coordinator._async_update_data()
         mock_hass.bus.async_fire.assert_not_called()
-        assert len(coordinator._seen_cars) == 1
+        assert coordinator._car_sync.cursor == ("2025-01-01 10:00", "12가3456")
 
     async def test_fires_event_on_new_car(self, coordinator, mock_hass):
-        coordinator._first_run = False
-        coordinator._seen_cars = {"12가3456_2025-01-01 10:00"}
-        coordinator._car_contents = [
-            {"title": "12가3456", "date_time": "2025-01-01 10:00", "inout": "0"},
-            {"title": "78나9012", "date_time": "2025-01-01 11:00", "inout": "1"},
-        ]
-        await coordinator._check_new_car_entries()
+        old = {"title": "12가3456", "date_time": "2025-01-01 10:00", "inout": "0"}
+        new = {"title": "78나9012", "date_time": "2025-01-01 11:00", "inout": "1"}
+        coordinator.client.async_entrancecar_list = AsyncMock(return_value=_car_page([old]))
+        await coordinator._async_update_data()
+        coordinator.client.async_entrancecar_list = AsyncMock(return_value=_car_page([new, old]))
+        await coordinator._async_update_data()
         mock_hass.bus.async_fire.assert_called_once()
         args = mock_hass.bus.async_fire.call_args
         assert args[0][0] == "cvnet_car_entry"
@@ -197,15 +237,538 @@ class TestNewCarDetection:
         assert args[0][1]["direction"] == "exited"
 
     async def test_car_entered_direction(self, coordinator, mock_hass):
-        coordinator._first_run = False
-        coordinator._seen_cars = set()
-        coordinator._car_contents = [
+        await coordinator._check_new_car_entries([
             {"title": "12가3456", "date_time": "2025-01-01 10:00", "inout": "0"},
-        ]
-        await coordinator._check_new_car_entries()
+        ])
         args = mock_hass.bus.async_fire.call_args
         assert args[0][1]["direction"] == "entered"
 
+    async def test_page_one_display_reuses_sync_fetch(self, coordinator):
+        await coordinator._async_update_data()
+        assert coordinator.client.async_entrancecar_list.await_count == 1
+
+
+class TestCarEntrySync:
+    def _entry(self, minute, plate="12가3456"):
+        return {"title": plate, "date_time": f"2025-01-01 10:{minute:02d}", "inout": "0"}
+
+    async def test_steady_state_reads_one_page(self):
+        from cvnet.core.car_sync import CarEntrySync
+        sync = CarEntrySync()
+        fetch = AsyncMock(return_value=_car_page([self._entry(1)], exist_next=True))
+        await sync.async_sync(fetch, 5)
+        assert await sync.async_sync(fetch, 5) == []
+        assert fetch.await_count == 2
+
+    async def test_burst_collected_across_pages_oldest_first(self):
+        from cvnet.core.car_sync import CarEntrySync
+        sync = CarEntrySync()
+        await sync.async_sync(AsyncMock(return_value=_car_page([self._entry(0)])), 5)
+        pages = {
+            1: _car_page([self._entry(4), self._entry(3)], exist_next=True),
+            2: _car_page([self._entry(2), self._entry(1)], exist_next=True),
+            3: _car_page([self._entry(0)], exist_next=True),
+        }
+        fetch = AsyncMock(side_effect=lambda page_no, rows: pages[page_no])
+        new = await sync.async_sync(fetch, 5)
+        assert [e["date_time"][-2:] for e in new] == ["01", "02", "03", "04"]
+        # Page 1 at the display size, then catch-up pages 1-3 at the larger size
+        assert [c.args for c in fetch.await_args_list] == [(1, 5), (1, 50), (2, 50), (3, 50)]
+        assert sync.cursor == ("2025-01-01 10:04", "12가3456")
+        assert len(sync.seen) == 5
+
+    async def test_interrupted_catch_up_resumes_at_next_page(self):
+        import asyncio
+        from cvnet.core.car_sync import CarEntrySync
+        sync = CarEntrySync()
+        await sync.async_sync(AsyncMock(return_value=_car_page([self._entry(0)])), 5)
+        pages = {
+            1: _car_page([self._entry(4), self._entry(3)], exist_next=True),
+            2: _car_page([self._entry(2), self._entry(1)], exist_next=True),
+            3: _car_page([self._entry(0)], exist_next=True),
+        }
+        stalled = asyncio.Event()
+
+        async def slow_fetch(page_no, rows):
+            if page_no == 2:
+                await stalled.wait()
+            return pages[page_no]
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(sync.async_sync(slow_fetch, 5), timeout=0.05)
+        assert sync.catching_up
+        assert sync.cursor == ("2025-01-01 10:00", "12가3456")
+
+        fetch = AsyncMock(side_effect=lambda page_no, rows: pages[page_no])
+        new = await sync.async_sync(fetch, 5)
+        assert [c.args for c in fetch.await_args_list] == [(1, 5), (2, 50), (3, 50)]
+        assert [e["date_time"][-2:] for e in new] == ["01", "02", "03", "04"]
+        assert not sync.catching_up
+
+    async def test_same_minute_different_plate_is_new(self):
+        from cvnet.core.car_sync import CarEntrySync
+        sync = CarEntrySync()
+        await sync.async_sync(AsyncMock(return_value=_car_page([self._entry(5)])), 5)
+        other = self._entry(5, plate="78나9012")
+        new = await sync.async_sync(AsyncMock(return_value=_car_page([other, self._entry(5)])), 5)
+        assert new == [other]
+
+    async def test_failed_page_keeps_state(self):
+        from cvnet.core.car_sync import CarEntrySync
+        sync = CarEntrySync()
+        await sync.async_sync(AsyncMock(return_value=_car_page([self._entry(0)])), 5)
+        fetch = AsyncMock(side_effect=[_car_page([self._entry(2)], exist_next=True), ApiError("boom")])
+        with pytest.raises(ApiError):
+            await sync.async_sync(fetch, 5)
+        assert sync.cursor == ("2025-01-01 10:00", "12가3456")
+
+    async def test_history_is_bounded(self):
+        from cvnet.core.car_sync import CarEntrySync
+        sync = CarEntrySync(max_history=2)
+        await sync.async_sync(AsyncMock(return_value=_car_page([])), 5)
+        for minute in range(4):
+            await sync.async_sync(AsyncMock(return_value=_car_page([self._entry(minute)])), 5)
+        assert len(sync.seen) == 2
+        assert ("2025-01-01 10:00", "12가3456") not in sync.seen
+
+
+class TestSeenPersistence:
+    def test_recently_seen_is_bounded(self):
+        seen = RecentlySeen(2)
+        assert seen.add("a") and seen.add("b") and not seen.add("a")
+        seen.add("c")
+        assert "a" not in seen and list(seen) == ["b", "c"]
+
+    def test_add_new_returns_new_items_in_order(self):
+        seen = RecentlySeen(10, ["b"])
+        items = [{"k": "a"}, {"k": "b"}, {"k": None}, {"k": "c"}, {"k": "a"}]
+        assert seen.add_new(items, lambda item: item["k"]) == [{"k": "a"}, {"k": "c"}]
+
+    async def test_restart_reports_arrivals_missed_while_down(self, coordinator, mock_hass, mock_entry):
+        old_car = {"title": "12가3456", "date_time": "2025-01-01 10:00", "inout": "0"}
+        coordinator.client.async_visitor_list = AsyncMock(return_value=[{"file_name": "old.jpg"}])
+        coordinator.client.async_entrancecar_list = AsyncMock(return_value=_car_page([old_car]))
+        await coordinator._async_update_data()
+        await coordinator.async_close()
+        mock_hass.bus.async_fire.assert_not_called()
+
+        with patch("cvnet.api.client.create_session", return_value=MagicMock()):
+            restarted = CvnetCoordinator(mock_hass, mock_entry)
+        restarted.client = coordinator.client
+        restarted.async_request_refresh = AsyncMock()
+        new_car = {"title": "78나9012", "date_time": "2025-01-01 11:00", "inout": "0"}
+        restarted.client.async_visitor_list = AsyncMock(return_value=[{"file_name": "new.jpg"}, {"file_name": "old.jpg"}])
+        restarted.client.async_entrancecar_list = AsyncMock(return_value=_car_page([new_car, old_car]))
+        await restarted._async_update_data()
+        fired = [(c[0][0], c[0][1].get("file_name") or c[0][1].get("plate")) for c in mock_hass.bus.async_fire.call_args_list]
+        assert fired == [("cvnet_new_visitor", "new.jpg"), ("cvnet_car_entry", "78나9012")]
+        await restarted.async_close()
+
+
+class TestPushStatus:
+    async def test_push_updates_data_and_notifies(self, coordinator):
+        devices = coordinator.devices
+        devices.async_set_updated_data = MagicMock()
+        devices._handle_push("22", {"body": {"contents": [{"number": "1", "onoff": "1"}]}})
+        data = devices.async_set_updated_data.call_args[0][0]
+        assert data["heaters"]["body"]["contents"] == [{"number": "1", "onoff": "1"}]
+
+    async def test_push_merges_partial_frames_by_number(self, coordinator):
+        coordinator.devices._handle_push("18", {"body": {"contents": [
+            {"number": "1", "onoff": "0"}, {"number": "2", "onoff": "0"},
+        ]}})
+        coordinator.devices._handle_push("18", {"body": {"contents": [{"number": "2", "onoff": "1"}]}})
+        assert coordinator.devices.data["lights"]["body"]["contents"] == [
+            {"number": "1", "onoff": "0"}, {"number": "2", "onoff": "1"},
+        ]
+
+    async def test_update_skips_polling_while_push_is_fresh(self, coordinator):
+        coordinator.devices._handle_push("22", {"body": {"contents": [{"number": "1"}]}})
+        coordinator.devices._handle_push("18", {"body": {"contents": [{"number": "2"}]}})
+        data = await coordinator.devices._async_update_data()
+        coordinator.client.async_status_snapshot.assert_not_called()
+        assert data["heaters"]["body"]["contents"] == [{"number": "1"}]
+
+    async def test_update_polls_without_push(self, coordinator):
+        coordinator.client.async_status_snapshot = AsyncMock(
+            return_value={"body": {"contents": [{"number": "1"}]}}
+        )
+        data = await coordinator.devices._async_update_data()
+        assert coordinator.client.async_status_snapshot.await_count == 2
+        assert data["lights"]["body"]["contents"] == [{"number": "1"}]
+
+    async def test_successful_poll_counts_as_fresh_status(self, coordinator):
+        devices = coordinator.devices
+        devices._handle_push("22", {"body": {"contents": [{"number": "1"}]}})
+        devices._handle_push("18", {"body": {"contents": [{"number": "2"}]}})
+        devices._last_status.clear()  # push has gone quiet
+        coordinator.client.async_status_snapshot = AsyncMock(
+            return_value={"body": {"contents": [{"number": "1"}]}}
+        )
+        await devices._async_update_data()
+        await devices._async_update_data()
+        assert coordinator.client.async_status_snapshot.await_count == 2
+
+    async def test_polls_until_a_push_frame_arrives(self, coordinator):
+        coordinator.client.async_status_snapshot = AsyncMock(
+            return_value={"body": {"contents": [{"number": "1"}]}}
+        )
+        await coordinator.devices._async_update_data()
+        await coordinator.devices._async_update_data()
+        assert coordinator.client.async_status_snapshot.await_count == 4
+
+    async def test_requested_refresh_polls_while_push_is_fresh(self, coordinator):
+        devices = coordinator.devices
+        devices._handle_push("22", {"body": {"contents": [{"number": "1"}]}})
+        devices._handle_push("18", {"body": {"contents": [{"number": "2"}]}})
+        await devices.async_request_refresh()
+        await devices._async_update_data()
+        assert coordinator.client.async_status_snapshot.await_count == 2
+        await devices._async_update_data()
+        assert coordinator.client.async_status_snapshot.await_count == 2
+
+    async def test_polls_every_cycle_without_subscriptions(self, coordinator):
+        coordinator.client.async_ensure_subscriptions = AsyncMock(side_effect=ApiError("no socket"))
+        coordinator.client.async_status_snapshot = AsyncMock(
+            return_value={"body": {"contents": [{"number": "1"}]}}
+        )
+        await coordinator.devices._async_update_data()
+        await coordinator.devices._async_update_data()
+        assert coordinator.client.async_status_snapshot.await_count == 4
+
+
+class TestZoneIndex:
+    async def test_push_rebuilds_heater_zones(self, coordinator):
+        devices = coordinator.devices
+        devices._handle_push("22", {"body": {"contents": [
+            {"number": 1, "onoff": "1", "current_temp": "21.5", "setting_temp": "23"},
+        ]}})
+        zone = devices.heater_zone("1")
+        assert zone.is_on is True
+        assert zone.current_temp == 21.5
+        assert zone.setting_temp == 23.0
+
+    async def test_poll_rebuilds_light_zones(self, coordinator):
+        coordinator.client.async_status_snapshot = AsyncMock(
+            return_value={"body": {"contents": [{"number": "2", "onoff": "0", "title": "거실2"}]}}
+        )
+        await coordinator.devices._async_update_data()
+        zone = coordinator.devices.light_zone("2")
+        assert zone.is_on is False
+        assert zone.title == "거실2"
+
+    async def test_unchanged_status_keeps_zone_index(self, coordinator):
+        devices = coordinator.devices
+        frame = {"body": {"contents": [{"number": 1, "onoff": "1", "current_temp": "21.5"}]}}
+        devices._handle_push("22", frame)
+        zones = devices.heater_zones
+        devices._handle_push("22", frame)
+        assert devices.heater_zones is zones
+        devices._handle_push("22", {"body": {"contents": [{"number": 1, "onoff": "0"}]}})
+        assert devices.heater_zones is not zones
+        assert devices.heater_zone("1").is_on is False
+
+    def test_bad_values_parse_to_none(self):
+        from cvnet.core.zones import parse_heater_zones
+        zones = parse_heater_zones({"body": {"contents": [{"number": "3", "current_temp": "--"}]}})
+        assert zones["3"].current_temp is None
+        assert parse_heater_zones({}) == {}
+
+
+class TestConcurrentRefresh:
+    async def test_sources_run_concurrently(self, coordinator):
+        """Visitor fetch waits on the car fetch; sequential execution would deadlock."""
+        import asyncio
+        car_started = asyncio.Event()
+
+        async def visitors(**kwargs):
+            await asyncio.wait_for(car_started.wait(), timeout=1)
+            return [{"file_name": "a.jpg"}]
+
+        async def cars(**kwargs):
+            car_started.set()
+            return {"contents": [], "exist_next": False, "page_no": "1", "rows": "5"}
+
+        coordinator.client.async_visitor_list = AsyncMock(side_effect=visitors)
+        coordinator.client.async_entrancecar_list = AsyncMock(side_effect=cars)
+        data = await coordinator._async_update_data()
+        assert data["vis"]["contents"] == [{"file_name": "a.jpg"}]
+
+    async def test_slow_source_times_out_without_blocking_others(self, coordinator):
+        import asyncio
+
+        async def hang():
+            await asyncio.sleep(10)
+
+        coordinator.client.async_entrancecar_list = AsyncMock(side_effect=hang)
+        coordinator.client.async_visitor_list = AsyncMock(return_value=[{"file_name": "a.jpg"}])
+        with patch("cvnet.core.coordinator.HTTP_SOURCE_TIMEOUT_S", 0.05):
+            data = await coordinator._async_update_data()
+        assert data["car"]["contents"] == []
+        assert data["vis"]["contents"] == [{"file_name": "a.jpg"}]
+
+
+class TestSplitSources:
+    async def test_hub_cycle_skips_device_and_meter_sources(self, coordinator):
+        data = await coordinator._async_update_data()
+        coordinator.client.async_status_snapshot.assert_not_called()
+        coordinator.client.async_telemetering.assert_not_called()
+        assert "heaters" not in data and "telemeter" not in data
+
+    async def test_sources_share_the_hub_client(self, coordinator):
+        assert coordinator.devices.client is coordinator.client
+        assert coordinator.telemeter.client is coordinator.client
+
+    async def test_telemeter_keeps_last_reading_on_failure(self, coordinator):
+        telemeter = coordinator.telemeter
+        coordinator.client.async_telemetering = AsyncMock(return_value={"electric": "12.5"})
+        telemeter.data = await telemeter._async_update_data()
+        coordinator.client.async_telemetering = AsyncMock(side_effect=ApiError("boom"))
+        data = await telemeter._async_update_data()
+        assert data["telemeter"] == {"electric": "12.5"}
+
+    async def test_sources_log_in_once(self, coordinator):
+        import asyncio
+        coordinator.client.has_credentials = False
+
+        async def login(*args):
+            await asyncio.sleep(0)
+            coordinator.client.has_credentials = True
+
+        coordinator.client.async_login = AsyncMock(side_effect=login)
+        await asyncio.gather(
+            coordinator._async_update_data(),
+            coordinator.devices._async_update_data(),
+            coordinator.telemeter._async_update_data(),
+        )
+        assert coordinator.client.async_login.await_count == 1
+
+
+class TestChangeDetection:
+    def test_unchanged_data_skips_notification(self, coordinator):
+        coordinator.data = {"vis": {"contents": [{"file_name": "a.jpg"}]}, "car": {"contents": []}}
+        coordinator.async_update_listeners()
+        coordinator.data = {"car": {"contents": []}, "vis": {"contents": [{"file_name": "a.jpg"}]}}
+        coordinator.async_update_listeners()
+        assert coordinator._skipped_updates == 1
+
+    def test_only_changed_source_is_flagged(self, coordinator):
+        coordinator.data = {"vis": {"contents": []}, "car": {"contents": []}}
+        coordinator.async_update_listeners()
+        assert coordinator.source_changed("car")
+        coordinator.data = {"vis": {"contents": []}, "car": {"contents": [{"title": "12가3456"}]}}
+        coordinator.async_update_listeners()
+        assert coordinator.source_changed("car")
+        assert not coordinator.source_changed("vis", "selected")
+
+    def test_invalidated_source_notifies_again(self, coordinator):
+        coordinator.data = {"vis": {"contents": []}}
+        coordinator.async_update_listeners()
+        coordinator.invalidate_source("vis")
+        coordinator.async_update_listeners()
+        assert coordinator._skipped_updates == 0
+        assert coordinator.source_changed("vis")
+
+    def test_availability_change_flags_every_source(self, coordinator):
+        coordinator.data = {"vis": {}}
+        coordinator.last_update_success = True
+        coordinator.async_update_listeners()
+        coordinator.last_update_success = False
+        coordinator.async_update_listeners()
+        assert coordinator._skipped_updates == 0
+        assert coordinator.source_changed("vis")
+
+
+class TestHistoryStore:
+    def _store(self, mock_hass, tmp_path):
+        from cvnet.core.history import HistoryStore
+        return HistoryStore(mock_hass, str(tmp_path / "cvnet" / "history.db"))
+
+    async def test_rows_written_in_one_batch(self, mock_hass, tmp_path):
+        store = self._store(mock_hass, tmp_path)
+        store.add_car_entries([
+            {"title": "12가3456", "date_time": "2025-01-01 10:00", "inout": "0"},
+            {"title": "78나9012", "date_time": "2025-01-01 11:00", "inout": "1"},
+        ])
+        store.add_visitors([{"file_name": "a.jpg", "date_time": "2025-01-01 09:00", "title": "t"}])
+        await store.async_flush()
+        assert mock_hass.async_add_executor_job.await_count == 1
+        cars = await store.async_car_entries()
+        assert [c["title"] for c in cars] == ["78나9012", "12가3456"]
+        assert (await store.async_visitor("a.jpg"))["date_time"] == "2025-01-01 09:00"
+        await store.async_close()
+
+    async def test_reseen_rows_not_queued_again(self, mock_hass, tmp_path):
+        store = self._store(mock_hass, tmp_path)
+        entry = {"title": "12가3456", "date_time": "2025-01-01 10:00", "inout": "0"}
+        store.add_car_entries([entry])
+        await store.async_flush()
+        store.add_car_entries([entry])
+        assert store._pending_cars == []
+        await store.async_close()
+
+    async def test_filters_use_time_plate_and_direction(self, mock_hass, tmp_path):
+        store = self._store(mock_hass, tmp_path)
+        store.add_car_entries([
+            {"title": "12가3456", "date_time": "2025-01-01 10:00", "inout": "0"},
+            {"title": "12가3456", "date_time": "2025-01-02 10:00", "inout": "1"},
+            {"title": "34다5678", "date_time": "2025-01-02 11:00", "inout": "0"},
+        ])
+        await store.async_flush()
+        rows = await store.async_car_entries(start="2025-01-02", plate_ranges=[("12", "13")])
+        assert [(r["date_time"], r["inout"]) for r in rows] == [("2025-01-02 10:00", "1")]
+        rows = await store.async_car_entries(direction="0")
+        assert len(rows) == 2
+        plan = store._query("EXPLAIN QUERY PLAN SELECT * FROM car_entries WHERE plate >= ? AND plate < ?", ("12", "13"))
+        assert any("car_entries_plate" in str(row.get("detail")) for row in plan)
+        await store.async_close()
+
+
+class TestCarSearch:
+    def _search(self, mock_hass, tmp_path, pages):
+        from cvnet.core.history import HistoryStore
+        from cvnet.core.car_search import CarEntrySearch
+        fetch = AsyncMock(side_effect=lambda page_no: pages[page_no - 1])
+        history = HistoryStore(mock_hass, str(tmp_path / "history.db"))
+        return CarEntrySearch(history, fetch, max_pages=6, concurrency=2), fetch
+
+    def test_prefix_ranges_are_hangul_aware(self):
+        from cvnet.core.car_search import plate_ranges
+
+        def matches(query, plate, exact=False):
+            return any(low <= plate < high for low, high in plate_ranges(query, exact))
+
+        assert matches("14ㄹ", "14러1706")
+        assert matches("14러", "14러1706")
+        assert matches("14 러17", "14러1706")
+        assert matches("14\u1105\u1165", "14러1706")  # decomposed input
+        assert not matches("14ㄴ", "14러1706")
+        assert matches("14러1706", "14러1706", exact=True)
+        assert not matches("14러170", "14러1706", exact=True)
+
+    async def test_covered_range_is_answered_locally(self, mock_hass, tmp_path):
+        search, fetch = self._search(mock_hass, tmp_path, [])
+        entries = [{"title": "14러1706", "date_time": "2025-08-09 17:55", "inout": "0"},
+                   {"title": "21가3456", "date_time": "2025-08-08 08:00", "inout": "1"}]
+        search.history.add_car_entries(entries)
+        search.note_collected(entries)
+        result = await search.async_search(plate="14ㄹ", start="2025-08-09 00:00")
+        fetch.assert_not_awaited()
+        assert result["server_pages"] == 0
+        assert [e["direction"] for e in result["entries"]] == ["entered"]
+        await search.history.async_close()
+
+    async def test_uncovered_range_pages_server_until_start(self, mock_hass, tmp_path):
+        pages = [
+            _car_page([{"title": "14러1706", "date_time": f"2025-08-0{9 - n} 10:00", "inout": str(n % 2)}], exist_next=True)
+            for n in range(6)
+        ]
+        search, fetch = self._search(mock_hass, tmp_path, pages)
+        result = await search.async_search(plate="14러1706", exact=True, start="2025-08-06 12:00")
+        # Two windows of two pages reach 2025-08-06 10:00, older than the start
+        assert fetch.await_count == 4
+        assert [e["date_time"] for e in result["entries"]] == ["2025-08-09 10:00", "2025-08-08 10:00", "2025-08-07 10:00"]
+        assert result["complete"] is True
+        fetch.reset_mock()
+        await search.async_search(plate="14러", direction="exited", start="2025-08-07 00:00")
+        fetch.assert_not_awaited()
+        await search.history.async_close()
+
+
+    async def test_backfill_resumes_and_capped_search_is_answered_locally(self, mock_hass, tmp_path):
+        pages = [
+            _car_page([{"title": "14러1706", "date_time": f"2025-08-{20 - n:02d} 10:00", "inout": "0"}], exist_next=True)
+            for n in range(12)
+        ]
+        search, fetch = self._search(mock_hass, tmp_path, pages)
+        first = await search.async_search(plate="99나")
+        assert fetch.await_count == 6
+        assert first["complete"] is False
+        # The same search again was already explored up to the page cap
+        fetch.reset_mock()
+        await search.async_search(plate="99나")
+        fetch.assert_not_awaited()
+        # A search reaching further back continues after the pages already read
+        await search.async_search(plate="14러", start="2025-08-12 00:00")
+        assert [c.args[0] for c in fetch.await_args_list] == [7, 8, 9, 10]
+        await search.history.async_close()
+
+    async def test_error_page_does_not_mark_feed_covered(self, mock_hass, tmp_path):
+        pages = [
+            _car_page([{"title": "14러1706", "date_time": "2025-08-09 10:00", "inout": "0"}], exist_next=True),
+            {"result": 0, "contents": [], "exist_next": False, "page_no": "2", "rows": "50"},
+        ]
+        search, fetch = self._search(mock_hass, tmp_path, pages)
+        result = await search.async_search(plate="14러")
+        assert result["complete"] is False
+        assert search.covered_from is None
+        fetch.reset_mock()
+        await search.async_search(plate="14러")
+        assert fetch.await_count == 2
+        await search.history.async_close()
+
+class TestImageStore:
+    def _store(self, mock_hass, tmp_path, max_bytes):
+        from cvnet.core.image_store import VisitorImageStore
+        return VisitorImageStore(mock_hass, str(tmp_path / "visitor_images"), max_bytes)
+
+    def test_write_then_read(self, mock_hass, tmp_path):
+        store = self._store(mock_hass, tmp_path, 1024)
+        store.write("2024/01/a.jpg", b"jpeg")
+        assert store.read("2024/01/a.jpg") == b"jpeg"
+        assert store.read("missing.jpg") is None
+
+    def test_oldest_evicted_over_cap(self, mock_hass, tmp_path):
+        import os
+        store = self._store(mock_hass, tmp_path, 10)
+        store.write("old.jpg", b"12345")
+        path = store._path(store._key("old.jpg"))
+        os.utime(path, (1, 1))
+        store._index[store._key("old.jpg")] = (1, 5)
+        store.write("mid.jpg", b"12345")
+        store.write("new.jpg", b"12345")
+        assert store.read("old.jpg") is None
+        assert store.read("mid.jpg") == b"12345"
+        assert store.read("new.jpg") == b"12345"
+
+    def test_index_rebuilt_from_disk(self, mock_hass, tmp_path):
+        store = self._store(mock_hass, tmp_path, 10)
+        store.write("a.jpg", b"123456")
+        reopened = self._store(mock_hass, tmp_path, 10)
+        reopened.write("b.jpg", b"123456")
+        assert reopened.read("a.jpg") is None
+        assert reopened.read("b.jpg") == b"123456"
+
+    def test_zero_cap_disables_store(self, mock_hass, tmp_path):
+        store = self._store(mock_hass, tmp_path, 0)
+        assert not store.enabled
+
+
+class TestResizeJpeg:
+    def _jpeg(self, size):
+        Image = pytest.importorskip("PIL.Image")
+        import io
+        out = io.BytesIO()
+        Image.new("RGB", size, (200, 10, 10)).save(out, "JPEG")
+        return out.getvalue()
+
+    def test_downscales_keeping_aspect_ratio(self):
+        import io
+        Image = pytest.importorskip("PIL.Image")
+        from cvnet.core.images import resize_jpeg
+        small = resize_jpeg(self._jpeg((640, 480)), 320, None)
+        with Image.open(io.BytesIO(small)) as img:
+            assert img.size == (320, 240)
+
+    def test_small_image_returned_unchanged(self):
+        from cvnet.core.images import resize_jpeg
+        data = self._jpeg((100, 80))
+        assert resize_jpeg(data, 320, 240) is data
+
+    def test_unreadable_data_returned_unchanged(self):
+        from cvnet.core.images import resize_jpeg
+        assert resize_jpeg(b"not a jpeg", 10, 10) == b"not a jpeg"
+
 
 class TestSessionInfo:
     def test_get_session_info(self, coordinator):
@@ -217,3 +780,9 @@ class TestSessionInfo:
         assert info["has_credentials"] is True
         assert info["is_connected"] is False
         assert info["session_expired"] is True
+
+    async def test_cycle_overrun_counted(self, coordinator):
+        coordinator._record_cycle(coordinator.update_interval.total_seconds() + 1)
+        coordinator._record_cycle(1.0)
+        assert coordinator._cycle_overruns == 1
+        assert coordinator._last_cycle_seconds == 1.0